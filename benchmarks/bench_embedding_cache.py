@@ -0,0 +1,90 @@
+"""Micro-benchmark: embedding requests with and without the client-side embedding cache.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_embedding_cache --texts 2000 --unique 400 --latency-ms 5 --workers 8
+
+Embeds ``--texts`` synthetic exhibitor descriptions drawn from ``--unique``
+distinct ones (some differing only in whitespace) against the stub vector API
+(benchmarks.stub_vector_api), three ways:
+
+  per-text   get_embedding for every text, no cache (the previous behaviour)
+  cold       get_embeddings with an empty cache: duplicates are sent once, concurrently
+  warm       get_embeddings again with the now-filled cache: no requests at all
+
+Vectors from every run must match the per-text ones (to float32 precision).
+``--max-mb`` bounds the cache; set it below the working set to see evictions.
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks import stub_vector_api
+
+os.environ.setdefault("UPLOAD_SERVICE_USERNAME", "benchmark")
+os.environ.setdefault("UPLOAD_SERVICE_PASSWORD", "benchmark")
+from src.dotnet.VectorEmbeddingService.embedding_cache import EmbeddingCache  # noqa: E402
+from src.dotnet.VectorEmbeddingService.vector_api_client import VectorApiClient  # noqa: E402
+
+
+def texts(count: int, unique: int, seed: int = 42) -> list[str]:
+    rng = random.Random(seed)
+    descriptions = [f"Exhibitor {i} shows flooring, tiles and parquet at stand {i % 90}." for i in range(unique)]
+    picked = [rng.choice(descriptions) for _ in range(count)]
+    # Re-flowed copies must hit the same cache entry
+    return [text.replace(" ", "  ", 1) if rng.random() < 0.1 else text for text in picked]
+
+
+def close_enough(a, b) -> bool:
+    return a is not None and b is not None and len(a) == len(b) and all(abs(x - y) < 1e-6 for x, y in zip(a, b))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--texts", type=int, default=2000)
+    parser.add_argument("--unique", type=int, default=400)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--max-mb", type=float, default=64.0)
+    args = parser.parse_args()
+
+    sample = texts(args.texts, args.unique)
+    server, api = stub_vector_api.serve(args.latency_ms)
+    try:
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = EmbeddingCache(str(Path(tmp) / "embeddings.sqlite"), max_bytes=int(args.max_mb * 1024 * 1024))
+            plain = VectorApiClient(base_url)
+            cached = VectorApiClient(base_url, embedding_cache=cache)
+
+            print(f"{'run':>8} {'seconds':>8} {'texts/s':>8} {'requests':>9} {'hit ratio':>10} {'MB stored':>10}")
+            runs = (
+                ("per-text", lambda: [plain.get_embedding(text) for text in sample]),
+                ("cold", lambda: cached.get_embeddings(sample, workers=args.workers)),
+                ("warm", lambda: cached.get_embeddings(sample, workers=args.workers)),
+            )
+            reference = None
+            for name, run in runs:
+                requests_before = api.embedded
+                hits_before, misses_before = cache.hits, cache.misses
+                start = time.perf_counter()
+                vectors = run()
+                elapsed = time.perf_counter() - start
+                if reference is None:
+                    reference = vectors
+                assert all(close_enough(a, b) for a, b in zip(reference, vectors)), f"{name}: vectors differ"
+                lookups = cache.hits - hits_before + cache.misses - misses_before
+                ratio = (cache.hits - hits_before) / lookups if lookups else 0.0
+                stats = cache.stats()
+                print(f"{name:>8} {elapsed:>8.2f} {len(sample) / elapsed:>8.0f} {api.embedded - requests_before:>9} "
+                      f"{ratio:>10.2f} {stats['bytes_stored'] / 1024 / 1024:>10.2f}")
+            print(f"cache: {stats['entries']} entries, {stats['evictions']} evictions, overall hit ratio {stats['hit_ratio']:.2f}")
+            cache.close()
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""Micro-benchmark: link extraction and filtering, legacy spider code vs. LinkExtractor.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_link_extraction --pages 200 --anchors 500 2000 5000
+
+Simulates a crawl over ``pages`` pages of one site. Every page carries
+``anchors`` links: a navigation menu and footer shared by all pages (in EN, NL
+and FR), links to other pages and links to exhibitor detail pages. Per page
+both variants resolve the hrefs, keep the on-site links and select what to
+schedule against a crawl-global frontier and language index, exactly as
+EventSiteSpider.parse does. The scheduled links of both variants must match.
+"""
+import argparse
+import hashlib
+import random
+import re
+import time
+from urllib.parse import urljoin, urlparse, urlsplit
+
+from src.python.scraper.frontier import UrlFrontier, canonicalize_url, url_fingerprint
+from src.python.scraper.language_index import LanguageVariantIndex, path_language, strip_language, variant_key
+from src.python.scraper.link_extractor import LinkExtractor
+
+SITE = "https://www.example-expo.com"
+LANGS = ("en", "nl", "fr")
+
+
+# ----------------------------------------------------------------------
+# Legacy implementation (EventSiteSpider before LinkExtractor)
+# ----------------------------------------------------------------------
+LANG_SEGMENT_RE = re.compile(r"^([a-z]{2})(?:[-_][a-z]{2})?$", re.IGNORECASE)
+
+
+def legacy_path_language(path):
+    first_segment = path.strip("/").split("/", 1)[0]
+    match = LANG_SEGMENT_RE.match(first_segment)
+    if match and match.group(1).lower() in ("en", "nl", "fr", "de"):
+        return first_segment.lower()
+    return None
+
+
+def legacy_variant_key(url):
+    parts = urlsplit(url)
+    query_part = ("?" + parts.query) if parts.query else ""
+    lang = legacy_path_language(parts.path)
+    if lang is None:
+        return parts.path + query_part, 1
+    base_key = "/" + "/".join(parts.path.strip("/").split("/")[1:]) + query_part
+    return base_key, (0 if re.split(r"[-_]", lang, maxsplit=1)[0] == "en" else None)
+
+
+def legacy_fingerprint(url):
+    return int.from_bytes(hashlib.blake2b(canonicalize_url(url).encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class LegacyCrawlState:
+    def __init__(self, netloc):
+        self.netloc = netloc
+        self.scheduled = set()
+        self.chosen = {}
+
+    def extract(self, page_url, hrefs):
+        links = []
+        for href in hrefs:
+            full_url = urljoin(page_url, href)
+            parsed_url = urlparse(full_url)
+            if parsed_url.path.lower().endswith(".pdf"):
+                continue
+            if parsed_url.scheme in {"http", "https"} and parsed_url.netloc == self.netloc:
+                links.append(full_url)
+        return sorted(list(set(links)))
+
+    def offer(self, url):
+        base_key, rank = legacy_variant_key(url)
+        if rank is None:
+            return False
+        current = self.chosen.get(base_key)
+        if current is None or rank < current[0]:
+            self.chosen[base_key] = (rank, url)
+            return True
+        return False
+
+    def follow(self, links):
+        selected = []
+        for url in sorted(links, key=lambda link: legacy_variant_key(link)[1] != 0):
+            if legacy_fingerprint(url) in self.scheduled:
+                continue
+            if self.offer(url):
+                selected.append(url)
+        scheduled = []
+        for url in selected:
+            fp = legacy_fingerprint(url)
+            if fp not in self.scheduled:
+                self.scheduled.add(fp)
+                scheduled.append(url)
+        return scheduled
+
+
+class NewCrawlState:
+    def __init__(self, netloc):
+        self.frontier = UrlFrontier()
+        self.links = LinkExtractor(self.frontier, LanguageVariantIndex(), netloc)
+
+    def extract(self, page_url, hrefs):
+        return self.links.extract(page_url, hrefs)
+
+    def follow(self, links):
+        return [url for url in self.links.select(links) if self.frontier.schedule(url)]
+
+
+# ----------------------------------------------------------------------
+def site_pages(pages: int, anchors: int, seed: int = 42) -> list[tuple[str, list[str]]]:
+    rng = random.Random(seed)
+    nav = [f"/{lang}/{section}" for lang in LANGS for section in
+           ("", "exhibitors", "program", "tickets", "practical", "press", "contact", "news")]
+    nav += ["/privacy", "/cookies", "/brochure.pdf", "https://www.facebook.com/expo", "mailto:info@example.com"]
+    result = []
+    for page in range(pages):
+        lang = LANGS[page % len(LANGS)]
+        hrefs = list(nav) * 2  # menu plus footer
+        while len(hrefs) < anchors:
+            kind = rng.random()
+            if kind < 0.5:
+                hrefs.append(f"/{rng.choice(LANGS)}/exhibitor/{rng.randrange(anchors * 2)}")
+            elif kind < 0.8:
+                hrefs.append(f"{SITE}/{rng.choice(LANGS)}/page/{rng.randrange(pages * 5)}?utm_source=nav")
+            else:
+                hrefs.append(f"../page/{rng.randrange(pages * 5)}")
+        result.append((f"{SITE}/{lang}/page/{page}", hrefs[:anchors]))
+    return result
+
+
+def run(state_class, pages) -> tuple[float, list[list[str]]]:
+    # Start every run cold: the memoized helpers are module-level
+    for cached in (url_fingerprint, path_language, strip_language, variant_key):
+        cached.cache_clear()
+    state = state_class(urlsplit(SITE).netloc)
+    scheduled = []
+    start = time.perf_counter()
+    for page_url, hrefs in pages:
+        scheduled.append(state.follow(state.extract(page_url, hrefs)))
+    return time.perf_counter() - start, scheduled
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--anchors", type=int, nargs="+", default=[500, 2000, 5000])
+    args = parser.parse_args()
+
+    print(f"{'anchors/page':>12} {'pages':>6} {'legacy s':>9} {'new s':>8} {'speed-up':>9} {'scheduled':>10}")
+    for anchors in args.anchors:
+        pages = site_pages(args.pages, anchors)
+        legacy_time, legacy_scheduled = run(LegacyCrawlState, pages)
+        new_time, new_scheduled = run(NewCrawlState, pages)
+        assert legacy_scheduled == new_scheduled, f"{anchors} anchors: scheduled links differ"
+        total = sum(len(links) for links in new_scheduled)
+        print(f"{anchors:>12} {args.pages:>6} {legacy_time:>9.2f} {new_time:>8.2f} "
+              f"{legacy_time / new_time:>8.1f}x {total:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Micro-benchmark: clean_json string cleaning, legacy recursive functions vs. TextNormalizer.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_normalizer --records 2000 --repeat 5
+
+The "legacy" variants are the functions clean_json used before: a regex
+whitespace collapse, strip and an ASCII encode/decode round trip per string,
+rebuilding every dict and list. Throughput is reported in MB of JSON input per
+second; each run gets a fresh copy of the records because the normalizer works
+in place.
+"""
+import argparse
+import copy
+import json
+import re
+import statistics
+import time
+
+from benchmarks.synthetic import exhibitor_rows
+from src.python.utils.text_normalizer import TextNormalizer
+
+SAMPLE_TEXT = (
+    "Welkom op Flanders Flooring Days!\n\n  Ontdek de nieuwste trends in   parket, tegels en vinyl.\t"
+    "Découvrez nos exposants – Café “De Hoek”, Brasserie Étoile, Müller Böden GmbH… "
+    "Stand: 142   Booth: 143\r\n"
+)
+
+
+def legacy_collapse(obj):
+    if isinstance(obj, str):
+        obj = re.sub(r"\s+", " ", obj).strip()
+        obj = obj.encode("ascii", "ignore").decode("utf-8")
+        return obj
+    if isinstance(obj, list):
+        return [legacy_collapse(i) for i in obj]
+    if isinstance(obj, dict):
+        return {k: legacy_collapse(v) for k, v in obj.items()}
+    return obj
+
+
+def synthetic_records(count: int) -> list[dict]:
+    records = []
+    for i in range(count):
+        records.append({
+            "event_id": "ffd",
+            "url": f"https://www.flandersflooringdays.com/en/exhibitors/{i}",
+            "title": f"Exposant n°{i} – Ébéniste & Zoon",
+            "description": "Parquet,   carrelage\net vinyle",
+            "raw_text_content": SAMPLE_TEXT * (1 + i % 20),
+            "exhibitors": exhibitor_rows(5, seed=i),
+        })
+    return records
+
+
+def _time(func, records: list[dict], repeat: int) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        data = copy.deepcopy(records)
+        start = time.perf_counter()
+        func(data)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    records = synthetic_records(args.records)
+    megabytes = len(json.dumps(records, ensure_ascii=False).encode("utf-8")) / 1e6
+    normalizer = TextNormalizer(collapse=True, fold=True)
+    collapse_only = TextNormalizer(collapse=True, fold=False)
+
+    variants = [
+        ("legacy collapse + drop", legacy_collapse),
+        ("normalizer collapse + fold", normalizer.normalize_tree),
+        ("normalizer collapse only", collapse_only.normalize_tree),
+    ]
+    print(f"{args.records} records, {megabytes:.1f} MB of JSON")
+    print(f"{'variant':<28} {'ms':>9} {'MB/s':>8}")
+    for name, func in variants:
+        seconds = statistics.median(_time(func, records, args.repeat))
+        print(f"{name:<28} {seconds * 1000:>9.1f} {megabytes / seconds:>8.1f}")
+
+    print(f"\nlegacy: {legacy_collapse(SAMPLE_TEXT)[:90]}")
+    print(f"fold:   {normalizer(SAMPLE_TEXT)[:90]}")
+
+
+if __name__ == "__main__":
+    main()
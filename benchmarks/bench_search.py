@@ -0,0 +1,103 @@
+"""Micro-benchmark: replaying a chatbot query log with and without search_many and the search cache.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_search --queries 2000 --unique 300 --latency-ms 20 --workers 8
+
+Replays ``--queries`` queries drawn from ``--unique`` distinct ones (some
+differing only in case or whitespace) against the stub vector API
+(benchmarks.stub_vector_api), three ways:
+
+  per-query   search_events for every query, no cache (the previous behaviour)
+  cold        search_many with an empty cache: duplicates are sent once, concurrently
+  warm        search_many again: answered from the cache
+
+Results must match the per-query ones. An upload to the container afterwards
+must invalidate the cache, so the next replay sees the new document.
+"""
+import argparse
+import os
+import random
+import time
+
+from benchmarks import stub_vector_api
+
+os.environ.setdefault("UPLOAD_SERVICE_USERNAME", "benchmark")
+os.environ.setdefault("UPLOAD_SERVICE_PASSWORD", "benchmark")
+from src.dotnet.VectorEmbeddingService.search_cache import SearchCache  # noqa: E402
+from src.dotnet.VectorEmbeddingService.vector_api_client import VectorApiClient  # noqa: E402
+
+TOPICS = ["flooring", "parquet", "tiles", "carpet", "vinyl", "laminate", "stone", "wood", "rugs", "cork"]
+
+
+def query_log(count: int, unique: int, seed: int = 42) -> list[str]:
+    rng = random.Random(seed)
+    distinct = [f"which exhibitors sell {TOPICS[i % len(TOPICS)]} {TOPICS[(i // len(TOPICS)) % len(TOPICS)]} {i}"
+                for i in range(unique)]
+    log = []
+    for _ in range(count):
+        query = rng.choice(distinct)
+        variant = rng.random()
+        if variant < 0.1:
+            query = query.upper()
+        elif variant < 0.2:
+            query = "  " + query.replace(" ", "   ", 1)
+        log.append(query)
+    return log
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--unique", type=int, default=300)
+    parser.add_argument("--documents", type=int, default=500)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    log = query_log(args.queries, args.unique)
+    server, api = stub_vector_api.serve()
+    try:
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        plain = VectorApiClient(base_url)
+        cache = SearchCache(ttl=600)
+        cached = VectorApiClient(base_url, search_cache=cache)
+        plain.bulk_upload_events([
+            {"url": f"https://www.example-expo.com/en/exhibitor/{i}", "title": f"Exhibitor {i}",
+             "raw_text_content": f"{TOPICS[i % len(TOPICS)]} {TOPICS[i % 7]} {i}"}
+            for i in range(args.documents)
+        ])
+        api.latency_ms = args.latency_ms  # searches only: the setup upload above is free
+
+        print(f"{'run':>9} {'seconds':>8} {'queries/s':>10} {'requests':>9} {'hit ratio':>10}")
+        runs = (
+            ("per-query", lambda: [plain.search_events(query) for query in log]),
+            ("cold", lambda: cached.search_many(log, workers=args.workers)),
+            ("warm", lambda: cached.search_many(log, workers=args.workers)),
+        )
+        reference = None
+        for name, run in runs:
+            requests_before = api.searched
+            hits_before, misses_before = cache.hits, cache.misses
+            start = time.perf_counter()
+            results = run()
+            elapsed = time.perf_counter() - start
+            if reference is None:
+                reference = results
+            assert results == reference, f"{name}: results differ"
+            lookups = cache.hits - hits_before + cache.misses - misses_before
+            ratio = (cache.hits - hits_before) / lookups if lookups else 0.0
+            print(f"{name:>9} {elapsed:>8.2f} {len(log) / elapsed:>10.0f} {api.searched - requests_before:>9} {ratio:>10.2f}")
+
+        # An upload by the caching client must make its cached results stale
+        api.latency_ms = 0
+        cached.bulk_upload_events([{"url": "https://www.example-expo.com/en/exhibitor/new",
+                                    "title": "New exhibitor", "raw_text_content": log[0].lower()}])
+        fresh = cached.search_events(log[0])
+        assert any(event.get("title") == "New exhibitor" for event in fresh), "cache was not invalidated by the upload"
+        print(f"cache: {cache.stats()}")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
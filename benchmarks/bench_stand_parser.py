@@ -0,0 +1,180 @@
+"""Micro-benchmark: stand number parsing, legacy regexes vs. the stand_parser state machine.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_stand_parser --rows 1000 10000 --repeat 3
+
+Three inputs per size:
+  • regular   – well-formed exhibitor text (Artisan table / FFD cards)
+  • no-match  – one long line that never completes a row or a booth label,
+                the worst case for the lazy quantifiers of the legacy patterns
+  • huge card – a single "Read more" chunk holding all exhibitors
+
+The regular inputs and --parity-samples random pages (multi-word names and
+cities, odd characters and whitespace) are a parity check: both parsers must
+return exactly the same mapping. Legacy runs happen in a child process that is killed after
+--legacy-budget seconds, since their run time explodes on the adversarial inputs.
+"""
+import argparse
+import multiprocessing
+import random
+import re
+import statistics
+import time
+
+from benchmarks.synthetic import exhibitor_rows
+from src.python.utils.stand_parser import CardLayout, TableLayout, parse_cards, parse_table
+
+
+# ----------------------------------------------------------------------
+# Legacy implementations (clean_json before the stand_parser module)
+# ----------------------------------------------------------------------
+def legacy_artisan(raw: str) -> dict:
+    mapping = {}
+    parts = raw.split("Company City Country Booth", 1)
+    if len(parts) < 2:
+        return mapping
+    pattern = re.compile(r'([A-Za-z0-9&%\'\-\.\(\) ]+?)\s+[A-Za-z\(\) \-]+?\s+[A-Z]{2}\s+([0-9A-Za-z;]+)')
+    for m in pattern.finditer(parts[1]):
+        mapping[m.group(1).strip()] = m.group(2).strip()
+    return mapping
+
+
+def legacy_ffd(raw: str) -> dict:
+    mapping = {}
+    for chunk in raw.split("Read more"):
+        token = chunk.strip()
+        if not token:
+            continue
+        m = re.search(r'([^\n\r]+?)\s+Booth:\s*(\d+)', token)
+        if m:
+            mapping[re.sub(r'^View results\s+', '', m.group(1).strip())] = m.group(2).strip()
+            continue
+        m2 = re.search(r'([^\n\r]+?)\s+Showroom on location', token)
+        if m2:
+            mapping[re.sub(r'^View results\s+', '', m2.group(1).strip())] = "Showroom on location"
+    return mapping
+
+
+# ----------------------------------------------------------------------
+# Inputs
+# ----------------------------------------------------------------------
+def artisan_text(rows: int) -> str:
+    body = " ".join(
+        f"{row['name']} {row['city']} {row['country']} {row['booth']}"
+        for row in exhibitor_rows(rows)
+    )
+    return "Exhibitors Company City Country Booth " + body
+
+
+def ffd_text(rows: int) -> str:
+    cards = []
+    for i, row in enumerate(exhibitor_rows(rows)):
+        location = "Showroom on location" if i % 7 == 0 else f"Booth: {row['booth']}"
+        cards.append(f"{row['name']} {row['city']} {location}")
+    return "View results " + " Read more ".join(cards) + " Read more"
+
+
+def adversarial_artisan(rows: int) -> str:
+    # Words and two-letter tokens that never get followed by a booth-like token
+    return "Company City Country Booth " + " ".join("Parket Kortrijk BE -" for _ in range(rows))
+
+
+def adversarial_ffd(rows: int) -> str:
+    # One card, one line, no label: every start position scans to the end
+    return " ".join(f"Floorex Booth {i} Showroom on" for i in range(rows))
+
+
+def huge_card(rows: int) -> str:
+    return " ".join(f"{row['name']} {row['city']}" for row in exhibitor_rows(rows)) + " Booth: 12 Read more"
+
+
+# Words, labels and whitespace the random parity pages are built from
+RANDOM_WORDS = ["Parket & Co", "Floorex 3", "O'Brien", "Dr. Floor", "100%", "(BE)", "Müller", "a/b", "Sint Niklaas",
+                "Aix-en-Provence", "BE", "FR", "be", "12", "A12", "3;4", "7,", "12(BE)", "Booth:", "Booth: 12",
+                "Booth:\n5", "Showroom on location", "Read more", "View results", "-", ""]
+RANDOM_SPACES = [" ", " ", " ", "  ", "\n", " \n ", "\t", "   "]
+
+
+def random_page(rng: random.Random) -> str:
+    parts = [rng.choice(["Company City Country Booth", "View results", ""])]
+    for _ in range(rng.randint(1, 30)):
+        parts += [rng.choice(RANDOM_SPACES), rng.choice(RANDOM_WORDS)]
+    return "".join(parts)
+
+
+def new_artisan(text: str) -> dict:
+    return parse_table(text, TableLayout())
+
+
+def new_ffd(text: str) -> dict:
+    return parse_cards(text, CardLayout())
+
+
+# ----------------------------------------------------------------------
+def _time(func, text: str, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def _time_in_child(func, text: str, repeat: int, results) -> None:
+    results.put(_time(func, text, repeat))
+
+
+def _time_with_budget(func, text: str, repeat: int, budget: float) -> float | None:
+    """Median run time, or None when ``repeat`` runs do not finish within ``budget`` seconds."""
+    results = multiprocessing.Queue()
+    child = multiprocessing.Process(target=_time_in_child, args=(func, text, repeat, results))
+    child.start()
+    child.join(budget)
+    if child.is_alive():
+        child.terminate()
+        child.join()
+        return None
+    return results.get()
+
+
+def _fmt(seconds: float | None) -> str:
+    return f"{seconds * 1000:>11.2f}" if seconds is not None else f"{'> budget':>11}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--legacy-budget", type=float, default=10.0)
+    parser.add_argument("--parity-samples", type=int, default=3000)
+    args = parser.parse_args()
+
+    for rows in (100, 1000):
+        for legacy, new, make in ((legacy_artisan, new_artisan, artisan_text), (legacy_ffd, new_ffd, ffd_text)):
+            text = make(rows)
+            assert legacy(text) == new(text), f"{make.__name__}({rows}): parsers disagree"
+    rng = random.Random(42)
+    for sample in range(args.parity_samples):
+        text = random_page(rng)
+        for legacy, new in ((legacy_artisan, new_artisan), (legacy_ffd, new_ffd)):
+            assert legacy(text) == new(text), f"random page {sample}: parsers disagree on {text!r}"
+    print(f"parity: legacy and stand_parser agree on the regular inputs and {args.parity_samples} random pages\n")
+
+    print(f"{'input':<22} {'rows':>7} {'KB':>8} {'legacy ms':>11} {'parser ms':>11}")
+    cases = [
+        ("artisan regular", legacy_artisan, new_artisan, artisan_text),
+        ("artisan no-match", legacy_artisan, new_artisan, adversarial_artisan),
+        ("ffd regular", legacy_ffd, new_ffd, ffd_text),
+        ("ffd no-match", legacy_ffd, new_ffd, adversarial_ffd),
+        ("ffd huge card", legacy_ffd, new_ffd, huge_card),
+    ]
+    for name, legacy, new, make in cases:
+        for rows in args.rows:
+            text = make(rows)
+            legacy_time = _time_with_budget(legacy, text, args.repeat, args.legacy_budget)
+            new_time = _time(new, text, args.repeat)
+            print(f"{name:<22} {rows:>7} {len(text) / 1024:>8.1f} {_fmt(legacy_time)} {_fmt(new_time)}")
+
+
+if __name__ == "__main__":
+    main()
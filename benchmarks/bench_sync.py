@@ -0,0 +1,71 @@
+"""Micro-benchmark: documents re-embedded by a sync upload versus delete-all-and-reupload.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_sync --documents 3000 --changed 10 --added 5 --removed 5
+
+Syncs ``--documents`` synthetic pages into an empty container of the stub
+vector API (benchmarks.stub_vector_api), then simulates next week's crawl:
+``--changed`` pages get new text, ``--added`` pages appear and ``--removed``
+pages disappear. The second sync should upload only the changed and added
+pages, delete only the removed ones, and leave the container with exactly the
+new crawl. A delete-all run would upload (and embed) every page again.
+"""
+import argparse
+import os
+import time
+
+from benchmarks import stub_vector_api
+
+os.environ.setdefault("UPLOAD_SERVICE_USERNAME", "benchmark")
+os.environ.setdefault("UPLOAD_SERVICE_PASSWORD", "benchmark")
+from src.dotnet.VectorEmbeddingService.vector_api_client import VectorApiClient  # noqa: E402
+
+
+def page(index: int, revision: int = 0) -> dict:
+    return {
+        "url": f"https://www.example-expo.com/en/page/{index}",
+        "title": f"Page {index}",
+        "raw_text_content": f"revision {revision} " + "flooring " * 150,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=3000)
+    parser.add_argument("--changed", type=int, default=10)
+    parser.add_argument("--added", type=int, default=5)
+    parser.add_argument("--removed", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--latency-ms", type=float, default=1.0)
+    args = parser.parse_args()
+
+    first = [page(i) for i in range(args.documents)]
+    second = [page(i, revision=1) if i < args.changed else page(i) for i in range(args.removed, args.documents)]
+    second += [page(args.documents + i) for i in range(args.added)]
+
+    server, api = stub_vector_api.serve(args.latency_ms)
+    try:
+        client = VectorApiClient(f"http://127.0.0.1:{server.server_address[1]}")
+        print(f"{'run':>8} {'seconds':>8} {'uploaded':>9} {'unchanged':>10} {'deleted':>8} {'in container':>13}")
+        for name, events in (("initial", first), ("weekly", second)):
+            uploaded_before = api.uploaded
+            start = time.perf_counter()
+            result = client.sync_events(events, workers=args.workers)
+            elapsed = time.perf_counter() - start
+            assert "error" not in result, result["error"]
+            count = client.get_event_count()
+            print(f"{name:>8} {elapsed:>8.2f} {api.uploaded - uploaded_before:>9} {result['unchanged']:>10} "
+                  f"{result['deleted']:>8} {count:>13}")
+    finally:
+        server.shutdown()
+
+    # Changed pages among the removed ones are deleted, not uploaded
+    expected = max(0, args.changed - args.removed) + args.added
+    assert result["successfulUpserts"] == expected, (result["successfulUpserts"], expected)
+    assert result["deleted"] == args.removed
+    assert count == len(second), (count, len(second))
+    print(f"delete-all would have uploaded {len(second)} documents; sync uploaded {expected}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""Micro-benchmark: EventSiteSpider text extraction, old XPath path vs. extract_page.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_text_extraction --rows 5000 --repeat 5
+
+Both variants start from the same parsed tree, so only extraction is measured.
+The "legacy" variant is the code parse() used before: CSS queries for title,
+description and links, an XPath getall() + join for the body text, a booth
+regex compiled per page and the boilerplate detector's separate block pass
+(iter_text_blocks, copied below), which extract_page replaces as well.
+
+Before timing, both variants must agree on every field (body text compared
+word for word) for the generated pages and for ``PARITY_PAGES``, which cover
+booth markup split over several elements.
+"""
+import argparse
+import re
+import statistics
+import time
+
+from lxml import etree
+from parsel import Selector
+
+from benchmarks.synthetic import exhibitor_list_page, page_chrome
+from src.python.scraper.boilerplate import BLOCK_TAGS, COOKIE_HINT_RE, STRUCTURAL_TAGS
+from src.python.scraper.text_extractor import extract_page
+
+_BODY_TEXT = etree.XPath("//body//text()[not(ancestor::script) and not(ancestor::style)]")
+
+
+PARITY_PAGES = [
+    page_chrome("Table", "<table><tr><td>Booth</td><td>142</td></tr></table>"),
+    page_chrome("Label", "<dl><dt>Stand</dt><dd>#17</dd></dl><p>Booth: 5</p>"),
+    page_chrome("Inline", "<p>Visit us at <strong>Booth</strong> <span>88</span> in hall 2</p>"),
+    page_chrome("None", "<p>No stand information on this page.</p>"),
+]
+
+
+def _path_step(element) -> str:
+    step = element.tag if isinstance(element.tag, str) else "node"
+    element_id = element.get("id")
+    if element_id:
+        step += "#" + element_id
+    return step
+
+
+def _describe(element) -> tuple[str, bool]:
+    steps = []
+    structural = False
+    while element is not None and isinstance(element.tag, str):
+        steps.append(_path_step(element))
+        if element.tag in STRUCTURAL_TAGS:
+            structural = True
+        elif COOKIE_HINT_RE.search((element.get("id") or "") + " " + (element.get("class") or "")):
+            structural = True
+        element = element.getparent()
+    return "/".join(reversed(steps)), structural
+
+
+def legacy_blocks(root) -> list[tuple[str, bool, str]]:
+    """boilerplate.iter_text_blocks before extract_page replaced it."""
+    blocks: dict[int, list] = {}
+    block_info: dict[int, tuple[str, bool]] = {}
+    for node in _BODY_TEXT(root):
+        if not node.strip():
+            continue
+        element = node.getparent()
+        if node.is_tail:
+            element = element.getparent()
+        while element is not None and element.tag not in BLOCK_TAGS:
+            element = element.getparent()
+        if element is None:
+            continue
+        key = id(element)
+        if key not in blocks:
+            block_info[key] = _describe(element)
+            blocks[key] = []
+        blocks[key].append(node)
+    return [(block_info[key][0], block_info[key][1], " ".join(parts)) for key, parts in blocks.items()]
+
+
+def legacy_extract(selector: Selector) -> tuple:
+    title = selector.css("title::text").get(default="").strip()
+    description = (
+        selector.css("meta[name='description']::attr(content)").get(default="").strip() or
+        selector.css("meta[property='og:description']::attr(content)").get(default="").strip()
+    )
+    text_nodes = selector.xpath("//body//text()[not(ancestor::script) and not(ancestor::style)]").getall()
+    raw_text = " ".join(text_nodes).strip()
+    booth_regex = re.compile(r"\b(?:Booth|Stand)\s*[:#]??\s*(\d{1,4})", re.IGNORECASE)
+    booth_match = booth_regex.search(raw_text)
+    hrefs = selector.css("a[href]::attr(href)").getall()
+    legacy_blocks(selector.root)
+    return title, description, raw_text, booth_match and booth_match.group(1), hrefs
+
+
+def streaming_extract(selector: Selector) -> tuple:
+    page = extract_page(selector.root)
+    return page.title, page.description, page.text, page.booth_number, page.hrefs
+
+
+def assert_parity(html: str) -> None:
+    selector = Selector(text=html)
+    legacy, stream = legacy_extract(selector), streaming_extract(selector)
+    legacy = legacy[:2] + (legacy[2].split(),) + legacy[3:]
+    stream = stream[:2] + (stream[2].split(),) + stream[3:]
+    assert legacy == stream, f"extraction differs: {legacy[3]!r} vs {stream[3]!r}"
+
+
+def _time(func, selector: Selector, repeat: int) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(selector)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 1000, 5000], help="Exhibitors per page")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for html in PARITY_PAGES:
+        assert_parity(html)
+
+    print(f"{'rows':>6} {'page KB':>8} {'legacy ms':>10} {'stream ms':>10} {'speed-up':>9}")
+    for rows in args.rows:
+        html = exhibitor_list_page(rows, links=["/", "/en/", "/en/exhibitors", "/en/practical"])
+        assert_parity(html)
+        selector = Selector(text=html)
+        legacy = statistics.median(_time(legacy_extract, selector, args.repeat))
+        stream = statistics.median(_time(streaming_extract, selector, args.repeat))
+        print(
+            f"{rows:>6} {len(html) / 1024:>8.1f} {legacy * 1000:>10.2f} {stream * 1000:>10.2f} "
+            f"{legacy / stream:>8.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Micro-benchmark: upload throughput of VectorApiClient by number of workers.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_upload --documents 2000 --workers 1 2 4 8 16 --latency-ms 5 --max-in-flight 8
+
+Uploads synthetic documents to the stub vector API (benchmarks.stub_vector_api),
+which charges ``--latency-ms`` per document like the embedding call in the real
+service and answers 429 beyond ``--max-in-flight`` concurrent requests.
+Throughput should grow with the number of workers up to the server's limit and
+then level off; the rate-limited count shows how often the shared limiter had
+to pause all workers.
+"""
+import argparse
+import os
+import time
+
+from benchmarks import stub_vector_api
+
+os.environ.setdefault("UPLOAD_SERVICE_USERNAME", "benchmark")
+os.environ.setdefault("UPLOAD_SERVICE_PASSWORD", "benchmark")
+from src.dotnet.VectorEmbeddingService.vector_api_client import VectorApiClient  # noqa: E402
+
+
+def documents(count: int) -> list[dict]:
+    return [
+        {"url": f"https://www.example-expo.com/en/page/{i}", "title": f"Page {i}", "raw_text_content": "flooring " * 150}
+        for i in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=2000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--max-in-flight", type=int, default=8)
+    args = parser.parse_args()
+
+    events = documents(args.documents)
+    print(f"{'workers':>7} {'seconds':>8} {'docs/s':>8} {'requests':>9} {'429s':>6} {'peak in flight':>15}")
+    for workers in args.workers:
+        server, api = stub_vector_api.serve(args.latency_ms, max_in_flight=args.max_in_flight)
+        try:
+            client = VectorApiClient(f"http://127.0.0.1:{server.server_address[1]}")
+            start = time.perf_counter()
+            result = client.bulk_upload_events(events, max_batch_docs=args.batch_size, workers=workers)
+            elapsed = time.perf_counter() - start
+        finally:
+            server.shutdown()
+        assert result.get("successfulUpserts") == args.documents, result.get("error", "documents failed")
+        stats = api.stats()
+        print(f"{workers:>7} {elapsed:>8.2f} {args.documents / elapsed:>8.0f} {result['requests']:>9} "
+              f"{stats['rate_limited']:>6} {stats['peak_in_flight']:>15}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Crawl one URL with EventSiteSpider into a raw JSON feed (the crawl stage of run_suite).
+
+Usage (from the repository root):
+    python -m benchmarks.crawl_site http://127.0.0.1:8800/ out.json --state-dir /tmp/state
+
+Runs with the project settings, a fresh (non-incremental) state and a JSON
+feed, so every run of the suite starts from the same point.
+"""
+import argparse
+from urllib.parse import urlparse
+
+from scrapy.crawler import CrawlerProcess
+from scrapy.utils.project import get_project_settings
+
+from src.python.scraper.spiders.event_site_spider import EventSiteSpider
+
+
+class LocalSiteSpider(EventSiteSpider):
+    name = "benchmark_site_spider"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # OffsiteMiddleware ignores allowed_domains entries with a port ("127.0.0.1:8800")
+        self.allowed_domains = [urlparse(self.start_urls[0]).hostname]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("start_url")
+    parser.add_argument("output", help="Raw JSON feed to write")
+    parser.add_argument("--state-dir", required=True, help="Scratch directory for crawl state")
+    parser.add_argument("--event-id", default="bench")
+    parser.add_argument("--max-pages", type=int, default=0, help="Stop after this many pages (0 = no limit)")
+    args = parser.parse_args()
+
+    settings = get_project_settings()
+    settings.set("FEEDS", {args.output: {"format": "json", "overwrite": True}})
+    settings.set("LOG_LEVEL", "WARNING")
+    if args.max_pages:
+        settings.set("CLOSESPIDER_PAGECOUNT", args.max_pages)
+
+    process = CrawlerProcess(settings)
+    process.crawl(
+        LocalSiteSpider,
+        start_url=args.start_url,
+        event_id=args.event_id,
+        state_dir=args.state_dir,
+        incremental=False,
+    )
+    process.start()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""Offline end-to-end benchmark: crawl → clean → upload against local servers.
+
+Usage (from the repository root):
+    python -m benchmarks.run_suite --pages 500 --exhibitors 5000
+    python -m benchmarks.run_suite --slow-ratio 0.05 --rate-limit-ratio 0.02 --baseline benchmarks/baseline.json
+
+Starts the synthetic event site (benchmarks.synthetic_site) and the stub vector
+API (benchmarks.stub_vector_api) in this process, then runs every stage as its
+own subprocess, exactly as production/run_pipeline.sh would:
+  • crawl  – EventSiteSpider via benchmarks.crawl_site        → pages/s
+  • clean  – src/python/utils/clean_json.py -c --remove-non-ascii → MB/s
+  • upload – upload_to_vector_db.py against the stub API      → docs/s
+
+Peak RSS per stage comes from the child's rusage. Results are written as JSON
+to benchmarks/results/<timestamp>.json (or --output); --baseline prints the
+change of every metric against an earlier result file, such as the committed
+benchmarks/baseline.json (default settings). A stage fails on a non-zero exit
+code and also when the crawl returns fewer than --min-pages pages or the
+upload stores nothing. --feed skips the crawl and cleans an existing raw feed
+instead.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchmarks import stub_vector_api, synthetic_site
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+RESULTS_DIR = REPO_ROOT / "benchmarks" / "results"
+UPLOADER = REPO_ROOT / "src" / "dotnet" / "VectorEmbeddingService" / "upload_to_vector_db.py"
+CLEANER = REPO_ROOT / "src" / "python" / "utils" / "clean_json.py"
+
+
+def run_stage(command: list[str], env: dict[str, str] | None = None) -> dict:
+    """Run ``command`` and return its wall time, exit code and peak RSS."""
+    start = time.perf_counter()
+    process = subprocess.Popen(command, cwd=REPO_ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    stderr = process.stderr.read()
+    _, status, usage = os.wait4(process.pid, 0)
+    elapsed = time.perf_counter() - start
+    process.stderr.close()
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    peak_rss = usage.ru_maxrss if sys.platform == "darwin" else usage.ru_maxrss * 1024
+    result = {
+        "seconds": round(elapsed, 3),
+        "exit_code": os.waitstatus_to_exitcode(status),
+        "peak_rss_mb": round(peak_rss / 1024 ** 2, 1),
+    }
+    if result["exit_code"]:
+        result["error"] = stderr.decode("utf-8", "replace").strip().splitlines()[-1:] or ["(no output)"]
+    return result
+
+
+def failed(metrics: dict) -> bool:
+    return bool(metrics["exit_code"] or metrics.get("error"))
+
+
+def _count_records(path: Path) -> int:
+    return len(json.loads(path.read_bytes()))
+
+
+def run_suite(args: argparse.Namespace, workdir: Path) -> dict:
+    config = synthetic_site.SiteConfig(
+        pages=args.pages,
+        exhibitors=args.exhibitors,
+        languages=tuple(args.languages.split(",")),
+        slow_ratio=args.slow_ratio,
+        rate_limit_ratio=args.rate_limit_ratio,
+        seed=args.seed,
+    )
+    site_server, site = synthetic_site.serve(config)
+    api_server, api = stub_vector_api.serve(args.latency_ms)
+    site_url = f"http://127.0.0.1:{site_server.server_address[1]}/"
+    api_url = f"http://127.0.0.1:{api_server.server_address[1]}"
+    stages: dict[str, dict] = {}
+
+    try:
+        raw_feed = workdir / "raw.json"
+        if args.feed:
+            raw_feed = args.feed
+        else:
+            print(f"crawl   {site_url}")
+            crawl = run_stage([
+                sys.executable, "-m", "benchmarks.crawl_site", site_url, str(raw_feed),
+                "--state-dir", str(workdir / "state"), "--max-pages", str(args.max_pages),
+            ])
+            if not crawl["exit_code"]:
+                crawl["pages"] = _count_records(raw_feed)
+                crawl["pages_per_s"] = round(crawl["pages"] / crawl["seconds"], 1)
+                # A spider that exits cleanly without scraping anything is a broken crawl, not a fast one
+                if crawl["pages"] < args.min_pages:
+                    crawl["error"] = [f"crawled {crawl['pages']} pages, expected at least {args.min_pages}"]
+            crawl["site"] = site.stats()
+            stages["crawl"] = crawl
+            if failed(crawl):
+                return stages
+
+        cleaned_feed = workdir / "cleaned.json"
+        print(f"clean   {raw_feed}")
+        clean = run_stage([
+            sys.executable, str(CLEANER), str(raw_feed), "-o", str(cleaned_feed), "-c", "--remove-non-ascii",
+        ])
+        if not clean["exit_code"]:
+            clean["input_mb"] = round(Path(raw_feed).stat().st_size / 1024 ** 2, 2)
+            clean["mb_per_s"] = round(clean["input_mb"] / clean["seconds"], 2)
+        stages["clean"] = clean
+        if clean["exit_code"]:
+            return stages
+
+        print(f"upload  {api_url}")
+        env = dict(os.environ, UPLOAD_SERVICE_USERNAME="benchmark", UPLOAD_SERVICE_PASSWORD="benchmark")
+        upload = run_stage(
+            [sys.executable, str(UPLOADER), str(cleaned_feed), "--api-url", api_url, "--container", "ffd"],
+            env=env,
+        )
+        upload["documents"] = api.uploaded
+        if not upload["exit_code"]:
+            upload["docs_per_s"] = round(api.uploaded / upload["seconds"], 1)
+            if not api.uploaded:
+                upload["error"] = ["uploaded no documents"]
+        upload["api"] = api.stats()
+        stages["upload"] = upload
+        return stages
+    finally:
+        site_server.shutdown()
+        api_server.shutdown()
+
+
+# Metrics compared against a baseline and whether higher is better
+COMPARED = {
+    "pages_per_s": True,
+    "mb_per_s": True,
+    "docs_per_s": True,
+    "seconds": False,
+    "peak_rss_mb": False,
+}
+
+
+def print_comparison(current: dict, baseline: dict) -> None:
+    print(f"\n{'stage':<8} {'metric':<13} {'baseline':>10} {'current':>10} {'change':>9}")
+    for stage, metrics in current["stages"].items():
+        previous = baseline.get("stages", {}).get(stage, {})
+        for metric, higher_is_better in COMPARED.items():
+            if metric not in metrics or not previous.get(metric):
+                continue
+            change = (metrics[metric] - previous[metric]) / previous[metric] * 100
+            marker = "" if abs(change) < 5 else ("  better" if (change > 0) == higher_is_better else "  worse")
+            print(f"{stage:<8} {metric:<13} {previous[metric]:>10} {metrics[metric]:>10} {change:>+8.1f}%{marker}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=synthetic_site.DEFAULTS.pages, help="Content pages per language")
+    parser.add_argument("--exhibitors", type=int, default=synthetic_site.DEFAULTS.exhibitors)
+    parser.add_argument("--languages", default=",".join(synthetic_site.DEFAULTS.languages))
+    parser.add_argument("--slow-ratio", type=float, default=0.0, help="Share of paths answered slowly")
+    parser.add_argument("--rate-limit-ratio", type=float, default=0.0, help="Share of paths answering 429 once")
+    parser.add_argument("--latency-ms", type=float, default=2.0, help="Stub API time per uploaded document")
+    parser.add_argument("--max-pages", type=int, default=0, help="Stop the crawl after this many pages")
+    parser.add_argument("--min-pages", type=int, default=10, help="Fail the crawl stage below this many pages")
+    parser.add_argument("--seed", type=int, default=synthetic_site.DEFAULTS.seed)
+    parser.add_argument("--feed", type=Path, help="Skip the crawl and clean this raw feed instead")
+    parser.add_argument("--output", type=Path, help="Result file (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument("--baseline", type=Path, help="Earlier result file to compare against")
+    args = parser.parse_args()
+
+    started = datetime.now(timezone.utc)
+    with tempfile.TemporaryDirectory(prefix="xpo-bench-") as tmp:
+        stages = run_suite(args, Path(tmp))
+
+    result = {
+        "started": started.isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": f"{platform.system()} {platform.machine()} ({os.cpu_count()} CPUs)",
+        "config": {key: str(value) if isinstance(value, Path) else value
+                   for key, value in vars(args).items() if key not in {"output", "baseline"}},
+        "stages": stages,
+    }
+    output = args.output or RESULTS_DIR / f"{started:%Y%m%d-%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2) + "\n", encoding="utf-8")
+
+    print()
+    for stage, metrics in stages.items():
+        summary = ", ".join(f"{key}={value}" for key, value in metrics.items() if not isinstance(value, dict))
+        print(f"{stage:<8} {summary}")
+    print(f"\nResults written to {output}")
+    if args.baseline:
+        print_comparison(result, json.loads(args.baseline.read_text(encoding="utf-8")))
+    if any(failed(metrics) for metrics in stages.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""In-memory stand-in for the C# Vector Embedding Service, for offline upload benchmarks.
+
+Usage (from the repository root):
+    python -m benchmarks.stub_vector_api --port 5055 --latency-ms 5
+
+Implements the endpoints the Python uploader talks to, with the same JSON
+shapes as the real controllers:
+  POST   /api/auth/login              -> {"token": ...}
+  GET    /api/<container>/count       -> {"Count": n}
+  POST   /api/<container>/embedding   -> [EMBEDDING_DIMENSIONS floats]
+  POST   /api/<container>/search      -> [top documents by shared words with the query]
+  GET    /api/<container>             -> [documents]
+  GET    /api/<container>/manifest    -> {id: content_hash}
+  DELETE /api/<container>             -> 204
+  DELETE /api/<container>/<id>        -> 204 (404 if unknown)
+  POST   /api/<container>/bulk-upload -> {"totalEvents", "successfulUpserts", "failedUpserts",
+                                           "upsertedIds", "failedIndexes"}
+
+``latency_ms`` is charged per uploaded document and per embedding or search request to
+stand in for the embedding call, which dominates the real service. Embeddings
+are pseudo-random vectors seeded by the whitespace-collapsed text, so equal
+texts get equal vectors. For
+failure handling, a document whose raw_text_content contains ``REJECT_MARKER``
+fails on its own (reported in failedIndexes), one containing ``POISON_MARKER``
+fails its whole request with a 500, like an embedding error does in the real
+controllers. With ``max_in_flight`` set, bulk uploads beyond that many
+concurrent requests are answered with 429 and Retry-After, like a throttled
+embedding backend.
+"""
+import argparse
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+TOKEN = "benchmark-token"
+REJECT_MARKER = "__stub_reject__"
+POISON_MARKER = "__stub_poison__"
+EMBEDDING_DIMENSIONS = 1536  # text-embedding-ada-002
+
+
+class StubVectorApi:
+    """Containers of uploaded documents plus upload counters."""
+
+    def __init__(self, latency_ms: float = 0.0, max_in_flight: int = 0, retry_after: float = 1.0):
+        self.latency_ms = latency_ms
+        self.max_in_flight = max_in_flight
+        self.retry_after = retry_after
+        self.containers: dict[str, dict[str, dict]] = {}
+        self.uploaded = 0
+        self.embedded = 0
+        self.searched = 0
+        self.requests = 0
+        self.rate_limited = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._lock = threading.Lock()
+
+    def handle(self, method: str, path: str, payload) -> tuple[int, object]:
+        with self._lock:
+            self.requests += 1
+        parts = [part for part in path.split("?")[0].split("/") if part]
+        if parts[:1] != ["api"] or len(parts) < 2:
+            return 404, {"error": "not found"}
+        if parts[1:] == ["auth", "login"] and method == "POST":
+            return 200, {"token": TOKEN}
+
+        container = parts[1]
+        action = parts[2] if len(parts) > 2 else ""
+        with self._lock:
+            documents = self.containers.setdefault(container, {})
+            if method == "GET" and action == "count":
+                return 200, {"Count": len(documents)}
+            if method == "GET" and not action:
+                return 200, list(documents.values())
+            if method == "GET" and action == "manifest":
+                return 200, {doc_id: document.get("content_hash", "") for doc_id, document in documents.items()}
+            if method == "DELETE" and not action:
+                documents.clear()
+                return 204, None
+            if method == "DELETE":
+                return (204, None) if documents.pop(action, None) else (404, {"error": "not found"})
+        if method == "POST" and action == "embedding":
+            text = (payload or {}).get("text") or ""
+            if not text.strip():
+                return 400, {"error": "Text cannot be empty"}
+            if self.latency_ms:
+                time.sleep(self.latency_ms / 1000)
+            with self._lock:
+                self.embedded += 1
+            rng = random.Random(" ".join(text.split()))  # whitespace does not change an embedding
+            return 200, [rng.uniform(-1, 1) for _ in range(EMBEDDING_DIMENSIONS)]
+        if method == "POST" and action == "search":
+            return self._search(documents, payload or {})
+        if method == "POST" and action == "bulk-upload":
+            with self._lock:
+                if self.max_in_flight and self.in_flight >= self.max_in_flight:
+                    self.rate_limited += 1
+                    return 429, {"error": "too many requests", "retry_after": self.retry_after}
+                self.in_flight += 1
+                self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            try:
+                return self._bulk_upload(documents, payload)
+            finally:
+                with self._lock:
+                    self.in_flight -= 1
+        return 404, {"error": "not found"}
+
+    def _bulk_upload(self, documents: dict[str, dict], payload) -> tuple[int, object]:
+        events = (payload or {}).get("events") or []
+        if any(POISON_MARKER in (event.get("raw_text_content") or "") for event in events):
+            return 500, {"error": "embedding failed"}
+        if self.latency_ms:
+            time.sleep(self.latency_ms * len(events) / 1000)
+        ids = []
+        failed = []
+        with self._lock:
+            for index, event in enumerate(events):
+                if REJECT_MARKER in (event.get("raw_text_content") or ""):
+                    failed.append(index)
+                    continue
+                document_id = event.get("id") or str(uuid.uuid4())
+                documents[document_id] = dict(event, id=document_id)
+                ids.append(document_id)
+            self.uploaded += len(ids)
+        return 200, {
+            "totalEvents": len(events),
+            "successfulUpserts": len(ids),
+            "failedUpserts": len(failed),
+            "upsertedIds": ids,
+            "failedIndexes": failed,
+        }
+
+    def _search(self, documents: dict[str, dict], payload: dict) -> tuple[int, object]:
+        words = set((payload.get("query") or "").lower().split())
+        if not words:
+            return 400, {"error": "Query cannot be empty"}
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+        with self._lock:
+            self.searched += 1
+            scored = [
+                (len(words & set(f"{document.get('title', '')} {document.get('raw_text_content', '')}".lower().split())), doc_id)
+                for doc_id, document in documents.items()
+            ]
+            top = sorted((item for item in scored if item[0]), key=lambda item: (-item[0], item[1]))
+            return 200, [documents[doc_id] for _, doc_id in top[:int(payload.get("topK") or 5)]]
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "requests": self.requests,
+            "uploaded": self.uploaded,
+            "embedded": self.embedded,
+            "searched": self.searched,
+            "rate_limited": self.rate_limited,
+            "peak_in_flight": self.peak_in_flight,
+        }
+
+
+def make_handler(api: StubVectorApi) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _dispatch(self, method: str) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            payload = json.loads(self.rfile.read(length)) if length else None
+            status, body = api.handle(method, self.path, payload)
+            data = b"" if body is None else json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            if status == 429:
+                self.send_header("Retry-After", str(api.retry_after))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            self._dispatch("GET")
+
+        def do_POST(self):
+            self._dispatch("POST")
+
+        def do_DELETE(self):
+            self._dispatch("DELETE")
+
+        def log_message(self, format, *args):  # keep benchmark output clean
+            pass
+
+    return Handler
+
+
+class _Server(ThreadingHTTPServer):
+    request_queue_size = 128  # many upload workers connect at once
+
+
+def serve(latency_ms: float = 0.0, port: int = 0, max_in_flight: int = 0) -> tuple[ThreadingHTTPServer, StubVectorApi]:
+    """Start the stub API on a background thread; ``port=0`` picks a free port."""
+    api = StubVectorApi(latency_ms, max_in_flight)
+    server = _Server(("127.0.0.1", port), make_handler(api))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, api
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=5055)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Simulated embedding time per document")
+    parser.add_argument("--max-in-flight", type=int, default=0, help="Concurrent uploads before answering 429")
+    args = parser.parse_args()
+
+    server, _ = serve(args.latency_ms, args.port, args.max_in_flight)
+    print(f"Stub vector API on http://127.0.0.1:{server.server_address[1]} (Ctrl+C to stop)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
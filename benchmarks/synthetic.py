@@ -0,0 +1,57 @@
+"""Synthetic HTML for the benchmarks: event-site pages with realistic boilerplate."""
+import random
+
+COMPANIES = ["Floorex", "Parket & Co", "Tegel Atelier", "Vinyl Masters", "Woodcraft NV", "Carpet Studio"]
+CITIES = ["Kortrijk", "Gent", "Roeselare", "Lille", "Brugge", "Antwerpen"]
+COUNTRIES = ["BE", "FR", "NL", "DE"]
+
+
+def page_chrome(title: str, body: str, links: list[str] = ()) -> str:
+    """Wrap ``body`` in a navigation menu, cookie banner, scripts and footer."""
+    nav = "".join(f'<li><a href="{href}">{href.strip("/") or "Home"}</a></li>' for href in links)
+    return (
+        "<!DOCTYPE html><html><head>"
+        f"<title>{title}</title>"
+        f'<meta name="description" content="{title} – Flanders event">'
+        "<style>body{font-family:sans-serif}.nav li{display:inline}</style>"
+        "<script>window.dataLayer=window.dataLayer||[];function gtag(){dataLayer.push(arguments)}</script>"
+        "</head><body>"
+        f'<header><nav class="nav"><ul>{nav}</ul></nav></header>'
+        '<div id="cookie-consent"><p>We use cookies to improve your experience.</p><button>Accept</button></div>'
+        f"<main>{body}</main>"
+        "<footer><p>Kortrijk Xpo · Doorniksesteenweg 216 · 8500 Kortrijk</p>"
+        '<p><a href="/privacy">Privacy</a> <a href="/contact">Contact</a></p></footer>'
+        "<script>console.log('analytics')</script>"
+        "</body></html>"
+    )
+
+
+def exhibitor_rows(count: int, seed: int = 42) -> list[dict[str, str]]:
+    rng = random.Random(seed)
+    return [
+        {
+            "name": f"{rng.choice(COMPANIES)} {i}",
+            "city": rng.choice(CITIES),
+            "country": rng.choice(COUNTRIES),
+            "booth": f"{rng.randint(1, 999)}",
+        }
+        for i in range(count)
+    ]
+
+
+def exhibitor_list_page(count: int, seed: int = 42, links: list[str] = ()) -> str:
+    """An exhibitor list in the Artisan table layout plus FFD-style cards."""
+    rows = []
+    for row in exhibitor_rows(count, seed):
+        rows.append(
+            '<div class="exposantenLijst_exposantjs">'
+            f'<div class="exposantenLijst_exposantNaam">{row["name"]}</div>'
+            f'<div class="exposantenLijst_exposantStad">{row["city"]}</div>'
+            f'<div class="exposantenLijst_exposantLand">{row["country"]}</div>'
+            f'<div class="exposantenLijst_exposantPlaats">{row["booth"]}</div>'
+            "</div>"
+            f'<div class="card"><h3>{row["name"]}</h3><p>Booth: {row["booth"]}</p>'
+            f'<a href="/exhibitor/{row["booth"]}">Read more</a></div>'
+        )
+    body = "<h1>List of exhibitors</h1><p>Company City Country Booth</p>" + "".join(rows)
+    return page_chrome("List of exhibitors", body, links)
@@ -0,0 +1,181 @@
+"""Local HTTP server that serves a configurable synthetic event site.
+
+Usage (from the repository root):
+    python -m benchmarks.synthetic_site --port 8800 --pages 500 --exhibitors 5000
+
+The site mimics the shows we crawl:
+  • every content page exists once per language (/en/..., /nl/..., /fr/...)
+  • /<lang>/list-of-exhibitors holds ``exhibitors`` rows (Artisan table + FFD cards)
+  • content pages form a tree with ``branching`` children per page plus a few
+    cross links, so ``pages`` controls the depth of the link graph
+  • a ``slow_ratio`` share of paths answers after ``slow_seconds``
+  • a ``rate_limit_ratio`` share of paths answers 429 with Retry-After on the
+    first request, and normally afterwards
+
+Everything is derived from ``seed``, so two runs with the same configuration
+serve the same bytes.
+"""
+import argparse
+import hashlib
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import NamedTuple
+
+from benchmarks.synthetic import exhibitor_list_page, page_chrome
+
+
+class SiteConfig(NamedTuple):
+    pages: int = 200
+    languages: tuple[str, ...] = ("en", "nl", "fr")
+    exhibitors: int = 2000
+    branching: int = 5
+    cross_links: int = 3
+    paragraphs: int = 6
+    slow_ratio: float = 0.0
+    slow_seconds: float = 0.5
+    rate_limit_ratio: float = 0.0
+    retry_after: int = 1
+    seed: int = 42
+
+
+DEFAULTS = SiteConfig()
+
+WORDS = (
+    "flooring parket tegels vinyl design trends exhibitors booth hall visitors opening hours "
+    "tickets program seminar innovation sustainable wood ceramic installation Kortrijk Xpo"
+).split()
+
+
+class SyntheticSite:
+    """Generates the pages of one synthetic site and counts what was served."""
+
+    def __init__(self, config: SiteConfig):
+        self.config = config
+        self.requests = 0
+        self.rate_limited = 0
+        self.bytes_served = 0
+        self._limited_paths: set[str] = set()
+        self._lock = threading.Lock()
+        self._exhibitor_cache: dict[str, str] = {}
+
+    def _bucket(self, path: str, salt: str) -> float:
+        digest = hashlib.blake2b(f"{self.config.seed}:{salt}:{path}".encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "big") / 2 ** 64
+
+    def _nav(self, lang: str) -> list[str]:
+        return [f"/{lang}/", f"/{lang}/list-of-exhibitors", f"/{lang}/page/1"] + [
+            f"/{other}/" for other in self.config.languages if other != lang
+        ]
+
+    def _content_page(self, lang: str, page: int) -> str:
+        config = self.config
+        rng = random.Random(f"{config.seed}:{page}")
+        first_child = page * config.branching + 1
+        children = [p for p in range(first_child, first_child + config.branching) if p < config.pages]
+        cross = [rng.randrange(config.pages) for _ in range(config.cross_links)]
+        links = "".join(f'<li><a href="/{lang}/page/{p}">Page {p}</a></li>' for p in children + cross)
+        paragraphs = "".join(
+            "<p>" + " ".join(rng.choice(WORDS) for _ in range(rng.randint(30, 90))) + ".</p>"
+            for _ in range(config.paragraphs)
+        )
+        body = f"<h1>Page {page}</h1>{paragraphs}<p>Booth: {rng.randint(1, 999)}</p><ul>{links}</ul>"
+        return page_chrome(f"Page {page} ({lang})", body, self._nav(lang))
+
+    def render(self, path: str) -> tuple[int, dict[str, str], str]:
+        """Return (status, headers, body) for ``path``."""
+        config = self.config
+        with self._lock:
+            self.requests += 1
+            if self._bucket(path, "429") < config.rate_limit_ratio and path not in self._limited_paths:
+                self._limited_paths.add(path)
+                self.rate_limited += 1
+                return 429, {"Retry-After": str(config.retry_after)}, "Too Many Requests"
+        if self._bucket(path, "slow") < config.slow_ratio:
+            time.sleep(config.slow_seconds)
+
+        parts = [part for part in path.split("?")[0].split("/") if part]
+        if not parts:
+            links = [f"/{lang}/" for lang in config.languages]
+            return 200, {}, page_chrome("Home", "<h1>Welcome</h1><p>Choose your language.</p>", links)
+        lang = parts[0]
+        if parts[0] == "exhibitor" and len(parts) == 2:
+            lang = config.languages[0]
+            body = f"<h1>Exhibitor {parts[1]}</h1><p>Booth: {parts[1]}</p>"
+            return 200, {}, page_chrome(f"Exhibitor {parts[1]}", body, self._nav(lang))
+        if lang not in config.languages:
+            return 404, {}, "Not Found"
+        if len(parts) == 1:
+            return 200, {}, self._content_page(lang, 0)
+        if parts[1:] == ["list-of-exhibitors"]:
+            if lang not in self._exhibitor_cache:
+                self._exhibitor_cache[lang] = exhibitor_list_page(config.exhibitors, config.seed, self._nav(lang))
+            return 200, {}, self._exhibitor_cache[lang]
+        if len(parts) == 3 and parts[1] == "page" and parts[2].isdigit() and int(parts[2]) < config.pages:
+            return 200, {}, self._content_page(lang, int(parts[2]))
+        return 404, {}, "Not Found"
+
+    def stats(self) -> dict[str, int]:
+        return {"requests": self.requests, "rate_limited": self.rate_limited, "bytes_served": self.bytes_served}
+
+
+def make_handler(site: SyntheticSite) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            status, headers, body = site.render(self.path)
+            data = body.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(data)
+            with site._lock:
+                site.bytes_served += len(data)
+
+        def log_message(self, format, *args):  # keep benchmark output clean
+            pass
+
+    return Handler
+
+
+def serve(config: SiteConfig, port: int = 0) -> tuple[ThreadingHTTPServer, SyntheticSite]:
+    """Start the site on a background thread; ``port=0`` picks a free port."""
+    site = SyntheticSite(config)
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(site))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, site
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8800)
+    parser.add_argument("--pages", type=int, default=DEFAULTS.pages)
+    parser.add_argument("--exhibitors", type=int, default=DEFAULTS.exhibitors)
+    parser.add_argument("--languages", default=",".join(DEFAULTS.languages))
+    parser.add_argument("--slow-ratio", type=float, default=0.0)
+    parser.add_argument("--rate-limit-ratio", type=float, default=0.0)
+    args = parser.parse_args()
+
+    config = SiteConfig(
+        pages=args.pages,
+        exhibitors=args.exhibitors,
+        languages=tuple(args.languages.split(",")),
+        slow_ratio=args.slow_ratio,
+        rate_limit_ratio=args.rate_limit_ratio,
+    )
+    server, _ = serve(config, args.port)
+    print(f"Serving synthetic site on http://127.0.0.1:{server.server_address[1]}/ (Ctrl+C to stop)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -18,37 +18,39 @@ fi
 # Create data directory if it doesn't exist
 mkdir -p data/processed
 
-echo "=== Phase 1: Scraping Event Sites ==="
-
-# 1. Scrape Flanders Flooring Days
-echo "Scraping Flanders Flooring Days..."
-scrapy crawl event_site_spider_clean \
-    -a start_url=https://www.flandersflooringdays.com \
-    -a event_id=ffd \
-    -O data/processed/ffd_site_data.json
+# Validator state for incremental re-crawls; point this at a mounted volume
+# so ETag/Last-Modified data survives between job runs
+CRAWL_STATE_DIR="${CRAWL_STATE_DIR:-data/state}"
+mkdir -p "$CRAWL_STATE_DIR"
 
-# 2. Scrape Artisan XPO
-echo "Scraping Artisan XPO..."
-scrapy crawl event_site_spider_clean \
-    -a start_url=https://www.artisan-xpo.be \
-    -a event_id=artisan \
-    -O data/processed/artisan_site_data.json
+echo "=== Phase 1: Scraping Event Sites ==="
 
-# 3. Scrape ABISS Summit
-echo "Scraping ABISS Summit..."
-scrapy crawl event_site_spider_clean \
-    -a start_url=https://www.abissummit.be \
-    -a event_id=abiss \
-    -O data/processed/abiss_site_data.json
+# All sites listed in the manifest are crawled concurrently in one Scrapy process
+SITES_MANIFEST="${SITES_MANIFEST:-production/sites.json}"
+# "json" (indented) or "store" (compact indexed record store, see src/python/utils/record_store.py)
+CLEANED_FORMAT="${CLEANED_FORMAT:-json}"
+# Near-identical pages (pagination, filters, print views) are uploaded once; set DEDUPE_PAGES=false to keep all
+DEDUPE_ARGS=()
+if [ "${DEDUPE_PAGES:-true}" = "true" ]; then
+    DEDUPE_ARGS=(--dedupe)
+fi
+echo "Scraping all sites from $SITES_MANIFEST..."
+python -m src.python.scraper.run_sites "$SITES_MANIFEST" \
+    --state-dir "$CRAWL_STATE_DIR" \
+    --cleaned-format "$CLEANED_FORMAT" \
+    "${DEDUPE_ARGS[@]}"
 
 echo "=== Phase 2: Uploading to Vector Database ==="
 
+# Only new and changed documents are uploaded and stale ones deleted; set UPLOAD_SYNC=false
+# to delete each container and upload everything again
+SYNC_ARGS=()
+if [ "${UPLOAD_SYNC:-true}" = "true" ]; then
+    SYNC_ARGS=(--sync)
+fi
+
 # Check if cleaned files exist (created by the spider_clean variant)
-FILES=(
-    "data/processed/ffd_site_data_cleaned.json:ffd"
-    "data/processed/artisan_site_data_cleaned.json:artisan"
-    "data/processed/abiss_site_data_cleaned.json:abiss"
-)
+mapfile -t FILES < <(python -m src.python.scraper.run_sites "$SITES_MANIFEST" --cleaned-format "$CLEANED_FORMAT" --list-uploads)
 
 for file_info in "${FILES[@]}"; do
     IFS=':' read -r file_path container_name <<< "$file_info"
@@ -58,6 +60,7 @@ for file_info in "${FILES[@]}"; do
         python src/dotnet/VectorEmbeddingService/upload_to_vector_db.py \
             --api-url "$API_URL" \
             --container "$container_name" \
+            "${SYNC_ARGS[@]}" \
             "$file_path"
         echo "✓ Upload completed for $container_name"
     else
@@ -61,7 +61,7 @@ public class AbissController : ControllerBase
             var embedding = await _embeddingService.GetEmbeddingAsync(embeddingText);
             var eventDocument = new EventDocument
             {
-                Id = Guid.NewGuid().ToString(),
+                Id = string.IsNullOrEmpty(eventData.Id) ? Guid.NewGuid().ToString() : eventData.Id,
                 Title = eventData.Title,
                 Description = eventData.Description,
                 Url = eventData.Url,
@@ -69,6 +69,9 @@ public class AbissController : ControllerBase
                 StandNumbers = eventData.StandNumbers ?? new List<string>(),
                 RawTextContent = eventData.RawTextContent,
                 SourceType = eventData.SourceType,
+                ParentUrl = string.IsNullOrEmpty(eventData.ParentUrl) ? eventData.Url : eventData.ParentUrl,
+                ChunkIndex = eventData.ChunkIndex,
+                ContentHash = eventData.ContentHash,
                 Embedding = embedding,
                 EmbeddingText = embeddingText,
                 CreatedAt = DateTime.UtcNow,
@@ -77,12 +80,15 @@ public class AbissController : ControllerBase
             eventDocuments.Add(eventDocument);
         }
         var upsertedIds = await _cosmosDbService.BulkUpsertEventsAsync(eventDocuments);
+        // UpsertedIds keeps request order but skips failures; FailedIndexes lets clients map ids back to their events
+        var upserted = upsertedIds.ToHashSet();
         var result = new
         {
             TotalEvents = request.Events.Count,
             SuccessfulUpserts = upsertedIds.Count,
             FailedUpserts = request.Events.Count - upsertedIds.Count,
-            UpsertedIds = upsertedIds
+            UpsertedIds = upsertedIds,
+            FailedIndexes = Enumerable.Range(0, eventDocuments.Count).Where(i => !upserted.Contains(eventDocuments[i].Id)).ToList()
         };
         _logger.LogInformation("Bulk upload completed: {Successful}/{Total} events uploaded successfully", upsertedIds.Count, request.Events.Count);
         return Ok(result);
@@ -116,6 +122,14 @@ public class AbissController : ControllerBase
         return NoContent();
     }
 
+    [Authorize]
+    [HttpGet("manifest")]
+    public async Task<ActionResult<Dictionary<string, string>>> GetContentManifest()
+    {
+        var manifest = await _cosmosDbService.GetContentManifestAsync();
+        return Ok(manifest);
+    }
+
     [Authorize]
     [HttpGet("count")]
     public async Task<ActionResult<object>> GetEventCount()
@@ -28,6 +28,15 @@ public class EventDocument
     [JsonPropertyName("sourceType")]
     public string SourceType { get; set; } = string.Empty;
 
+    [JsonPropertyName("parentUrl")]
+    public string ParentUrl { get; set; } = string.Empty;
+
+    [JsonPropertyName("chunkIndex")]
+    public int ChunkIndex { get; set; }
+
+    [JsonPropertyName("contentHash")]
+    public string ContentHash { get; set; } = string.Empty;
+
     [JsonPropertyName("embedding")]
     public float[] Embedding { get; set; } = Array.Empty<float>();
 
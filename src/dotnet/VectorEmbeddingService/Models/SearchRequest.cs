@@ -28,6 +28,10 @@ public class BulkUploadRequest
 
 public class EventData
 {
+    // Optional stable id (sync uploads derive it from the page URL); a new GUID is used when empty
+    [JsonPropertyName("id")]
+    public string? Id { get; set; }
+
     [JsonPropertyName("title")]
     public string Title { get; set; } = string.Empty;
 
@@ -48,4 +52,15 @@ public class EventData
 
     [JsonPropertyName("source_type")]
     public string SourceType { get; set; } = string.Empty;
+
+    // Set when a page is uploaded in chunks: the page URL and the chunk's position in it
+    [JsonPropertyName("parent_url")]
+    public string ParentUrl { get; set; } = string.Empty;
+
+    [JsonPropertyName("chunk_index")]
+    public int ChunkIndex { get; set; }
+
+    // Hash of the uploaded fields, stored so sync uploads can skip unchanged documents
+    [JsonPropertyName("content_hash")]
+    public string ContentHash { get; set; } = string.Empty;
 } 
\ No newline at end of file
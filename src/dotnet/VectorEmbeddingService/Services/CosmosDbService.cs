@@ -118,7 +118,7 @@ public class CosmosDbService : ICosmosDbService
         try
         {
             // Only select the fields we need for similarity and result formatting
-            var query = @"SELECT c.id, c.title, c.description, c.url, c.socialMediaLinks, c.standNumbers, c.rawTextContent, c.sourceType, c.embedding, c.embeddingText, c.createdAt, c.updatedAt FROM c WHERE IS_DEFINED(c.embedding) AND ARRAY_LENGTH(c.embedding) > 0";
+            var query = @"SELECT c.id, c.title, c.description, c.url, c.socialMediaLinks, c.standNumbers, c.rawTextContent, c.sourceType, c.parentUrl, c.chunkIndex, c.embedding, c.embeddingText, c.createdAt, c.updatedAt FROM c WHERE IS_DEFINED(c.embedding) AND ARRAY_LENGTH(c.embedding) > 0";
             var queryDefinition = new QueryDefinition(query);
             var events = new List<EventDocument>();
             using var feedIterator = _container.GetItemQueryIterator<dynamic>(queryDefinition);
@@ -149,6 +149,8 @@ public class CosmosDbService : ICosmosDbService
                             : new List<string>(),
                         RawTextContent = item.rawTextContent,
                         SourceType = item.sourceType,
+                        ParentUrl = item.parentUrl != null ? (string)item.parentUrl : (string)item.url,
+                        ChunkIndex = item.chunkIndex != null ? (int)item.chunkIndex : 0,
                         Embedding = ((IEnumerable<object>)item.embedding).Select(x => SafeToFloat(x)).ToArray(),
                         EmbeddingText = item.embeddingText,
                         CreatedAt = item.createdAt != null ? (DateTime)item.createdAt : DateTime.MinValue,
@@ -213,7 +215,7 @@ public class CosmosDbService : ICosmosDbService
     {
         try
         {
-            var query = @"SELECT c.id, c.title, c.description, c.url, c.socialMediaLinks, c.standNumbers, c.rawTextContent, c.sourceType, c.embedding, c.embeddingText, c.createdAt, c.updatedAt FROM c WHERE IS_DEFINED(c.title)";
+            var query = @"SELECT c.id, c.title, c.description, c.url, c.socialMediaLinks, c.standNumbers, c.rawTextContent, c.sourceType, c.parentUrl, c.chunkIndex, c.embedding, c.embeddingText, c.createdAt, c.updatedAt FROM c WHERE IS_DEFINED(c.title)";
             var queryDefinition = new QueryDefinition(query);
             var events = new List<EventDocument>();
             using var feedIterator = _container.GetItemQueryIterator<dynamic>(queryDefinition);
@@ -238,6 +240,8 @@ public class CosmosDbService : ICosmosDbService
                         StandNumbers = item.standNumbers != null ? ((IEnumerable<object>)item.standNumbers).Where(x => x != null).Select(x => x.ToString()!).ToList() : new List<string>(),
                         RawTextContent = item.rawTextContent,
                         SourceType = item.sourceType,
+                        ParentUrl = item.parentUrl != null ? (string)item.parentUrl : (string)item.url,
+                        ChunkIndex = item.chunkIndex != null ? (int)item.chunkIndex : 0,
                         Embedding = item.embedding != null ? ((IEnumerable<object>)item.embedding).Where(x => x != null).Select(x => SafeToFloat(x)).ToArray() : Array.Empty<float>(),
                         EmbeddingText = item.embeddingText,
                         CreatedAt = item.createdAt != null ? (DateTime)item.createdAt : DateTime.MinValue,
@@ -254,6 +258,32 @@ public class CosmosDbService : ICosmosDbService
         }
     }
 
+    // Only ids and content hashes: lets uploaders diff against the container without pulling embeddings
+    public async Task<Dictionary<string, string>> GetContentManifestAsync()
+    {
+        try
+        {
+            var query = "SELECT c.id, c.contentHash FROM c WHERE IS_DEFINED(c.title)";
+            var queryDefinition = new QueryDefinition(query);
+            var manifest = new Dictionary<string, string>();
+            using var feedIterator = _container.GetItemQueryIterator<dynamic>(queryDefinition);
+            while (feedIterator.HasMoreResults)
+            {
+                var response = await feedIterator.ReadNextAsync();
+                foreach (var item in response)
+                {
+                    manifest[(string)item.id] = item.contentHash != null ? (string)item.contentHash : string.Empty;
+                }
+            }
+            return manifest;
+        }
+        catch (Exception ex)
+        {
+            _logger.LogError(ex, "Error getting content manifest");
+            throw;
+        }
+    }
+
     public async Task<bool> DeleteEventAsync(string id)
     {
         try
@@ -10,6 +10,7 @@ public interface ICosmosDbService
     Task<List<EventDocument>> SearchSimilarEventsAsync(float[] queryEmbedding, int topK = 5, double threshold = 0.7);
     Task<EventDocument?> GetEventByIdAsync(string id);
     Task<List<EventDocument>> GetAllEventsAsync();
+    Task<Dictionary<string, string>> GetContentManifestAsync();
     Task<bool> DeleteEventAsync(string id);
     Task<int> GetEventCountAsync();
     Task DeleteAllEventsAsync();
@@ -0,0 +1,163 @@
+import sqlite3
+import threading
+from array import array
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from src.python.utils.delta_feed import content_hash
+
+DEFAULT_MODEL = "text-embedding-ada-002"  # AzureOpenAI:EmbeddingDeploymentName in appsettings.json
+
+
+def text_key(text: str) -> str:
+    """Cache key of ``text``: a hash of it with whitespace collapsed, so re-flowed text is a hit."""
+    return content_hash(text)
+
+
+class EmbeddingCache:
+    """
+    Persistent embedding cache in a single SQLite file.
+
+    Vectors are stored as float32 blobs (4 bytes per dimension, a quarter of
+    the JSON the API returns) under (container, model, text_key). The total
+    vector size is bounded by ``max_bytes``: when a write goes over it, the
+    least recently used entries are evicted down to 90% so that eviction does
+    not run on every write. Safe to share between threads.
+
+    ``model`` is part of the key: change it when the service's embedding
+    deployment changes, or old vectors would be returned for the new model.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 256 * 1024 * 1024, model: str = DEFAULT_MODEL):
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be positive")
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.model = model
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            " container TEXT NOT NULL, model TEXT NOT NULL, text_key TEXT NOT NULL,"
+            " vector BLOB NOT NULL, last_used INTEGER NOT NULL,"
+            " PRIMARY KEY (container, model, text_key))"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used)")
+        self._db.commit()
+        entries, stored, clock = self._db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(vector)), 0), COALESCE(MAX(last_used), 0) FROM embeddings"
+        ).fetchone()
+        self._entries = entries
+        self._bytes = stored
+        # Logical clock for LRU order: survives restarts, unlike time.monotonic()
+        self._clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_many(self, container: str, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """Cached vectors for ``texts`` in order (None for a miss); hits become most recently used."""
+        keys = [text_key(text) for text in texts]
+        found = {}
+        with self._lock:
+            # Bounded IN lists: SQLite limits the number of bound parameters
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows = self._db.execute(
+                    f"SELECT text_key, vector FROM embeddings WHERE container = ? AND model = ? "
+                    f"AND text_key IN ({','.join('?' * len(chunk))})",
+                    (container, self.model, *chunk),
+                )
+                found.update(rows)
+            if found:
+                self._clock += 1
+                self._db.executemany(
+                    "UPDATE embeddings SET last_used = ? WHERE container = ? AND model = ? AND text_key = ?",
+                    [(self._clock, container, self.model, key) for key in found],
+                )
+                self._db.commit()
+            hits = sum(1 for key in keys if key in found)
+            self.hits += hits
+            self.misses += len(keys) - hits
+        return [array("f", found[key]).tolist() if key in found else None for key in keys]
+
+    def get(self, container: str, text: str) -> Optional[List[float]]:
+        return self.get_many(container, [text])[0]
+
+    def put_many(self, container: str, items: Iterable[Tuple[str, Sequence[float]]]) -> None:
+        """Store (text, vector) pairs, evicting least recently used entries if over ``max_bytes``."""
+        rows = {text_key(text): array("f", vector).tobytes() for text, vector in items}
+        if not rows:
+            return
+        with self._lock:
+            self._clock += 1
+            for key, blob in rows.items():
+                previous = self._db.execute(
+                    "SELECT LENGTH(vector) FROM embeddings WHERE container = ? AND model = ? AND text_key = ?",
+                    (container, self.model, key),
+                ).fetchone()
+                if previous:
+                    self._bytes -= previous[0]
+                    self._entries -= 1
+                self._db.execute(
+                    "INSERT OR REPLACE INTO embeddings (container, model, text_key, vector, last_used) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (container, self.model, key, blob, self._clock),
+                )
+                self._bytes += len(blob)
+                self._entries += 1
+            if self._bytes > self.max_bytes:
+                self._evict(int(self.max_bytes * 0.9))
+            self._db.commit()
+
+    def put(self, container: str, text: str, vector: Sequence[float]) -> None:
+        self.put_many(container, [(text, vector)])
+
+    def _evict(self, target_bytes: int) -> None:
+        """Delete least recently used entries until at most ``target_bytes`` are stored; caller holds the lock."""
+        while self._bytes > target_bytes and self._entries:
+            victims = self._db.execute(
+                "SELECT rowid, LENGTH(vector) FROM embeddings ORDER BY last_used LIMIT 256"
+            ).fetchall()
+            doomed = []
+            for rowid, size in victims:
+                if self._bytes <= target_bytes:
+                    break
+                doomed.append((rowid,))
+                self._bytes -= size
+                self._entries -= 1
+            self._db.executemany("DELETE FROM embeddings WHERE rowid = ?", doomed)
+            self.evictions += len(doomed)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM embeddings")
+            self._db.commit()
+            self._entries = 0
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "entries": self._entries,
+                "bytes_stored": self._bytes,
+                "max_bytes": self.max_bytes,
+                "evictions": self.evictions,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
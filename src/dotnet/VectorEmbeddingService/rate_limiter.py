@@ -0,0 +1,104 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Thread-safe request limiter shared by all upload workers.
+
+    Two limits apply to every request:
+
+    - a token bucket: tokens refill at ``rate`` per second up to ``burst``
+      (``rate=0`` disables it)
+    - a concurrency window (AIMD, like the crawler's adaptive throttle): it
+      grows by about one request per round of successful requests up to
+      ``max_concurrency`` and is halved when the server answers 429. The
+      number of requests still in flight at a 429 is remembered as a ceiling,
+      so the window does not keep probing (and pausing) past the server's
+      limit. The ceiling is lifted ``ceiling_hold`` seconds after the last
+      429: a 429 caused by the request rate or by other clients must not cap
+      concurrency for good
+
+    A 429 also calls ``pause`` with the server's Retry-After, so every worker
+    waits, not only the one that was rejected.
+    """
+
+    def __init__(self, rate: float = 0.0, burst: int = 1, max_concurrency: int = 0, ceiling_hold: float = 30.0):
+        if rate < 0:
+            raise ValueError("rate must not be negative")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.ceiling_hold = ceiling_hold
+        self._ceiling_until = 0.0
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._in_flight = 0
+        self._condition = threading.Condition()
+        self.set_max_concurrency(max_concurrency)
+        self.waited_seconds = 0.0
+        self.pauses = 0
+
+    def set_max_concurrency(self, max_concurrency: int) -> None:
+        """Limit concurrent requests (0 = no limit) and reset the window to it."""
+        with self._condition:
+            self.max_concurrency = max(0, max_concurrency)
+            self._window = float(self.max_concurrency)
+            self._ceiling = self._window
+
+    @property
+    def window(self) -> int:
+        return int(self._window)
+
+    def acquire(self) -> None:
+        """Block until the caller may send one request; pair with ``release``."""
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                elif self.max_concurrency and self._in_flight >= int(self._window):
+                    wait = None  # woken by release()
+                else:
+                    if self.rate:
+                        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                        self._updated = now
+                    if not self.rate or self._tokens >= 1:
+                        self._tokens -= 1 if self.rate else 0
+                        self._in_flight += 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+                started = time.monotonic()
+                self._condition.wait(wait)
+                self.waited_seconds += time.monotonic() - started
+
+    def release(self, success: bool = True) -> None:
+        """Finish a request; successful ones widen the concurrency window."""
+        with self._condition:
+            self._in_flight -= 1
+            if success and self.max_concurrency:
+                if self._ceiling < self.max_concurrency and time.monotonic() >= self._ceiling_until:
+                    # No 429 for a while: let the window probe up to max_concurrency again, one step at a time
+                    self._ceiling = float(self.max_concurrency)
+                self._window = min(self._ceiling, self._window + 1 / max(self._window, 1.0))
+            self._condition.notify()
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every worker for ``seconds`` (a Retry-After) and halve the concurrency window."""
+        with self._condition:
+            now = time.monotonic()
+            if self.max_concurrency:
+                # Requests still in flight were accepted alongside this rejected one
+                self._ceiling = max(1.0, min(self._ceiling, float(self._in_flight)))
+                self._ceiling_until = now + self.ceiling_hold
+            if now >= self._paused_until:
+                # One congestion event per pause: the other workers' 429s for the same burst do not shrink it again
+                self.pauses += 1
+                self._window = max(1.0, self._window / 2)
+            self._window = min(self._window, self._ceiling)
+            until = now + max(0.0, seconds)
+            if until > self._paused_until:
+                self._paused_until = until
+                # Start from an empty bucket so workers do not burst right after the pause
+                self._tokens = 0.0
+                self._updated = until
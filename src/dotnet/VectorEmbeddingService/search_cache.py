@@ -0,0 +1,87 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional, Tuple
+
+
+def normalize_query(query: str) -> str:
+    """Queries that differ only in case or whitespace share a cache entry."""
+    return " ".join(query.split()).casefold()
+
+
+class SearchCache:
+    """
+    In-memory cache of search results, bounded by age and by entry count.
+
+    Entries are keyed by (container, normalized query, top_k, threshold). An
+    entry older than ``ttl`` seconds is a miss; beyond ``max_entries`` the least
+    recently used entry is dropped. ``invalidate(container)`` makes every entry
+    of one container a miss and is called by the client after it uploads to or
+    deletes from that container; the TTL covers changes made by anyone else.
+    Safe to share between threads.
+
+    Cached result lists are returned as-is, so callers must not modify them.
+    """
+
+    def __init__(self, ttl: float = 300.0, max_entries: int = 4096):
+        if ttl <= 0 or max_entries < 1:
+            raise ValueError("ttl and max_entries must be positive")
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple, Tuple[float, List[Dict]]]" = OrderedDict()
+        # Bumped by invalidate(): O(1) however many entries the container has;
+        # the outdated entries are never hit again and age out of the LRU order
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def key(self, container: str, query: str, top_k: int, threshold: float) -> Tuple[Hashable, ...]:
+        return container, self._generations.get(container, 0), normalize_query(query), top_k, float(threshold)
+
+    def get(self, key: Tuple) -> Optional[List[Dict]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] > self.ttl:
+                del self._entries[key]
+                self.expired += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Tuple, results: List[Dict]) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), results)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, container: Optional[str] = None) -> None:
+        """Outdate the entries of ``container``, or drop every entry when it is None."""
+        with self._lock:
+            if container is None:
+                self._entries.clear()
+            else:
+                self._generations[container] = self._generations.get(container, 0) + 1
+            self.invalidations += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "expired": self.expired,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
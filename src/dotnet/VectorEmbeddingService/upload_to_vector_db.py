@@ -8,6 +8,13 @@ import argparse
 import json
 import logging
 import sys
+from pathlib import Path
+
+try:  # the repository root is on sys.path
+    from src.python.utils.record_store import RecordStore, RecordStoreError, is_record_store
+except ModuleNotFoundError:  # run as a script from this directory: add the repository root
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+    from src.python.utils.record_store import RecordStore, RecordStoreError, is_record_store
 from vector_api_client import VectorApiClient
 
 def setup_logging(verbose: bool = False):
@@ -21,8 +28,32 @@ def setup_logging(verbose: bool = False):
         ]
     )
 
+def validate_record_store(file_path: str) -> bool:
+    """Validate a record store from its index and first record, without reading the rest."""
+    try:
+        with RecordStore(file_path) as store:
+            if len(store) == 0:
+                print(f"Warning: {file_path} contains no events")
+                return True
+            first_event = store[0]
+            count = len(store)
+    except RecordStoreError as e:
+        print(f"Error: Invalid record store {file_path}: {e}")
+        return False
+    except Exception as e:
+        print(f"Error validating {file_path}: {e}")
+        return False
+
+    missing_fields = [field for field in ['title', 'description', 'url'] if field not in first_event]
+    if missing_fields:
+        print(f"Warning: Events may be missing required fields: {missing_fields}")
+    print(f"✓ Record store validated: {count} events found")
+    return True
+
 def validate_json_file(file_path: str) -> bool:
     """Validate that the JSON file exists and contains valid event data."""
+    if is_record_store(file_path):
+        return validate_record_store(file_path)
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
             data = json.load(f)
@@ -65,12 +96,13 @@ Examples:
   python upload_to_vector_db.py output.json
   python upload_to_vector_db.py --api-url http://localhost:5000 --verbose output.json
   python upload_to_vector_db.py --dry-run output.json
+  python upload_to_vector_db.py --sync --container artisan output.json
         """
     )
     
     parser.add_argument(
         'json_file',
-        help='Path to JSON file containing scraped event data'
+        help='Path to JSON file (or .rec record store) containing scraped event data'
     )
     
     parser.add_argument(
@@ -91,6 +123,56 @@ Examples:
         help='Enable verbose logging'
     )
     
+    parser.add_argument(
+        '--chunk-tokens',
+        type=int,
+        default=0,
+        help='Split page text into chunks of at most this many estimated tokens, e.g. 512; one page can then '
+             'fill several search results (0 = one document per page, default: 0)'
+    )
+    
+    parser.add_argument(
+        '--chunk-overlap',
+        type=int,
+        default=64,
+        help='Estimated tokens shared by consecutive chunks (default: 64)'
+    )
+    
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=64,
+        help='Maximum documents per bulk-upload request (default: 64)'
+    )
+    
+    parser.add_argument(
+        '--batch-bytes',
+        type=int,
+        default=4 * 1024 * 1024,
+        help='Maximum JSON bytes per bulk-upload request (default: 4 MiB)'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=4,
+        help='Concurrent bulk-upload requests (default: 4)'
+    )
+    
+    parser.add_argument(
+        '--max-rps',
+        type=float,
+        default=0.0,
+        help='Maximum bulk-upload requests per second over all workers (0 = unlimited, default: 0)'
+    )
+    
+    parser.add_argument(
+        '--sync',
+        action='store_true',
+        help='Upload only new and changed documents and delete stale ones, instead of deleting '
+             'the container and uploading everything (the first sync still uploads everything once)'
+    )
+    
     parser.add_argument(
         '--container',
         default='ffd',
@@ -99,6 +181,12 @@ Examples:
     )
     
     args = parser.parse_args()
+    if args.chunk_tokens > 0 and not 0 <= args.chunk_overlap < args.chunk_tokens:
+        parser.error("--chunk-overlap must be between 0 and --chunk-tokens - 1")
+    if args.batch_size < 1 or args.batch_bytes < 1:
+        parser.error("--batch-size and --batch-bytes must be positive")
+    if args.workers < 1 or args.max_rps < 0:
+        parser.error("--workers must be positive and --max-rps must not be negative")
     
     # Setup logging
     setup_logging(args.verbose)
@@ -119,7 +207,7 @@ Examples:
     
     # Initialize API client
     print(f"\n2. Connecting to Vector API: {args.api_url} (container: {args.container})")
-    client = VectorApiClient(args.api_url, default_container=args.container)
+    client = VectorApiClient(args.api_url, default_container=args.container, max_requests_per_second=args.max_rps)
     
     # Check service health
     if not client.health_check():
@@ -133,15 +221,23 @@ Examples:
     current_count = client.get_event_count()
     print(f"✓ Current database contains {current_count} events in container '{args.container}'")
     
-    # Delete all events from the container
-    print(f"\n3. Deleting all events from container '{args.container}'")
-    if not client.delete_all_events(args.container):
-        print(f"✗ Failed to delete all events from container '{args.container}'")
-        sys.exit(1)
+    if args.sync:
+        # Stale documents are deleted by the sync itself, after the uploads
+        print(f"\n3. Syncing container '{args.container}' (no delete-all)")
+    else:
+        # Delete all events from the container
+        print(f"\n3. Deleting all events from container '{args.container}'")
+        if not client.delete_all_events(args.container):
+            print(f"✗ Failed to delete all events from container '{args.container}'")
+            sys.exit(1)
     
     # Upload data
     print(f"\n4. Uploading data from {args.json_file} to container '{args.container}'")
-    result = client.upload_scraped_data(args.json_file)
+    result = client.upload_scraped_data(
+        args.json_file, chunk_tokens=args.chunk_tokens, chunk_overlap=args.chunk_overlap,
+        max_batch_docs=args.batch_size, max_batch_bytes=args.batch_bytes, workers=args.workers,
+        sync=args.sync
+    )
     
     if "error" in result:
         print(f"✗ Upload failed: {result['error']}")
@@ -154,6 +250,10 @@ Examples:
     print(f"Total events processed: {result.get('totalEvents', 0)}")
     print(f"Successful uploads: {result.get('successfulUpserts', 0)}")
     print(f"Failed uploads: {result.get('failedUpserts', 0)}")
+    if args.sync:
+        print(f"Unchanged (skipped): {result.get('unchanged', 0)}")
+        print(f"Stale deleted: {result.get('deleted', 0)} ({result.get('failedDeletes', 0)} failed)")
+    print(f"Requests sent: {result.get('requests', 0)}")
     
     if result.get('failedUpserts', 0) > 0:
         print(f"\n⚠️  {result.get('failedUpserts', 0)} events failed to upload")
@@ -162,7 +262,7 @@ Examples:
     # Final database stats
     final_count = client.get_event_count()
     new_events = final_count - current_count
-    print(f"\nDatabase now contains {final_count} events (+{new_events} new) in container '{args.container}'")
+    print(f"\nDatabase now contains {final_count} events ({new_events:+d}) in container '{args.container}'")
     
     print("\n✓ You can now use the vector chatbot to search these events!")
 
@@ -4,19 +4,69 @@ from typing import List, Dict, Optional
 import logging
 import time
 import os
+import sys
+import threading
+import hashlib
+import contextlib
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from email.utils import parsedate_to_datetime
+from pathlib import Path
 import urllib3
 
+try:
+    from src.dotnet.VectorEmbeddingService.embedding_cache import EmbeddingCache, text_key
+    from src.dotnet.VectorEmbeddingService.rate_limiter import RateLimiter
+    from src.dotnet.VectorEmbeddingService.search_cache import SearchCache, normalize_query
+    from src.python.scraper.frontier import canonicalize_url
+    from src.python.utils.chunker import chunk_records
+    from src.python.utils.delta_feed import content_hash
+    from src.python.utils.record_store import read_records
+except ModuleNotFoundError:  # run as a script from this directory: add the repository root
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+    from embedding_cache import EmbeddingCache, text_key
+    from rate_limiter import RateLimiter
+    from search_cache import SearchCache, normalize_query
+    from src.python.scraper.frontier import canonicalize_url
+    from src.python.utils.chunker import chunk_records
+    from src.python.utils.delta_feed import content_hash
+    from src.python.utils.record_store import read_records
+
 # Disable InsecureRequestWarning
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+
+def document_id(parent_url: str, chunk_index: int = 0) -> str:
+    """Stable document id: a hash of the canonical page URL plus the chunk's position.
+
+    The same page yields the same ids on every run, so a sync upload replaces
+    its documents in place instead of adding new ones.
+    """
+    digest = hashlib.blake2b(canonicalize_url(parent_url).encode("utf-8"), digest_size=16).hexdigest()
+    return f"{digest}-{chunk_index}"
+
+
 class VectorApiClient:
-    def __init__(self, base_url: str = "http://localhost:5000", default_container: str = "ffd"):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:5000",
+        default_container: str = "ffd",
+        max_requests_per_second: float = 0.0,
+        embedding_cache: Optional[EmbeddingCache] = None,
+        search_cache: Optional[SearchCache] = None,
+    ):
         """
         Initialize the Vector API client.
 
         Args:
             base_url: Base URL of the C# Vector Embedding Service
             default_container: Default container name
+            max_requests_per_second: Upload request rate shared by all upload
+                workers (0 = unlimited; 429 responses pause the workers regardless)
+            embedding_cache: Persistent cache consulted by get_embedding(s)
+                before calling the API (None = no caching)
+            search_cache: Result cache consulted by search_events and
+                search_many; invalidated per container by this client's uploads
+                and deletes (None = no caching)
         """
         self.base_url = base_url.rstrip('/')
         self.default_container = default_container
@@ -27,6 +77,13 @@ class VectorApiClient:
         })
         self.logger = logging.getLogger(__name__)
         self.jwt = None
+        self.embedding_cache = embedding_cache
+        self.search_cache = search_cache
+        self.rate_limiter = RateLimiter(max_requests_per_second, burst=max(1, int(max_requests_per_second)))
+        # requests.Session is not thread-safe: upload workers get their own session
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self._requests_sent = 0
         self._login_and_set_jwt()
 
     def _login_and_set_jwt(self):
@@ -60,7 +117,69 @@ class VectorApiClient:
         Returns:
             List of event documents
         """
+        return self.search_many([query], top_k=top_k, threshold=threshold, container=container, workers=1)[0]
+
+    def search_many(
+        self,
+        queries: List[str],
+        top_k: int = 5,
+        threshold: float = 0.7,
+        container: Optional[str] = None,
+        workers: int = 8,
+    ) -> List[List[Dict]]:
+        """
+        Run many searches concurrently, reusing cached results.
+
+        Queries that differ only in case or whitespace are sent once. Cached
+        queries are answered from ``self.search_cache``; the rest are sent
+        ``workers`` at a time through the shared rate limiter, so replaying a
+        query log is bounded by the server's parallelism rather than by one
+        round trip per query.
+
+        Args:
+            queries: Search query texts
+            top_k: Number of top results to return per query
+            threshold: Similarity threshold (0.0 to 1.0)
+            container: Container name
+            workers: Number of concurrent search requests
+
+        Returns:
+            One result list per query, in order (empty if the search failed)
+        """
         container = container or self.default_container
+        query_keys = [normalize_query(query) for query in queries]
+        unique: Dict[str, str] = {}
+        for key, query in zip(query_keys, queries):
+            unique.setdefault(key, query)
+
+        results: Dict[str, Optional[List[Dict]]] = {}
+        cache_keys = {}
+        for key, query in unique.items():
+            if self.search_cache is not None:
+                cache_keys[key] = self.search_cache.key(container, query, top_k, threshold)
+                results[key] = self.search_cache.get(cache_keys[key])
+            else:
+                results[key] = None
+        misses = [key for key, events in results.items() if events is None]
+
+        if misses:
+            # The pool size bounds this call's concurrency: the shared limiter's window is left to adapt
+            search = lambda key: self._search(unique[key], top_k, threshold, container)
+            if workers > 1 and len(misses) > 1:
+                with self._worker_pool(workers, "search") as pool:
+                    fetched = list(pool.map(search, misses))
+            else:
+                fetched = [search(key) for key in misses]
+            for key, events in zip(misses, fetched):
+                # Failed searches are not cached
+                if events is not None and self.search_cache is not None:
+                    self.search_cache.put(cache_keys[key], events)
+                results[key] = events
+
+        return [results[key] or [] for key in query_keys]
+
+    def _search(self, query: str, top_k: int, threshold: float, container: str) -> Optional[List[Dict]]:
+        """POST one search; returns None if it failed."""
         try:
             url = f"{self.base_url}/api/{container}/search"
             payload = {
@@ -70,7 +189,7 @@ class VectorApiClient:
             }
 
             self.logger.info(f"Searching events in container '{container}' with query: '{query}'")
-            response = self.session.post(url, json=payload)
+            response = self._post_limited(url, payload)
             response.raise_for_status()
 
             events = response.json()
@@ -78,10 +197,31 @@ class VectorApiClient:
 
         except requests.exceptions.RequestException as e:
             self.logger.error(f"Error searching events: {e}")
-            return []
+            return None
         except Exception as e:
             self.logger.error(f"Unexpected error searching events: {e}")
-            return []
+            return None
+
+    def _post_limited(self, url: str, payload: Dict, max_rate_limited: int = 10):
+        """POST ``payload`` through the shared rate limiter; a 429 pauses every worker and is retried."""
+        session = self._thread_session()
+        for _ in range(max_rate_limited + 1):
+            self.rate_limiter.acquire()
+            status = None
+            try:
+                response = session.post(url, json=payload)
+                status = response.status_code
+            finally:
+                self.rate_limiter.release(success=status is not None and status != 429)
+            if response.status_code != 429:
+                break
+            self.rate_limiter.pause(self._retry_after(response, 2))
+        return response
+
+    def _invalidate_searches(self, container: str) -> None:
+        """Cached search results of ``container`` are outdated once this client changed it."""
+        if self.search_cache is not None:
+            self.search_cache.invalidate(container)
 
     def get_embedding(self, text: str, container: Optional[str] = None) -> Optional[List[float]]:
         """
@@ -94,16 +234,60 @@ class VectorApiClient:
         Returns:
             Vector embedding as list of floats, or None if error
         """
+        return self.get_embeddings([text], container=container, workers=1)[0]
+
+    def get_embeddings(self, texts: List[str], container: Optional[str] = None, workers: int = 4) -> List[Optional[List[float]]]:
+        """
+        Get vector embeddings for many texts, reusing cached vectors.
+
+        Texts that differ only in whitespace share one embedding. Cached texts
+        are answered from ``self.embedding_cache``; only the misses are sent,
+        ``workers`` requests at a time, and stored in the cache. Cached vectors
+        come back as float32 values.
+
+        Args:
+            texts: Texts to embed
+            container: Container name
+            workers: Number of concurrent embedding requests
+
+        Returns:
+            One embedding (or None if it could not be fetched) per text, in order
+        """
         container = container or self.default_container
+        text_keys = [text_key(text) for text in texts]
+        unique: Dict[str, str] = {}
+        for key, text in zip(text_keys, texts):
+            unique.setdefault(key, text)
+        keys = list(unique)
+
+        if self.embedding_cache is not None:
+            vectors = dict(zip(keys, self.embedding_cache.get_many(container, list(unique.values()))))
+        else:
+            vectors = dict.fromkeys(keys)
+        misses = [key for key in keys if vectors[key] is None]
+
+        if misses:
+            # The pool size bounds this call's concurrency: the shared limiter's window is left to adapt
+            fetch = lambda key: self._fetch_embedding(unique[key], container)
+            if workers > 1 and len(misses) > 1:
+                with self._worker_pool(workers, "embedding") as pool:
+                    fetched = list(pool.map(fetch, misses))
+            else:
+                fetched = [fetch(key) for key in misses]
+            vectors.update(zip(misses, fetched))
+            if self.embedding_cache is not None:
+                self.embedding_cache.put_many(
+                    container, [(unique[key], vector) for key, vector in zip(misses, fetched) if vector is not None]
+                )
+
+        return [vectors[key] for key in text_keys]
+
+    def _fetch_embedding(self, text: str, container: str) -> Optional[List[float]]:
+        """POST one text to the embedding endpoint; returns None if it failed."""
         try:
-            url = f"{self.base_url}/api/{container}/embedding"
-            payload = {"text": text}
-
-            response = self.session.post(url, json=payload)
+            response = self._post_limited(f"{self.base_url}/api/{container}/embedding", {"text": text})
             response.raise_for_status()
-
-            embedding = response.json()
-            return embedding
+            return response.json()
 
         except requests.exceptions.RequestException as e:
             self.logger.error(f"Error getting embedding: {e}")
@@ -112,16 +296,38 @@ class VectorApiClient:
             self.logger.error(f"Unexpected error getting embedding: {e}")
             return None
 
-    def bulk_upload_events(self, events: List[Dict], container: Optional[str] = None) -> Dict:
+    def bulk_upload_events(
+        self,
+        events: List[Dict],
+        container: Optional[str] = None,
+        chunk_tokens: int = 0,
+        chunk_overlap: int = 64,
+        max_batch_docs: int = 64,
+        max_batch_bytes: int = 4 * 1024 * 1024,
+        workers: int = 1,
+    ) -> Dict:
         """
         Upload events in bulk to the vector database.
 
+        Events are packed into bulk-upload requests of at most ``max_batch_docs``
+        documents and ``max_batch_bytes`` of JSON. A request that fails as a whole
+        is split in half and retried until the failing document is isolated.
+        With ``workers`` > 1 that many requests are in flight at once; all
+        workers share ``self.rate_limiter``.
+
         Args:
             events: List of event dictionaries from scraper
             container: Container name
+            chunk_tokens: Split raw_text_content into chunks of at most this many
+                estimated tokens (0 uploads every page as one document)
+            chunk_overlap: Estimated tokens shared by consecutive chunks
+            max_batch_docs: Maximum documents per request
+            max_batch_bytes: Maximum serialized size of the documents in one request
+            workers: Number of concurrent upload requests
 
         Returns:
-            Upload result summary
+            Upload result summary; ``upsertedIds`` holds the document id of every
+            uploaded document in upload order (None where the upload failed)
         """
         container = container or self.default_container
         try:
@@ -129,39 +335,30 @@ class VectorApiClient:
 
             self.logger.warning(f"Upload started: {len(events)} events to '{container}'")
 
-            # Transform events to match API's expected format
-            transformed_events = []
-            for event in events:
-                transformed_event = {
-                    "title": event.get("title", ""),
-                    "description": event.get("description", ""),
-                    "url": event.get("url", ""),
-                    "socialmedia_links": event.get("socialmedia_links", []),
-                    "stand_numbers": event.get("stand_numbers", []) if isinstance(event.get("stand_numbers"), list) else [],
-                    "raw_text_content": event.get("raw_text_content", ""),
-                    "source_type": event.get("source_type", "")
-                }
-                transformed_events.append(transformed_event)
-
-            # Upload events one at a time with retry logic
-            successful_upserts = 0
-            failed_upserts = 0
-
-            for event in transformed_events:
-                if self.upload_event_with_retry(event, url):
-                    successful_upserts += 1
-                else:
-                    failed_upserts += 1
-                    # Keep error logs for actual failures
-                    self.logger.error(f"Failed to upload event: {event.get('title', 'Unknown')}")
+            if chunk_tokens > 0:
+                events = list(chunk_records(events, chunk_tokens, chunk_overlap))
+                self.logger.warning(f"Chunked into {len(events)} documents of at most {chunk_tokens} tokens")
+
+            # Serialized once for batching
+            documents = [self._serialize(self._transform_event(event)) for event in events]
+            self._requests_sent = 0
+            upserted_ids = self._upload_documents(url, documents, max_batch_docs, max_batch_bytes, workers)
+            self._invalidate_searches(container)
 
+            successful_upserts = sum(1 for document_id in upserted_ids if document_id is not None)
+            failed_upserts = len(documents) - successful_upserts
             result = {
                 "totalEvents": len(events),
                 "successfulUpserts": successful_upserts,
-                "failedUpserts": failed_upserts
+                "failedUpserts": failed_upserts,
+                "upsertedIds": upserted_ids,
+                "requests": self._requests_sent
             }
 
-            self.logger.warning(f"Upload completed: {successful_upserts}/{len(events)} successful, {failed_upserts} failed")
+            self.logger.warning(
+                f"Upload completed: {successful_upserts}/{len(events)} successful, {failed_upserts} failed "
+                f"({self._requests_sent} requests)"
+            )
             return result
 
         except requests.exceptions.RequestException as e:
@@ -171,37 +368,289 @@ class VectorApiClient:
             self.logger.error(f"Unexpected error uploading events: {e}")
             return {"error": str(e)}
 
-    def upload_event_with_retry(self, event, url, max_retries=3, backoff=2):
-        for attempt in range(max_retries):
+    @staticmethod
+    def _transform_event(event: Dict) -> Dict:
+        """Map a scraped event to the fields the API's bulk-upload expects."""
+        return {
+            "title": event.get("title", ""),
+            "description": event.get("description", ""),
+            "url": event.get("url", ""),
+            "socialmedia_links": event.get("socialmedia_links", []),
+            "stand_numbers": event.get("stand_numbers", []) if isinstance(event.get("stand_numbers"), list) else [],
+            "raw_text_content": event.get("raw_text_content", ""),
+            "source_type": event.get("source_type", ""),
+            "parent_url": event.get("parent_url", event.get("url", "")),
+            "chunk_index": event.get("chunk_index", 0)
+        }
+
+    @staticmethod
+    def _serialize(document: Dict) -> bytes:
+        return json.dumps(document, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def _upload_documents(
+        self, url: str, documents: List[bytes], max_batch_docs: int, max_batch_bytes: int, workers: int
+    ) -> List[Optional[str]]:
+        """Upload serialized documents in batches; returns one id (or None on failure) per document."""
+        upserted_ids: List[Optional[str]] = [None] * len(documents)
+        batches = self._pack_batches(documents, max_batch_docs, max_batch_bytes)
+        self.rate_limiter.set_max_concurrency(workers)
+        if workers <= 1:
+            for batch in batches:
+                self._upload_batch(url, batch, upserted_ids)
+        else:
+            self._upload_concurrently(url, batches, upserted_ids, workers)
+        return upserted_ids
+
+    def sync_events(
+        self,
+        events: List[Dict],
+        container: Optional[str] = None,
+        chunk_tokens: int = 0,
+        chunk_overlap: int = 64,
+        max_batch_docs: int = 64,
+        max_batch_bytes: int = 4 * 1024 * 1024,
+        workers: int = 1,
+    ) -> Dict:
+        """
+        Bring a container in line with ``events`` without re-uploading unchanged documents.
+
+        Every document gets a stable id from its canonical page URL and chunk
+        index, and a content hash of its uploaded fields. The container's
+        id -> hash manifest decides what happens:
+
+        - new ids and ids whose hash differs are uploaded (and re-embedded)
+        - ids with the same hash are skipped
+        - ids in the container but not in ``events`` are deleted, after the
+          uploads, so the container is never emptied while the sync runs
+
+        Documents uploaded before sync mode existed have random ids and no hash,
+        so the first sync uploads everything once and then deletes them.
+
+        Args:
+            events: List of event dictionaries from scraper
+            container: Container name
+            chunk_tokens: Split raw_text_content into chunks of at most this many
+                estimated tokens (0 uploads every page as one document)
+            chunk_overlap: Estimated tokens shared by consecutive chunks
+            max_batch_docs: Maximum documents per request
+            max_batch_bytes: Maximum serialized size of the documents in one request
+            workers: Number of concurrent upload and delete requests
+
+        Returns:
+            Sync result summary
+        """
+        container = container or self.default_container
+        try:
+            url = f"{self.base_url}/api/{container}/bulk-upload"
+
+            manifest = self.get_content_manifest(container)
+            if manifest is None:
+                return {"error": f"Could not read the document manifest of container '{container}'"}
+
+            self.logger.warning(f"Sync started: {len(events)} events against {len(manifest)} documents in '{container}'")
+
+            if chunk_tokens > 0:
+                events = list(chunk_records(events, chunk_tokens, chunk_overlap))
+                self.logger.warning(f"Chunked into {len(events)} documents of at most {chunk_tokens} tokens")
+
+            hashes: Dict[str, str] = {}
+            changed: List[bytes] = []
+            duplicates = 0
+            for event in events:
+                document = self._transform_event(event)
+                doc_id = document_id(document["parent_url"] or document["url"], document["chunk_index"])
+                if doc_id in hashes:
+                    # Two records for the same canonical page: keep the first, like the crawler's frontier
+                    duplicates += 1
+                    continue
+                hashes[doc_id] = content_hash(json.dumps(document, ensure_ascii=False, sort_keys=True))
+                if manifest.get(doc_id) != hashes[doc_id]:
+                    changed.append(self._serialize(dict(document, id=doc_id, content_hash=hashes[doc_id])))
+
+            stale = [doc_id for doc_id in manifest if doc_id not in hashes]
+            if not hashes and stale:
+                # An empty or broken crawl must not wipe the container
+                return {"error": "No documents to sync; refusing to delete every document in the container"}
+
+            self._requests_sent = 0
+            upserted_ids = self._upload_documents(url, changed, max_batch_docs, max_batch_bytes, workers)
+            successful_upserts = sum(1 for doc_id in upserted_ids if doc_id is not None)
+
+            deleted = 0
+            if stale:
+                with self._worker_pool(max(1, workers), "delete") as pool:
+                    deleted = sum(pool.map(lambda doc_id: self.delete_event(doc_id, container), stale))
+            if changed or stale:
+                self._invalidate_searches(container)
+
+            result = {
+                "totalEvents": len(hashes),
+                "unchanged": len(hashes) - len(changed),
+                "successfulUpserts": successful_upserts,
+                "failedUpserts": len(changed) - successful_upserts,
+                "upsertedIds": upserted_ids,
+                "deleted": deleted,
+                "failedDeletes": len(stale) - deleted,
+                "duplicates": duplicates,
+                "requests": self._requests_sent
+            }
+
+            self.logger.warning(
+                f"Sync completed: {result['unchanged']} unchanged, {successful_upserts}/{len(changed)} uploaded, "
+                f"{deleted}/{len(stale)} stale deleted ({self._requests_sent} upload requests)"
+            )
+            return result
+
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"Error syncing events: {e}")
+            return {"error": str(e)}
+        except Exception as e:
+            self.logger.error(f"Unexpected error syncing events: {e}")
+            return {"error": str(e)}
+
+    @staticmethod
+    def _pack_batches(documents: List[bytes], max_docs: int, max_bytes: int):
+        """Yield lists of (position, serialized document) bounded by count and size.
+
+        A document larger than ``max_bytes`` is sent on its own.
+        """
+        batch = []
+        size = 0
+        for position, document in enumerate(documents):
+            if batch and (len(batch) >= max_docs or size + len(document) + 1 > max_bytes):
+                yield batch
+                batch, size = [], 0
+            batch.append((position, document))
+            size += len(document) + 1
+        if batch:
+            yield batch
+
+    def _upload_concurrently(self, url: str, batches, upserted_ids: List[Optional[str]], workers: int) -> None:
+        """Upload ``batches`` with ``workers`` requests in flight; at most 2 * workers batches are queued."""
+        with self._worker_pool(workers, "upload") as pool:
+            pending = set()
+            for batch in batches:
+                if len(pending) >= 2 * workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                pending.add(pool.submit(self._upload_batch, url, batch, upserted_ids))
+            for future in pending:
+                future.result()
+
+    def _thread_session(self) -> requests.Session:
+        """The main session on the calling thread, a copy with the same headers on worker threads."""
+        if threading.current_thread() is threading.main_thread():
+            return self.session
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            session.headers.update(self.session.headers)
+        return session
+
+    @contextlib.contextmanager
+    def _worker_pool(self, workers: int, name: str):
+        """A thread pool whose workers each get a session, closed once the pool has shut down."""
+        sessions: List[requests.Session] = []
+
+        def start_worker():
+            sessions.append(self._thread_session())
+
+        try:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=name, initializer=start_worker) as pool:
+                yield pool
+        finally:
+            for session in sessions:
+                session.close()
+
+    @staticmethod
+    def _retry_after(response, default: float) -> float:
+        """Seconds to wait from a Retry-After header, in either its delay-seconds or its HTTP-date form."""
+        value = response.headers.get("Retry-After")
+        if not value:
+            return default
+        try:
+            return float(value)
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return default
+
+    def _post_batch(self, url: str, batch, max_retries: int = 3, backoff: int = 2, max_rate_limited: int = 10):
+        """POST one batch; returns the parsed response, or None if the request failed.
+
+        Server errors are retried ``max_retries`` times for single documents only:
+        a failing multi-document batch is split by the caller instead. A 429 does
+        not count as an attempt: it pauses the shared rate limiter for Retry-After
+        seconds, which holds back every worker, and the request is sent again.
+        """
+        body = b'{"events":[' + b",".join(document for _, document in batch) + b"]}"
+        attempts = max_retries if len(batch) == 1 else 1
+        failures = 0
+        rate_limited = 0
+        session = self._thread_session()
+        while True:
             try:
-                response = self.session.post(url, json={"events": [event]})
+                self.rate_limiter.acquire()
+                with self._stats_lock:
+                    self._requests_sent += 1
+                status = None
+                try:
+                    response = session.post(url, data=body)
+                    status = response.status_code
+                finally:
+                    self.rate_limiter.release(success=status is not None and status != 429)
                 if response.status_code == 200:
-                    result = response.json()
-                    successful_upserts = result.get("successfulUpserts", 0)
-                    failed_upserts = result.get("failedUpserts", 0)
-                    total_events = result.get("totalEvents", 0)
-                    upserted_ids = result.get("upsertedIds", [])
-
-                    # Only log if there are failed upserts for important events
-                    if failed_upserts > 0 and successful_upserts == 0:
-                        self.logger.error(f"Upload failed for event: {event.get('title', 'Unknown')}")
-
-                    # Consider it a success if we have any successful upserts OR if we have upserted IDs
-                    if successful_upserts > 0 or len(upserted_ids) > 0:
-                        return True
-                elif response.status_code == 429:
-                    retry_after = int(response.headers.get("Retry-After", backoff))
-                    self.logger.debug(f"Rate limited, waiting {retry_after} seconds")
-                    time.sleep(retry_after)
-                else:
-                    self.logger.error(f"Failed to upload event (attempt {attempt + 1}/{max_retries}): {response.status_code} - {response.text}")
-                    break
-            except Exception as e:
-                self.logger.error(f"Error during upload attempt {attempt + 1}: {str(e)}")
-                if attempt == max_retries - 1:
-                    break
-                time.sleep(backoff)
-        return False
+                    return response.json()
+                if response.status_code == 429 and rate_limited < max_rate_limited:
+                    rate_limited += 1
+                    retry_after = self._retry_after(response, backoff)
+                    self.logger.debug(f"Rate limited, pausing uploads for {retry_after} seconds")
+                    self.rate_limiter.pause(retry_after)
+                    continue
+                self.logger.error(
+                    f"Batch of {len(batch)} failed (attempt {failures + 1}/{attempts}): "
+                    f"{response.status_code} - {response.text[:200]}"
+                )
+                if response.status_code < 500:
+                    return None  # the payload itself is rejected; retrying the same body will not help
+            except requests.exceptions.RequestException as e:
+                self.logger.error(f"Error during batch upload attempt {failures + 1}/{attempts}: {str(e)}")
+            failures += 1
+            if failures >= attempts:
+                return None
+            time.sleep(backoff)
+
+    def _upload_batch(self, url: str, batch, upserted_ids: List[Optional[str]]) -> None:
+        """Upload ``batch`` and store the returned ids at their document positions.
+
+        A failed request is split in half and both halves are retried, so a
+        single bad document only fails itself.
+        """
+        result = self._post_batch(url, batch)
+        if result is None:
+            if len(batch) > 1:
+                middle = len(batch) // 2
+                self._upload_batch(url, batch[:middle], upserted_ids)
+                self._upload_batch(url, batch[middle:], upserted_ids)
+            else:
+                position, document = batch[0]
+                self.logger.error(f"Failed to upload event: {json.loads(document).get('url', 'Unknown')}")
+            return
+
+        ids = result.get("upsertedIds", [])
+        failed = set(result.get("failedIndexes") or ())
+        if not failed and len(ids) != len(batch):
+            # Older server without failedIndexes: ids only map back when every document succeeded
+            self.logger.error(f"{len(batch) - len(ids)} of {len(batch)} documents failed; ids cannot be mapped back")
+            return
+        succeeded = (position for index, (position, _) in enumerate(batch) if index not in failed)
+        for position, document_id in zip(succeeded, ids):
+            upserted_ids[position] = document_id
+        for index in sorted(failed):
+            self.logger.error(f"Failed to upload event: {json.loads(batch[index][1]).get('url', 'Unknown')}")
 
     def get_event_count(self, container: Optional[str] = None) -> int:
         """
@@ -255,6 +704,31 @@ class VectorApiClient:
             self.logger.error(f"Unexpected error getting all events: {e}")
             return []
 
+    def get_content_manifest(self, container: Optional[str] = None) -> Optional[Dict[str, str]]:
+        """
+        Get the id -> content hash map of every document in a container.
+
+        Args:
+            container: Container name
+
+        Returns:
+            Mapping of document id to content hash ("" for documents uploaded
+            without one), or None if the manifest could not be read
+        """
+        container = container or self.default_container
+        try:
+            url = f"{self.base_url}/api/{container}/manifest"
+            response = self.session.get(url)
+            response.raise_for_status()
+            return response.json()
+
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"Error getting content manifest: {e}")
+            return None
+        except Exception as e:
+            self.logger.error(f"Unexpected error getting content manifest: {e}")
+            return None
+
     def health_check(self, container: Optional[str] = None) -> bool:
         """
         Check if the API service is available.
@@ -273,26 +747,43 @@ class VectorApiClient:
         except:
             return False
 
-    def upload_scraped_data(self, json_file_path: str, container: Optional[str] = None) -> Dict:
+    def upload_scraped_data(
+        self,
+        json_file_path: str,
+        container: Optional[str] = None,
+        chunk_tokens: int = 0,
+        chunk_overlap: int = 64,
+        max_batch_docs: int = 64,
+        max_batch_bytes: int = 4 * 1024 * 1024,
+        workers: int = 1,
+        sync: bool = False,
+    ) -> Dict:
         """
-        Upload scraped data from JSON file to vector database.
+        Upload scraped data from a JSON file or record store to vector database.
 
         Args:
-            json_file_path: Path to JSON file with scraped events
+            json_file_path: Path to JSON file (or .rec record store) with scraped events
             container: Container name
+            chunk_tokens: Maximum estimated tokens per uploaded chunk (0 = no chunking)
+            chunk_overlap: Estimated tokens shared by consecutive chunks
+            max_batch_docs: Maximum documents per bulk-upload request
+            max_batch_bytes: Maximum serialized size of the documents in one request
+            workers: Number of concurrent upload requests
+            sync: Upload only new and changed documents and delete stale ones
+                (see ``sync_events``) instead of adding every document
 
         Returns:
             Upload result summary
         """
         container = container or self.default_container
         try:
-            with open(json_file_path, 'r', encoding='utf-8') as f:
-                events = json.load(f)
-
-            if not isinstance(events, list):
-                raise ValueError("JSON file must contain a list of events")
+            events = read_records(json_file_path)
 
-            return self.bulk_upload_events(events, container=container)
+            upload = self.sync_events if sync else self.bulk_upload_events
+            return upload(
+                events, container=container, chunk_tokens=chunk_tokens, chunk_overlap=chunk_overlap,
+                max_batch_docs=max_batch_docs, max_batch_bytes=max_batch_bytes, workers=workers
+            )
 
         except FileNotFoundError:
             error_msg = f"File not found: {json_file_path}"
@@ -317,3 +808,20 @@ class VectorApiClient:
         except Exception as e:
             self.logger.error(f"Error deleting all events: {e}")
             return False
+        finally:
+            # Even a failed request may have deleted documents
+            self._invalidate_searches(container)
+
+    def delete_event(self, event_id: str, container: Optional[str] = None) -> bool:
+        container = container or self.default_container
+        try:
+            url = f"{self.base_url}/api/{container}/{event_id}"
+            response = self._thread_session().delete(url)
+            response.raise_for_status()
+            return response.status_code == 204
+        except Exception as e:
+            self.logger.error(f"Error deleting event {event_id}: {e}")
+            return False
+        finally:
+            # Even a failed request may have deleted documents
+            self._invalidate_searches(container)
@@ -0,0 +1,98 @@
+"""Cross-page boilerplate detection for ``raw_text_content``.
+
+Page text is split into blocks by ``text_extractor.extract_page`` (runs of text
+under the nearest block-level element) and every block is fingerprinted by its
+DOM path plus its normalised text. A block that shows up on several pages of
+the same site (navigation menus, cookie banners, footers, ...) is boilerplate
+and is left out of ``raw_text_content``.
+
+Learning happens online while crawling: a block is stripped from a page once it
+has been seen on ``min_pages`` pages, or already on the second page when it sits
+inside a nav/header/footer/aside or a cookie/consent container. Pages replayed
+unchanged by an incremental crawl are counted through their stored block
+fingerprints (``observe``). The first ``warmup_pages`` pages are stripped before
+much has been learned, so the spider strips them again once the detector is
+``warmed_up`` (``restrip``).
+"""
+import hashlib
+import re
+
+BLOCK_TAGS = frozenset({
+    "address", "article", "aside", "blockquote", "body", "dd", "details", "div", "dl", "dt",
+    "fieldset", "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6",
+    "header", "li", "main", "nav", "ol", "p", "pre", "section", "summary", "table", "td", "th",
+    "tr", "ul",
+})
+STRUCTURAL_TAGS = frozenset({"nav", "header", "footer", "aside"})
+COOKIE_HINT_RE = re.compile(r"cookie|consent|gdpr|banner", re.IGNORECASE)
+
+
+class BoilerplateDetector:
+    """Learns which text blocks repeat across the pages of one site and strips them."""
+
+    def __init__(self, min_pages: int = 3, max_entries: int = 200_000, warmup_pages: int = 10):
+        self.min_pages = min_pages
+        self.max_entries = max_entries
+        self.warmup_pages = warmup_pages
+        self._page_counts: dict[int, int] = {}
+        self.pages_seen = 0
+        self.chars_original = 0
+        self.chars_kept = 0
+
+    @staticmethod
+    def _fingerprint(path: str, text: str) -> int:
+        data = (path + "\x00" + " ".join(text.split())).encode("utf-8")
+        return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
+
+    @property
+    def warmed_up(self) -> bool:
+        return self.pages_seen >= self.warmup_pages
+
+    def fingerprints(self, blocks: list[tuple[str, bool, str]]) -> list[int]:
+        """Fingerprints of one page's blocks, in block order (stored to ``observe`` the page later)."""
+        return [self._fingerprint(path, text) for path, _, text in blocks]
+
+    def observe(self, fingerprints: list[int]) -> None:
+        """Count one page's blocks without stripping anything (e.g. a page replayed unchanged)."""
+        for fp in set(fingerprints):
+            self._page_counts[fp] = self._page_counts.get(fp, 0) + 1
+        self.pages_seen += 1
+        if len(self._page_counts) > self.max_entries:
+            self._prune()
+
+    def strip(self, blocks: list[tuple[str, bool, str]], fingerprints: list[int] | None = None) -> tuple[str, str]:
+        """Count one page's blocks, then return (original text, text without boilerplate)."""
+        if fingerprints is None:
+            fingerprints = self.fingerprints(blocks)
+        self.observe(fingerprints)
+        original = " ".join(text for _, _, text in blocks).strip()
+        stripped = self._kept_text(blocks, fingerprints)
+        self.chars_original += len(original)
+        self.chars_kept += len(stripped)
+        return original, stripped
+
+    def restrip(self, blocks: list[tuple[str, bool, str]], previous: str) -> str:
+        """Strip an already counted page again with what has been learned since; ``previous`` is its earlier result."""
+        stripped = self._kept_text(blocks, self.fingerprints(blocks))
+        self.chars_kept += len(stripped) - len(previous)
+        return stripped
+
+    def _kept_text(self, blocks: list[tuple[str, bool, str]], fingerprints: list[int]) -> str:
+        kept = []
+        for (_, structural, text), fp in zip(blocks, fingerprints):
+            threshold = 2 if structural else self.min_pages
+            # A pruned block was seen on a single page: content, not boilerplate
+            if self._page_counts.get(fp, 1) < threshold:
+                kept.append(text)
+        return " ".join(kept).strip()
+
+    def _prune(self) -> None:
+        # Blocks seen on a single page are almost always page content; forget them first
+        self._page_counts = {fp: count for fp, count in self._page_counts.items() if count > 1}
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "boilerplate/blocks_tracked": len(self._page_counts),
+            "boilerplate/chars_original": self.chars_original,
+            "boilerplate/chars_kept": self.chars_kept,
+        }
@@ -0,0 +1,153 @@
+"""Per-site structured extractors evaluated against the DOM during the crawl.
+
+Extractors are registered per event_id and URL pattern and receive the lxml root
+of the response. Selectors are compiled once at import time (CSS is translated
+to XPath a single time) instead of being re-parsed for every page. Whatever an
+extractor returns is merged into the scraped item, so exhibitor and stand
+records no longer have to be re-derived from ``raw_text_content`` afterwards.
+
+Adding a show:
+
+    @registry.register("newshow", r"/exhibitors")
+    def newshow_exhibitors(root, url):
+        ...
+        return {"exhibitors": [...], "stand_numbers": {...}}
+"""
+import re
+from collections.abc import Callable
+
+from cssselect import GenericTranslator
+from lxml import etree
+
+Extractor = Callable[[etree._Element, str], dict]
+
+_translator = GenericTranslator()
+
+
+def css(selector: str, relative: bool = False) -> etree.XPath:
+    """Compile a CSS selector to a reusable XPath object."""
+    prefix = "descendant-or-self::" if not relative else "descendant::"
+    return etree.XPath(_translator.css_to_xpath(selector, prefix=prefix))
+
+
+_STRING = etree.XPath("normalize-space(string(.))")
+_OWN_TEXT = etree.XPath("normalize-space(text())")
+
+
+def text_of(elements: list, own_text: bool = False) -> str:
+    """Whitespace-normalised text of the first element (or '' if there is none)."""
+    if not elements:
+        return ""
+    return (_OWN_TEXT if own_text else _STRING)(elements[0])
+
+
+class ExtractorRegistry:
+    def __init__(self):
+        self._extractors: dict[str, list[tuple[re.Pattern, Extractor]]] = {}
+
+    def register(self, event_id: str, url_pattern: str = "") -> Callable[[Extractor], Extractor]:
+        pattern = re.compile(url_pattern)
+
+        def decorator(func: Extractor) -> Extractor:
+            self._extractors.setdefault(event_id.lower(), []).append((pattern, func))
+            return func
+
+        return decorator
+
+    def has_extractors(self, event_id: str) -> bool:
+        return event_id in self._extractors
+
+    def extract(self, event_id: str, url: str, root: etree._Element) -> dict:
+        """Run every extractor registered for ``event_id`` whose pattern matches ``url``."""
+        fields: dict = {}
+        for pattern, func in self._extractors.get(event_id, ()):
+            if pattern.search(url):
+                fields.update(func(root, url))
+        return fields
+
+
+registry = ExtractorRegistry()
+
+
+# ----------------------------------------------------------------------
+# Artisan XPO – list-of-exhibitors table
+# ----------------------------------------------------------------------
+_ARTISAN_ROW = css("div.exposantenLijst_exposantjs")
+_ARTISAN_NAME = css("div.exposantenLijst_exposantNaam", relative=True)
+_ARTISAN_CITY = css("div.exposantenLijst_exposantStad", relative=True)
+_ARTISAN_COUNTRY = css("div.exposantenLijst_exposantLand", relative=True)
+_ARTISAN_BOOTH = css("div.exposantenLijst_exposantPlaats", relative=True)
+
+
+@registry.register("artisan", r"list-of-exhibitors")
+def artisan_exhibitors(root: etree._Element, url: str) -> dict:
+    exhibitors = []
+    stand_numbers = {}
+    for row in _ARTISAN_ROW(root):
+        exhibitor = {
+            "name": text_of(_ARTISAN_NAME(row), own_text=True),
+            "city": text_of(_ARTISAN_CITY(row), own_text=True),
+            "country": text_of(_ARTISAN_COUNTRY(row), own_text=True),
+            "booth": text_of(_ARTISAN_BOOTH(row), own_text=True),
+        }
+        exhibitors.append(exhibitor)
+        if exhibitor["name"] and exhibitor["booth"]:
+            stand_numbers[exhibitor["name"]] = exhibitor["booth"]
+    return {"exhibitors": exhibitors, "stand_numbers": stand_numbers}
+
+
+# ----------------------------------------------------------------------
+# Flanders Flooring Days – exhibitor cards ending in a "Read more" link
+# ----------------------------------------------------------------------
+_FFD_READ_MORE = etree.XPath("//a[normalize-space(.)='Read more']")
+_FFD_HEADING = etree.XPath("(.//h2 | .//h3 | .//h4 | .//h5)[1]")
+_FFD_BOOTH = re.compile(r"Booth:\s*(\d+)")
+SHOWROOM = "Showroom on location"
+# A card never spans the page: the walk up from a link stops below these
+_PAGE_LEVEL = frozenset({"html", "body", "main"})
+
+
+def _own_containers(links: list) -> dict:
+    """Map each link to the largest ancestor that contains no other of ``links``: its card.
+
+    One walk up from every link counts the links below each ancestor, so the
+    lookup stays linear in links x depth. A link whose parent already holds
+    another link has no card of its own and is left out, and the walk never
+    goes past body or main, so a lone link does not make the page its card.
+    """
+    counts: dict = {}
+    for link in links:
+        for ancestor in link.iterancestors():
+            counts[ancestor] = counts.get(ancestor, 0) + 1
+    containers = {}
+    for link in links:
+        card = None
+        for ancestor in link.iterancestors():
+            if counts[ancestor] > 1 or ancestor.tag in _PAGE_LEVEL:
+                break
+            card = ancestor
+        if card is not None:
+            containers[link] = card
+    return containers
+
+
+@registry.register("ffd")
+def ffd_stand_numbers(root: etree._Element, url: str) -> dict:
+    cards = _own_containers(_FFD_READ_MORE(root)).values()
+    if len(cards) < 2:
+        # A single "Read more" is a teaser or a news link, not an exhibitor list
+        return {}
+    stand_numbers = {}
+    for card in cards:
+        # The company heading must be inside the card itself, never a page or section heading
+        company = text_of(_FFD_HEADING(card))
+        if not company:
+            continue
+        card_text = _STRING(card)
+        booth = _FFD_BOOTH.search(card_text)
+        if booth:
+            stand_numbers[company] = booth.group(1)
+        elif SHOWROOM in card_text:
+            stand_numbers[company] = SHOWROOM
+    # Nothing identified: return no field, so clean_json's text-based fallback still runs
+    return {"stand_numbers": stand_numbers} if stand_numbers else {}
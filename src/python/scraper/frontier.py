@@ -0,0 +1,120 @@
+import hashlib
+import sys
+from functools import lru_cache
+from urllib.parse import parse_qsl, quote, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only identify the campaign / click and never change the page
+TRACKING_PARAMS = frozenset({
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "mc_cid", "mc_eid",
+    "_ga", "_gl", "_hsenc", "_hsmi", "igshid", "ref", "ref_src",
+})
+TRACKING_PREFIXES = ("utm_", "pk_", "hsa_")
+
+DEFAULT_PORTS = {"http": "80", "https": "443"}
+
+
+def canonicalize_url(url: str) -> str:
+    """Return the canonical form of ``url`` used for duplicate detection.
+
+    - scheme and host are lower-cased, default ports are dropped
+    - the fragment is removed
+    - tracking parameters (utm_*, fbclid, gclid, ...) are removed and the
+      remaining query parameters are sorted
+    - a trailing slash is dropped from every path except the root, and an
+      empty path becomes ``/``
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port is not None and str(parts.port) != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+
+    path = parts.path or "/"
+    if len(path) > 1 and path.endswith("/"):
+        path = path.rstrip("/") or "/"
+
+    query = ""
+    if parts.query:
+        params = [
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+        ]
+        query = urlencode(sorted(params), quote_via=quote)
+
+    return urlunsplit((scheme, host, path, query, ""))
+
+
+@lru_cache(maxsize=65536)
+def url_fingerprint(url: str) -> int:
+    """64-bit fingerprint of the canonical URL; memoized since the same links are checked from every page."""
+    digest = hashlib.blake2b(canonicalize_url(url).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+class UrlFrontier:
+    """Tracks which pages have been scheduled and downloaded during a crawl.
+
+    URLs are canonicalised and reduced to 64-bit fingerprints, so memory grows
+    with a small int per page instead of a full URL string per page. The
+    frontier also counts how many downloads were wasted on pages that had
+    already been processed (e.g. two URLs redirecting to the same page).
+    """
+
+    def __init__(self):
+        self._scheduled: set[int] = set()
+        self._downloaded: set[int] = set()
+        self.duplicates_skipped = 0
+        self.wasted_downloads = 0
+
+    @staticmethod
+    def fingerprint(url: str) -> int:
+        return url_fingerprint(url)
+
+    def schedule(self, url: str) -> bool:
+        """Register ``url`` for download. Returns False if it is already known."""
+        fp = self.fingerprint(url)
+        if fp in self._scheduled:
+            self.duplicates_skipped += 1
+            return False
+        self._scheduled.add(fp)
+        return True
+
+    def is_duplicate(self, url: str) -> bool:
+        """True (and counted as a skipped duplicate) if ``url`` was already scheduled."""
+        if self.fingerprint(url) in self._scheduled:
+            self.duplicates_skipped += 1
+            return True
+        return False
+
+    def mark_downloaded(self, url: str) -> bool:
+        """Record a downloaded page. Returns False if the download was wasted on a known page."""
+        fp = self.fingerprint(url)
+        if fp in self._downloaded:
+            self.wasted_downloads += 1
+            return False
+        self._downloaded.add(fp)
+        self._scheduled.add(fp)  # redirects may land on a URL we never scheduled
+        return True
+
+    @property
+    def downloaded(self) -> int:
+        return len(self._downloaded)
+
+    def memory_bytes(self) -> int:
+        """Approximate memory held by the fingerprint sets (containers + int objects)."""
+        size = sys.getsizeof(self._scheduled) + sys.getsizeof(self._downloaded)
+        size += sum(sys.getsizeof(fp) for fp in self._scheduled)
+        size += sum(sys.getsizeof(fp) for fp in self._downloaded)
+        return size
+
+    def stats(self) -> dict[str, int | float]:
+        total_downloads = self.downloaded + self.wasted_downloads
+        return {
+            "frontier/scheduled": len(self._scheduled),
+            "frontier/downloaded": self.downloaded,
+            "frontier/duplicates_skipped": self.duplicates_skipped,
+            "frontier/wasted_downloads": self.wasted_downloads,
+            "frontier/wasted_ratio": round(self.wasted_downloads / total_downloads, 4) if total_downloads else 0.0,
+            "frontier/memory_bytes": self.memory_bytes(),
+        }
@@ -0,0 +1,107 @@
+import re
+from functools import lru_cache
+from urllib.parse import urlsplit
+
+from src.python.scraper.frontier import UrlFrontier
+
+# Simple 2-letter lang codes; could be expanded
+KNOWN_LANG_CODES = ("en", "nl", "fr", "de")
+# Matches 'en', 'en-us', 'en_US', 'fr-be', etc.
+LANG_SEGMENT_RE = re.compile(r"^([a-z]{2})(?:[-_][a-z]{2})?$", re.IGNORECASE)
+
+# Variant ranks: lower wins. Other languages have no rank and are never crawled.
+RANK_EN = 0
+RANK_DEFAULT = 1
+
+# Navigation links repeat on every page, so the per-path helpers below are memoized.
+# The bound keeps memory flat on sites with many unique detail pages.
+PATH_CACHE_SIZE = 16384
+
+
+@lru_cache(maxsize=PATH_CACHE_SIZE)
+def path_language(path: str) -> str | None:
+    """Return the language segment a path starts with, e.g. '/fr-be/page' -> 'fr-be'."""
+    first_segment = path.strip("/").split("/", 1)[0]
+    match = LANG_SEGMENT_RE.match(first_segment)
+    if match and match.group(1).lower() in KNOWN_LANG_CODES:
+        return first_segment.lower()
+    return None
+
+
+@lru_cache(maxsize=PATH_CACHE_SIZE)
+def strip_language(path: str) -> str:
+    """Remove a leading language segment: '/en/foo' and '/nl-be/foo' both become '/foo'."""
+    if path_language(path) is None:
+        return path
+    segments = path.strip("/").split("/")
+    return "/" + "/".join(segments[1:])
+
+
+@lru_cache(maxsize=PATH_CACHE_SIZE)
+def variant_key(url: str) -> tuple[str, int | None]:
+    """Return (base key, rank) for a URL.
+
+    The base key is the path without its language segment plus the query string,
+    so participant detail pages like /participant/?id=123 remain distinct.
+    """
+    parts = urlsplit(url)
+    query_part = ("?" + parts.query) if parts.query else ""
+    lang = path_language(parts.path)
+    if lang is None:
+        return parts.path + query_part, RANK_DEFAULT
+    base_key = strip_language(parts.path) + query_part
+    primary_lang = re.split(r"[-_]", lang, maxsplit=1)[0]  # en-us -> en
+    return base_key, (RANK_EN if primary_lang == "en" else None)
+
+
+class LanguageVariantIndex:
+    """Crawl-global index of base path -> chosen language variant.
+
+    The first EN or language-less variant of a page that is seen anywhere on the
+    site is scheduled. A later EN variant upgrades a language-less choice and
+    cancels it if it has not been downloaded yet; lower-priority variants that
+    arrive after a choice was made are never scheduled.
+    """
+
+    def __init__(self):
+        self._chosen: dict[str, tuple[int, str]] = {}
+        self._cancelled: set[int] = set()
+        self.upgrades = 0
+        self.skipped_variants = 0
+
+    def __len__(self) -> int:
+        return len(self._chosen)
+
+    def offer(self, url: str) -> bool:
+        """Register a discovered link. Returns True if it should be scheduled."""
+        base_key, rank = variant_key(url)
+        if rank is None:
+            # Other languages (nl, fr, de, ...) are only useful as evidence; skip them
+            self.skipped_variants += 1
+            return False
+
+        current = self._chosen.get(base_key)
+        if current is None:
+            self._chosen[base_key] = (rank, url)
+            return True
+        current_rank, current_url = current
+        if rank >= current_rank:
+            if url != current_url:
+                self.skipped_variants += 1
+            return False
+
+        # Better variant found: switch to it and cancel the pending lower-priority request
+        self._chosen[base_key] = (rank, url)
+        self._cancelled.add(UrlFrontier.fingerprint(current_url))
+        self.upgrades += 1
+        return True
+
+    def is_cancelled(self, url: str) -> bool:
+        return bool(self._cancelled) and UrlFrontier.fingerprint(url) in self._cancelled
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "language/base_paths": len(self._chosen),
+            "language/upgrades": self.upgrades,
+            "language/skipped_variants": self.skipped_variants,
+        }
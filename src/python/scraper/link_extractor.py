@@ -0,0 +1,80 @@
+from functools import lru_cache
+from urllib.parse import urljoin, urlsplit
+
+from src.python.scraper.frontier import UrlFrontier
+from src.python.scraper.language_index import PATH_CACHE_SIZE, RANK_EN, LanguageVariantIndex, variant_key
+
+
+class LinkExtractor:
+    """Resolves, filters and prioritizes the links of a page for one site.
+
+    Navigation menus and footers put the same hrefs on every page, so the
+    expensive steps are memoized in bounded LRU caches:
+
+    - root-relative (``/en/foo``) and absolute hrefs resolve independently of
+      the page path, so their ``urljoin`` result is cached per site origin;
+      only page-relative hrefs (``foo``, ``../bar``) are joined per page
+    - the on-site / non-PDF decision is cached per resolved URL, so every URL
+      is split once
+    - ``select`` drops links the frontier already knows before computing any
+      language variant, and computes each variant key once (the key itself is
+      cached in language_index)
+    """
+
+    def __init__(self, frontier: UrlFrontier, language_index: LanguageVariantIndex, netloc: str,
+                 cache_size: int = PATH_CACHE_SIZE):
+        self.frontier = frontier
+        self.language_index = language_index
+        self.netloc = netloc
+        self._join = lru_cache(maxsize=cache_size)(urljoin)
+        self._accepts = lru_cache(maxsize=cache_size)(self._is_followable)
+        self.pdf_skipped = 0
+
+    def _is_followable(self, url: str) -> bool:
+        parts = urlsplit(url)
+        if parts.path.lower().endswith(".pdf"):
+            self.pdf_skipped += 1  # counted once per distinct URL
+            return False
+        return parts.scheme in {"http", "https"} and parts.netloc == self.netloc
+
+    def extract(self, base_url: str, hrefs: list[str]) -> list[str]:
+        """Sorted, unique on-site links of a page, including already visited ones.
+
+        ``base_url`` is what ``response.urljoin`` resolves against (the page URL
+        or its ``<base href>``).
+        """
+        parts = urlsplit(base_url)
+        origin = f"{parts.scheme}://{parts.netloc}/"
+        links = set()
+        for href in dict.fromkeys(hrefs):  # the same href often appears several times per page
+            if href.startswith(("/", "http://", "https://")):
+                full_url = self._join(origin, href)
+            else:
+                full_url = urljoin(base_url, href)
+            if self._accepts(full_url):
+                links.add(full_url)
+        return sorted(links)
+
+    def select(self, links: list[str]) -> list[str]:
+        """Links to schedule: unknown to the frontier and the preferred language variant."""
+        fresh = [url for url in links if not self.frontier.is_duplicate(url)]
+        # Variants are resolved against the crawl-global index rather than only the links
+        # of this response: /nl/foo is skipped if /en/foo was scheduled from any other page,
+        # and a pending /foo is cancelled as soon as /en/foo shows up anywhere.
+        # EN variants go first so a page's own /en/ link wins before its /foo sibling is scheduled
+        fresh.sort(key=lambda link: variant_key(link)[1] != RANK_EN)
+        return [url for url in fresh if self.language_index.offer(url)]
+
+    def stats(self) -> dict[str, int | float]:
+        join, accepts, variants = self._join.cache_info(), self._accepts.cache_info(), variant_key.cache_info()
+        return {
+            "links/pdf_skipped": self.pdf_skipped,
+            "links/join_cache_hit_ratio": _hit_ratio(join),
+            "links/url_cache_hit_ratio": _hit_ratio(accepts),
+            "links/variant_cache_hit_ratio": _hit_ratio(variants),
+        }
+
+
+def _hit_ratio(info) -> float:
+    lookups = info.hits + info.misses
+    return round(info.hits / lookups, 4) if lookups else 0.0
@@ -1,20 +1,196 @@
+import time
+from email.utils import parsedate_to_datetime
+
 from scrapy import signals
+from scrapy.exceptions import IgnoreRequest
+from scrapy.utils.httpobj import urlparse_cached
+
+
+class _DomainWindow:
+    """Congestion state of one download slot (normally one domain)."""
+
+    def __init__(self, window: float):
+        self.window = window
+        self.error_rate = 0.0  # EWMA of 5xx / timeouts
+        self.last_decrease = 0.0
+        self.blocked_until = 0.0
+        self.base_delay: float | None = None
+
 
 class KortrijkXpoDownloaderMiddleware:
+    """Per-domain adaptive concurrency controller (AIMD).
+
+    Every domain starts with ADAPTIVE_THROTTLE_START_WINDOW concurrent requests.
+    Each fast, successful response grows the window additively (+1 per window's
+    worth of responses) up to ADAPTIVE_THROTTLE_MAX_WINDOW. A 429, a 5xx rate
+    above ADAPTIVE_THROTTLE_ERROR_RATE or a latency above
+    ADAPTIVE_THROTTLE_TARGET_LATENCY shrinks it multiplicatively; at most once
+    per round trip, so a burst of errors from one window counts once.
+    Retry-After headers pause the whole domain through the slot delay.
+
+    The window is applied to Scrapy's download slot and published to the crawl
+    stats as ``throttle/window/<domain>``.
+
+    Must run closer to the downloader than RetryMiddleware (priority > 550),
+    otherwise 429/5xx responses are turned into retries before we see them.
+    """
+
+    # Smoothing factor of the error-rate moving average
+    ERROR_EWMA_ALPHA = 0.1
+
+    def __init__(self, stats, *, enabled: bool = True, start_window: int = 4, min_window: int = 1,
+                 max_window: int = 32, target_latency: float = 2.0, error_rate: float = 0.2,
+                 backoff: float = 0.5):
+        self.stats = stats
+        self.enabled = enabled
+        self.start_window = start_window
+        self.min_window = min_window
+        self.max_window = max_window
+        self.target_latency = target_latency
+        self.error_rate_threshold = error_rate
+        self.backoff = backoff
+        self._domains: dict[str, _DomainWindow] = {}
+
     @classmethod
     def from_crawler(cls, crawler):
-        s = cls()
+        settings = crawler.settings
+        max_window = settings.getint("ADAPTIVE_THROTTLE_MAX_WINDOW") or settings.getint("CONCURRENT_REQUESTS_PER_DOMAIN")
+        s = cls(
+            crawler.stats,
+            enabled=settings.getbool("ADAPTIVE_THROTTLE_ENABLED", True),
+            start_window=min(settings.getint("ADAPTIVE_THROTTLE_START_WINDOW", 4), max_window),
+            min_window=settings.getint("ADAPTIVE_THROTTLE_MIN_WINDOW", 1),
+            max_window=max_window,
+            target_latency=settings.getfloat("ADAPTIVE_THROTTLE_TARGET_LATENCY", 2.0),
+            error_rate=settings.getfloat("ADAPTIVE_THROTTLE_ERROR_RATE", 0.2),
+            backoff=settings.getfloat("ADAPTIVE_THROTTLE_BACKOFF", 0.5),
+        )
         crawler.signals.connect(s.spider_opened, signal=signals.spider_opened)
         return s
 
     def process_request(self, request, spider):
+        # Drop requests whose page was superseded by a preferred language variant after scheduling
+        is_superseded = getattr(spider, "is_superseded", None)
+        if is_superseded is not None and is_superseded(request.url):
+            spider.crawler.stats.inc_value("language/cancelled_requests")
+            raise IgnoreRequest(f"Superseded by a preferred language variant: {request.url}")
+        if self.enabled:
+            # The slot only exists after the first request to a domain; apply the window from then on
+            key = self._slot_key(request)
+            self._apply(spider, key, self._state(key))
         return None
 
     def process_response(self, request, response, spider):
+        if not self.enabled:
+            return response
+        key = self._slot_key(request)
+        state = self._state(key)
+        now = time.monotonic()
+        latency = request.meta.get("download_latency") or 0.0
+
+        if response.status == 429 or (response.status == 503 and b"Retry-After" in response.headers):
+            self._record_error(state, True)
+            self._decrease(state, now, latency)
+            retry_after = self._retry_after(response)
+            if retry_after:
+                state.blocked_until = max(state.blocked_until, now + retry_after)
+                self._pause(spider, key, state, retry_after)
+            self.stats.inc_value("throttle/rate_limited")
+        elif response.status >= 500:
+            self._record_error(state, True)
+            if state.error_rate > self.error_rate_threshold:
+                self._decrease(state, now, latency)
+        else:
+            self._record_error(state, False)
+            if latency > self.target_latency:
+                self._decrease(state, now, latency)
+            else:
+                # Additive increase: +1 after a full window of good responses
+                state.window = min(self.max_window, state.window + 1.0 / state.window)
+            if state.base_delay is not None and now >= state.blocked_until:
+                self._resume(spider, key, state)
+
+        self._apply(spider, key, state)
         return response
 
     def process_exception(self, request, exception, spider):
-        pass
+        if self.enabled:
+            # Timeouts and connection errors count as overload, like a 5xx
+            key = self._slot_key(request)
+            state = self._state(key)
+            self._record_error(state, True)
+            if state.error_rate > self.error_rate_threshold:
+                self._decrease(state, time.monotonic(), request.meta.get("download_latency") or 0.0)
+            self._apply(spider, key, state)
+        return None
 
     def spider_opened(self, spider):
-        spider.logger.info('Spider opened: %s' % spider.name) 
\ No newline at end of file
+        spider.logger.info('Spider opened: %s' % spider.name)
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _slot_key(request) -> str:
+        # Same key Scrapy's downloader uses to pick a slot
+        return request.meta.get("download_slot") or urlparse_cached(request).hostname or ""
+
+    def _state(self, key: str) -> _DomainWindow:
+        state = self._domains.get(key)
+        if state is None:
+            state = self._domains[key] = _DomainWindow(float(self.start_window))
+        return state
+
+    def _record_error(self, state: _DomainWindow, is_error: bool) -> None:
+        state.error_rate += self.ERROR_EWMA_ALPHA * ((1.0 if is_error else 0.0) - state.error_rate)
+
+    def _decrease(self, state: _DomainWindow, now: float, latency: float) -> None:
+        # Only back off once per round trip: responses already in flight reflect the old window
+        if now - state.last_decrease < max(latency, 1.0):
+            return
+        state.window = max(float(self.min_window), state.window * self.backoff)
+        state.last_decrease = now
+        self.stats.inc_value("throttle/decreases")
+
+    @staticmethod
+    def _retry_after(response) -> float | None:
+        value = response.headers.get(b"Retry-After")
+        if not value:
+            return None
+        value = value.decode("latin-1").strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _slot(spider, key: str):
+        engine = getattr(spider.crawler, "engine", None)
+        if engine is None:
+            return None
+        return engine.downloader.slots.get(key)
+
+    def _pause(self, spider, key: str, state: _DomainWindow, seconds: float) -> None:
+        slot = self._slot(spider, key)
+        if slot is None:
+            return
+        if state.base_delay is None:
+            state.base_delay = slot.delay
+        slot.delay = max(slot.delay, seconds)
+        self.stats.max_value("throttle/retry_after_seconds", seconds)
+
+    def _resume(self, spider, key: str, state: _DomainWindow) -> None:
+        slot = self._slot(spider, key)
+        if slot is not None:
+            slot.delay = state.base_delay
+        state.base_delay = None
+
+    def _apply(self, spider, key: str, state: _DomainWindow) -> None:
+        window = max(self.min_window, int(state.window))
+        slot = self._slot(spider, key)
+        if slot is not None and slot.concurrency != window:
+            slot.concurrency = window
+        self.stats.set_value(f"throttle/window/{key}", window)
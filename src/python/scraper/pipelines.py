@@ -0,0 +1,123 @@
+import copy
+from pathlib import Path
+
+from scrapy import signals
+
+from src.python.utils.clean_json import clean_record
+from src.python.utils.delta_feed import DeltaFeedWriter
+from src.python.utils.json_io import JsonArrayWriter, dumps
+from src.python.utils.near_duplicates import NearDuplicateDetector, duplicates_path
+from src.python.utils.record_store import SUFFIX as STORE_SUFFIX, RecordStoreWriter
+
+
+class StreamCleaningPipeline:
+    """Clean items while they are scraped and write ``<feed>_cleaned.json`` directly.
+
+    Applies the same transformations as ``clean_json.py -c --remove-non-ascii``
+    (whitespace collapsing, ASCII folding, stand numbers) to one item at a
+    time, so the raw feed never has to be re-read and re-parsed after the crawl.
+    The raw item is passed on untouched for the regular feed export.
+
+    Settings:
+        CLEANED_FEED_URI     output path (default: data/processed/<first FEEDS stem>_cleaned.json)
+        CLEANED_FEED_INDENT  indent the cleaned feed (default: True)
+        CLEANED_FEED_FORMAT  "json" (default) or "store" for an indexed record store (.rec)
+        CLEANED_FEED_DEDUPE  leave near-duplicate pages out of the cleaned feed and list
+                             them in <output>_duplicates.json (default: False)
+
+    With ``-a delta=1`` the delta feeds are written as well; the removed feed and
+    the snapshot only when the crawl finished (not after shutdown or closespider_*).
+    """
+
+    PROCESSED_DIR = Path("data/processed")
+
+    def __init__(self, output_uri: str | None, indent: bool, feed_format: str = "json", dedupe: bool = False):
+        self.output_uri = output_uri
+        self.indent = indent
+        self.feed_format = feed_format
+        self._detector = NearDuplicateDetector() if dedupe else None
+        self.output_path: Path | None = None
+        self._file = None
+        self._writer: JsonArrayWriter | RecordStoreWriter | None = None
+        self._delta: DeltaFeedWriter | None = None
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        feed_format = crawler.settings.get("CLEANED_FEED_FORMAT", "json")
+        if feed_format not in ("json", "store"):
+            raise ValueError(f"CLEANED_FEED_FORMAT must be 'json' or 'store', not {feed_format!r}")
+        output_uri = crawler.settings.get("CLEANED_FEED_URI")
+        if not output_uri:
+            feeds = crawler.settings.getdict("FEEDS")
+            if feeds:
+                # The FEEDS setting structure is {filename: {settings}}
+                raw_feed = Path(str(next(iter(feeds.keys()))))
+                suffix = STORE_SUFFIX if feed_format == "store" else ".json"
+                output_uri = str(cls.PROCESSED_DIR / (raw_feed.with_suffix("").name + "_cleaned" + suffix))
+        pipeline = cls(
+            output_uri,
+            crawler.settings.getbool("CLEANED_FEED_INDENT", True),
+            feed_format,
+            crawler.settings.getbool("CLEANED_FEED_DEDUPE", False),
+        )
+        # close_spider() is not told why the crawl ended; the delta feeds need to know
+        crawler.signals.connect(pipeline.spider_closed, signal=signals.spider_closed)
+        return pipeline
+
+    def open_spider(self, spider):
+        if not self.output_uri:
+            spider.logger.warning("No output feed configured; cleaned feed will not be written")
+            return
+        self.output_path = Path(self.output_uri)
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.feed_format == "store":
+            self._writer = RecordStoreWriter(self.output_path)
+        else:
+            self._file = open(self.output_path, "w", encoding="utf-8")
+            self._writer = JsonArrayWriter(self._file, self.indent)
+        if getattr(spider, "delta", False):
+            self._delta = DeltaFeedWriter(self.output_path, indent=self.indent)
+
+    def process_item(self, item, spider):
+        if self._writer is None:
+            return item
+        # clean_record works in place; nested exhibitor lists must not leak into the raw feed
+        cleaned = clean_record(copy.deepcopy(dict(item)))
+        if self._detector is not None and self._detector.check(cleaned) is not None:
+            if self._delta is not None:
+                # Still on the site: its document must not end up in the removed feed
+                self._delta.keep(cleaned)
+            return item
+        self._writer.write(cleaned)
+        if self._delta is not None:
+            self._delta.write(cleaned)
+        return item
+
+    def close_spider(self, spider):
+        if self._writer is None:
+            return
+        self._writer.close()
+        if self._file is not None:
+            self._file.close()
+        spider.logger.warning(
+            f"Cleaned feed for {spider.event_id}: {self._writer.count} items, "
+            f"{self._writer.bytes_written / 1024:.1f} KB → {self.output_path}"
+        )
+        if self._detector is not None:
+            path = duplicates_path(self.output_path)
+            path.write_text(dumps(self._detector.duplicate_clusters(), self.indent), encoding="utf-8")
+            spider.logger.warning(f"Near-duplicates for {spider.event_id}: {self._detector.summary()}")
+
+    def spider_closed(self, spider, reason):
+        if self._delta is None:
+            return
+        # Only a finished crawl has seen every URL: after shutdown, closespider_* or a
+        # failure, the missing pages would be listed as removed and deleted downstream
+        finished = reason == "finished"
+        self._delta.close(complete=finished)
+        if finished:
+            spider.logger.warning(f"Delta feeds for {spider.event_id}: {self._delta.summary()}")
+        else:
+            spider.logger.warning(
+                f"Crawl for {spider.event_id} ended early ({reason}): removed feed and snapshot not written"
+            )
@@ -0,0 +1,220 @@
+import cProfile
+import heapq
+import re
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from src.python.scraper.language_index import strip_language
+
+# Parse phases in report order; "download" is Scrapy's download latency, the rest run in parse()
+PHASES = ("download", "validators", "extract", "boilerplate", "extractors", "links", "filter")
+# Histogram bucket upper bounds in milliseconds; the last bucket is open-ended
+BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+_NUMERIC_SEGMENT_RE = re.compile(r"^\d+$|^[0-9a-f]{8,}$|^\d+[-_]")
+
+
+def url_pattern(url: str, depth: int = 2) -> str:
+    """Group URLs for the report: language stripped, ids replaced, at most ``depth`` segments.
+
+    '/en/exhibitor/142' -> '/exhibitor/{id}', '/nl/news/2024/some-title' -> '/news/{id}/...'
+    """
+    segments = [segment for segment in strip_language(urlsplit(url).path).split("/") if segment]
+    pattern = ["{id}" if _NUMERIC_SEGMENT_RE.match(segment) else segment for segment in segments[:depth]]
+    return "/" + "/".join(pattern) + ("/..." if len(segments) > depth else "")
+
+
+class PhaseHistogram:
+    """Count, total, max and a fixed-bucket histogram of durations."""
+
+    __slots__ = ("count", "total", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(BUCKETS_MS) + 1)
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        milliseconds = seconds * 1000
+        for index, bound in enumerate(BUCKETS_MS):
+            if milliseconds <= bound:
+                self.buckets[index] += 1
+                return
+        self.buckets[-1] += 1
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound (ms) of the bucket holding the ``fraction`` quantile."""
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank:
+                return float(BUCKETS_MS[index]) if index < len(BUCKETS_MS) else self.max * 1000
+        return self.max * 1000
+
+
+class _Phase:
+    __slots__ = ("page", "name", "start")
+
+    def __init__(self, page: "PageTimer", name: str):
+        self.page = page
+        self.name = name
+
+    def __enter__(self):
+        if self.page.profile is not None:
+            self.page.profile.enable()
+        self.start = time.perf_counter()
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self.start
+        if self.page.profile is not None:
+            self.page.profile.disable()
+        self.page.record(self.name, elapsed)
+
+
+class PageTimer:
+    """Phase timings of one response; closes into its ParseProfiler when the ``with`` block ends."""
+
+    def __init__(self, profiler: "ParseProfiler", url: str, download_latency: float | None):
+        self.profiler = profiler
+        self.url = url
+        self.timings: dict[str, float] = {}
+        # cProfile only runs inside phases, so the dump never includes Scrapy's own machinery
+        self.profile = cProfile.Profile() if profiler.dumps else None
+        if download_latency is not None:
+            self.timings["download"] = download_latency
+
+    def phase(self, name: str) -> _Phase:
+        return _Phase(self, name)
+
+    def record(self, name: str, seconds: float) -> None:
+        self.timings[name] = self.timings.get(name, 0.0) + seconds
+
+    def __enter__(self) -> "PageTimer":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.profiler.add_page(self)
+
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, exc_type, exc, tb):
+        pass
+
+
+class NullPageTimer:
+    """Stand-in used when profiling is off: every phase is a shared no-op."""
+
+    _phase = _NullPhase()
+
+    def phase(self, name: str) -> _NullPhase:
+        return self._phase
+
+    def __enter__(self) -> "NullPageTimer":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+NULL_PAGE_TIMER = NullPageTimer()
+
+
+class ParseProfiler:
+    """Per-phase timing of EventSiteSpider.parse, aggregated per URL pattern.
+
+    Every response gets a PageTimer; its phase durations are added to one
+    histogram per (URL pattern, phase). With ``dumps > 0`` every page is also
+    run under cProfile (only while a phase is active) and the profiles of the
+    ``dumps`` slowest pages are kept and written as ``.prof`` files on close,
+    ready for ``python -m pstats`` or snakeviz.
+    """
+
+    def __init__(self, dumps: int = 0, dump_dir: str | Path = "data/profiles"):
+        self.dumps = dumps
+        self.dump_dir = Path(dump_dir)
+        self.pages = 0
+        self._histograms: dict[tuple[str, str], PhaseHistogram] = {}
+        # Min-heap of (parse seconds, sequence, url, profile) holding the slowest pages
+        self._slowest: list[tuple[float, int, str, cProfile.Profile]] = []
+
+    def page(self, url: str, download_latency: float | None = None) -> PageTimer:
+        return PageTimer(self, url, download_latency)
+
+    def add_page(self, page: PageTimer) -> None:
+        self.pages += 1
+        pattern = url_pattern(page.url)
+        for phase, seconds in page.timings.items():
+            for key in ((pattern, phase), ("*", phase)):
+                histogram = self._histograms.get(key)
+                if histogram is None:
+                    histogram = self._histograms[key] = PhaseHistogram()
+                histogram.add(seconds)
+        if page.profile is not None:
+            parse_seconds = sum(seconds for phase, seconds in page.timings.items() if phase != "download")
+            entry = (parse_seconds, self.pages, page.url, page.profile)
+            if len(self._slowest) < self.dumps:
+                heapq.heappush(self._slowest, entry)
+            elif parse_seconds > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, entry)
+
+    def histogram(self, pattern: str, phase: str) -> PhaseHistogram | None:
+        return self._histograms.get((pattern, phase))
+
+    def stats(self) -> dict[str, float]:
+        """Crawl-wide totals for the Scrapy stats collector."""
+        stats: dict[str, float] = {"profile/pages": self.pages}
+        for phase in PHASES:
+            histogram = self._histograms.get(("*", phase))
+            if histogram is not None:
+                stats[f"profile/{phase}_ms_total"] = round(histogram.total * 1000, 1)
+                stats[f"profile/{phase}_ms_p95"] = histogram.percentile(0.95)
+        return stats
+
+    def report(self, top_patterns: int = 10) -> list[str]:
+        """Report lines: per pattern and phase, count, mean, p50/p95 bucket and max (ms)."""
+        totals: dict[str, float] = {}
+        for (pattern, phase), histogram in self._histograms.items():
+            if phase != "download":
+                totals[pattern] = totals.get(pattern, 0.0) + histogram.total
+        patterns = ["*"] + sorted((p for p in totals if p != "*"), key=totals.get, reverse=True)[:top_patterns]
+
+        lines = [
+            f"Parse profile: {self.pages} pages, {totals.get('*', 0.0):.2f} s in parse()",
+            f"{'pattern':<40} {'phase':<11} {'pages':>6} {'mean':>8} {'p50':>7} {'p95':>7} {'max':>8}",
+        ]
+        for pattern in patterns:
+            for phase in PHASES:
+                histogram = self._histograms.get((pattern, phase))
+                if histogram is None:
+                    continue
+                lines.append(
+                    f"{pattern[:40]:<40} {phase:<11} {histogram.count:>6} "
+                    f"{histogram.total / histogram.count * 1000:>8.2f} {histogram.percentile(0.5):>7.0f} "
+                    f"{histogram.percentile(0.95):>7.0f} {histogram.max * 1000:>8.1f}"
+                )
+        return lines
+
+    def write_dumps(self, prefix: str) -> list[Path]:
+        """Write the slowest pages' profiles, slowest first; returns the written paths."""
+        if not self._slowest:
+            return []
+        self.dump_dir.mkdir(parents=True, exist_ok=True)
+        paths = []
+        for rank, (seconds, _, url, profile) in enumerate(sorted(self._slowest, reverse=True), start=1):
+            slug = re.sub(r"[^A-Za-z0-9]+", "_", urlsplit(url).path).strip("_")[:60] or "root"
+            path = self.dump_dir / f"{prefix}_{rank:02d}_{slug}.prof"
+            profile.dump_stats(path)
+            paths.append(path)
+        return paths
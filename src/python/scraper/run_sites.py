@@ -0,0 +1,145 @@
+"""Crawl every event site from a manifest in a single Scrapy process.
+
+Usage (from the repository root):
+    python -m src.python.scraper.run_sites production/sites.json
+    python -m src.python.scraper.run_sites production/sites.json --list-uploads
+
+All sites share one CrawlerProcess (one Twisted reactor), so the job takes about
+as long as the slowest site instead of the sum of all sites. The manifest's
+``global_concurrency`` is split evenly over the sites and every site can
+tighten its own limits:
+
+    {
+      "global_concurrency": 48,
+      "sites": [
+        {"start_url": "https://www.example.com", "event_id": "example",
+         "container": "example", "limits": {"concurrent_requests_per_domain": 16}}
+      ]
+    }
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from scrapy.crawler import CrawlerProcess
+from scrapy.utils.project import get_project_settings
+
+from src.python.scraper.spiders.event_site_spider_clean import EventSiteSpiderClean
+from src.python.utils.record_store import SUFFIX as STORE_SUFFIX
+
+# Manifest "limits" keys and the Scrapy settings they map to
+LIMIT_SETTINGS = {
+    "concurrent_requests_per_domain": "CONCURRENT_REQUESTS_PER_DOMAIN",
+    "depth_limit": "DEPTH_LIMIT",
+    "download_delay": "DOWNLOAD_DELAY",
+    "max_pages": "CLOSESPIDER_PAGECOUNT",
+    "timeout_seconds": "CLOSESPIDER_TIMEOUT",
+}
+DEFAULT_OUTPUT_DIR = Path("data/processed")
+
+
+def load_manifest(path: Path) -> dict:
+    manifest = json.loads(path.read_text(encoding="utf-8"))
+    sites = manifest.get("sites")
+    if not sites:
+        raise ValueError(f"{path} does not define any sites")
+    for site in sites:
+        for key in ("start_url", "event_id"):
+            if not site.get(key):
+                raise ValueError(f"Site entry {site!r} is missing '{key}'")
+        unknown = set(site.get("limits", {})) - set(LIMIT_SETTINGS)
+        if unknown:
+            raise ValueError(f"Unknown limits for {site['event_id']}: {sorted(unknown)}")
+    return manifest
+
+
+def site_output(site: dict) -> Path:
+    return Path(site.get("output") or DEFAULT_OUTPUT_DIR / f"{site['event_id']}_site_data.json")
+
+
+def cleaned_output(site: dict, cleaned_format: str = "json") -> Path:
+    """Where StreamCleaningPipeline writes the cleaned feed for ``site``."""
+    output = site_output(site)
+    suffix = STORE_SUFFIX if cleaned_format == "store" else ".json"
+    return DEFAULT_OUTPUT_DIR / (output.with_suffix("").name + "_cleaned" + suffix)
+
+
+def site_spider_class(
+    site: dict, per_site_concurrency: int, cleaned_format: str = "json", dedupe: bool = False
+) -> type[EventSiteSpiderClean]:
+    """Build a spider subclass whose custom_settings carry this site's feed and limits.
+
+    Spider-level settings are the only per-crawler settings every Scrapy version
+    honours when several crawlers share a process.
+    """
+    settings = dict(EventSiteSpiderClean.custom_settings)
+    settings["CONCURRENT_REQUESTS"] = per_site_concurrency
+    settings["CONCURRENT_REQUESTS_PER_DOMAIN"] = per_site_concurrency
+    for key, value in site.get("limits", {}).items():
+        settings[LIMIT_SETTINGS[key]] = value
+    # Never let a site exceed its share of the global budget
+    settings["CONCURRENT_REQUESTS_PER_DOMAIN"] = min(settings["CONCURRENT_REQUESTS_PER_DOMAIN"], per_site_concurrency)
+    settings["FEEDS"] = {str(site_output(site)): {"format": "json", "overwrite": True}}
+    settings["CLEANED_FEED_FORMAT"] = cleaned_format
+    settings["CLEANED_FEED_DEDUPE"] = dedupe
+    return type(f"EventSiteSpiderClean_{site['event_id']}", (EventSiteSpiderClean,), {"custom_settings": settings})
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Crawl all event sites from a manifest in one process")
+    parser.add_argument("manifest", type=Path, help="Path to the site manifest (JSON)")
+    parser.add_argument("--state-dir", default="data/state", help="Directory for incremental crawl state")
+    parser.add_argument("--delta", action="store_true", help="Also write added/changed/removed feeds")
+    parser.add_argument(
+        "--cleaned-format",
+        choices=["json", "store"],
+        default="json",
+        help="Format of the cleaned feeds: indented JSON (default) or an indexed record store",
+    )
+    parser.add_argument(
+        "--dedupe",
+        action="store_true",
+        help="Leave near-duplicate pages out of the cleaned feeds",
+    )
+    parser.add_argument(
+        "--list-uploads",
+        action="store_true",
+        help="Print '<cleaned file>:<container>' per site and exit (used by run_pipeline.sh)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = _parse_args(argv)
+    try:
+        manifest = load_manifest(args.manifest)
+    except (OSError, ValueError) as exc:
+        sys.exit(f"Invalid site manifest {args.manifest}: {exc}")
+    sites = manifest["sites"]
+
+    if args.list_uploads:
+        for site in sites:
+            cleaned = cleaned_output(site, args.cleaned_format)
+            print(f"{cleaned}:{site.get('container') or site['event_id']}")
+        return
+
+    settings = get_project_settings()
+    global_concurrency = int(manifest.get("global_concurrency") or settings.getint("CONCURRENT_REQUESTS"))
+    per_site_concurrency = max(1, global_concurrency // len(sites))
+
+    process = CrawlerProcess(settings)
+    for site in sites:
+        site_output(site).parent.mkdir(parents=True, exist_ok=True)
+        process.crawl(
+            site_spider_class(site, per_site_concurrency, args.cleaned_format, args.dedupe),
+            start_url=site["start_url"],
+            event_id=site["event_id"],
+            state_dir=args.state_dir,
+            delta=args.delta,
+        )
+    process.start()
+
+
+if __name__ == "__main__":
+    main()
@@ -13,17 +13,34 @@ ROBOTSTXT_OBEY = False
 CONCURRENT_REQUESTS = 64
 
 # Configure maximum concurrent requests per domain
+# (upper bound; the adaptive throttle below decides the actual window)
 CONCURRENT_REQUESTS_PER_DOMAIN = 32
 
 # Configure a delay for requests for the same website (default: 0)
 DOWNLOAD_DELAY = 0.0
 
 # Enable or disable downloader middlewares
+# KortrijkXpoDownloaderMiddleware must sit above RetryMiddleware (550) so it sees
+# 429/5xx responses before they are turned into retries.
 DOWNLOADER_MIDDLEWARES = {
-    "src.python.scraper.middlewares.KortrijkXpoDownloaderMiddleware": 543,
+    "src.python.scraper.middlewares.KortrijkXpoDownloaderMiddleware": 560,
     "scrapy.downloadermiddlewares.retry.RetryMiddleware": 550,
 }
 
+# Adaptive per-domain concurrency (AIMD) in KortrijkXpoDownloaderMiddleware
+ADAPTIVE_THROTTLE_ENABLED = True
+ADAPTIVE_THROTTLE_START_WINDOW = 4
+ADAPTIVE_THROTTLE_MIN_WINDOW = 1
+ADAPTIVE_THROTTLE_MAX_WINDOW = 0  # 0 = CONCURRENT_REQUESTS_PER_DOMAIN
+ADAPTIVE_THROTTLE_TARGET_LATENCY = 2.0  # seconds
+ADAPTIVE_THROTTLE_ERROR_RATE = 0.2  # moving average of 5xx/timeouts
+ADAPTIVE_THROTTLE_BACKOFF = 0.5  # multiplicative decrease factor
+
+# Per-phase timing of EventSiteSpider.parse (also enabled with -a profile=1)
+PARSE_PROFILING_ENABLED = False
+PARSE_PROFILING_DUMPS = 0  # cProfile dumps of the N slowest pages
+PARSE_PROFILING_DIR = "data/profiles"
+
 # Retry settings
 RETRY_ENABLED = True
 RETRY_TIMES = 3  # Maximum number of retries
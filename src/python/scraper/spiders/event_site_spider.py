@@ -1,18 +1,43 @@
 import scrapy
 from scrapy.crawler import CrawlerProcess
+from scrapy.exceptions import DontCloseSpider
 from urllib.parse import urlparse, urlunparse
-import re # Import re
 from pathlib import Path # Added for path manipulation
-import time
+import hashlib
 import subprocess
 from scrapy import signals
 
+from src.python.scraper.boilerplate import BoilerplateDetector
+from src.python.scraper.extractors import registry as EXTRACTORS
+from src.python.scraper.frontier import UrlFrontier
+from src.python.scraper.text_extractor import extract_page
+from src.python.scraper.language_index import LanguageVariantIndex, path_language, strip_language
+from src.python.scraper.link_extractor import LinkExtractor
+from src.python.scraper.profiling import NULL_PAGE_TIMER, ParseProfiler
+from src.python.scraper.validator_store import ValidatorStore
+
 class EventSiteSpider(scrapy.Spider):
     """Generic spider for crawling an entire single external event website,
     strictly staying on the start_url's domain (unlimited depth by default).
 
     Usage example (unlimited depth is default):
         scrapy crawl event_site_spider -a start_url=https://www.flandersflooringdays.com -a event_id=ffd
+
+    Re-crawls are incremental: validators (ETag / Last-Modified / body hash) of
+    every page are persisted in ``<state_dir>/<event_id>_validators.json`` and
+    sent as conditional GETs on the next run. Unchanged pages replay the item
+    and links stored from the previous run. Disable with ``-a incremental=0``.
+
+    Text blocks that repeat across pages (menus, cookie banners, footers) are
+    stripped from ``raw_text_content``; both sizes are recorded on the item.
+    The items of the first pages are held back until the detector has seen
+    enough pages, then stripped again and emitted. Disable with
+    ``-a strip_boilerplate=0``.
+
+    Profiling mode (``-a profile=1`` or ``-s PARSE_PROFILING_ENABLED=1``) times
+    every phase of ``parse`` per response and logs histograms per URL pattern
+    when the spider closes. ``-a profile_dumps=N`` (or PARSE_PROFILING_DUMPS)
+    also writes cProfile dumps of the N slowest pages to PARSE_PROFILING_DIR.
     """
 
     name = "event_site_spider"
@@ -33,16 +58,61 @@ class EventSiteSpider(scrapy.Spider):
         spider = super().from_crawler(crawler, *args, **kwargs)
         crawler.signals.connect(spider.spider_opened, signal=signals.spider_opened)
         crawler.signals.connect(spider.spider_closed, signal=signals.spider_closed)
+        crawler.signals.connect(spider.spider_idle, signal=signals.spider_idle)
+        settings = crawler.settings
+        page_limit = settings.getint("CLOSESPIDER_PAGECOUNT")
+        if spider._boilerplate is not None and page_limit:
+            # A page-count close skips spider_idle: release held items no later than the last page
+            spider._boilerplate.warmup_pages = min(spider._boilerplate.warmup_pages, page_limit)
+        if spider._profile_requested or settings.getbool("PARSE_PROFILING_ENABLED"):
+            spider._profiler = ParseProfiler(
+                dumps=spider._profile_dumps or settings.getint("PARSE_PROFILING_DUMPS"),
+                dump_dir=settings.get("PARSE_PROFILING_DIR") or "data/profiles",
+            )
         return spider
 
     def spider_opened(self, spider):
         self.logger.warning(f"Spider started: {self.name} for domain {self.allowed_domains[0] if self.allowed_domains else 'unknown'}")
 
+    def spider_idle(self, spider):
+        # Crawl ended before the boilerplate detector warmed up: one local request emits the held items
+        if self._early_pages:
+            self.crawler.engine.crawl(scrapy.Request("data:,", callback=self._release_early_pages, dont_filter=True))
+            raise DontCloseSpider
+
     def spider_closed(self, spider):
-        page_count = len(getattr(self, '_visited', set()))
+        page_count = self._frontier.downloaded
         self.logger.warning(f"Spider finished: {self.name} - Crawled {page_count} pages")
-
-    def __init__(self, start_url: str | None = None, event_id: str = "event", depth: int = 0, *args, **kwargs):
+        frontier_stats = self._frontier.stats()
+        extra_stats = self._boilerplate.stats() if self._boilerplate is not None else {}
+        for key, value in {**frontier_stats, **self._language_index.stats(), **self._links.stats(), **extra_stats}.items():
+            self.crawler.stats.set_value(key, value)
+        self.logger.warning(
+            f"Frontier: {frontier_stats['frontier/duplicates_skipped']} duplicate links skipped, "
+            f"{frontier_stats['frontier/wasted_downloads']} wasted downloads "
+            f"({frontier_stats['frontier/wasted_ratio']:.1%}), "
+            f"{frontier_stats['frontier/memory_bytes'] / 1024:.1f} KB fingerprint memory"
+        )
+        if self._boilerplate is not None:
+            self.logger.warning(
+                f"Boilerplate: raw text {self._boilerplate.chars_original / 1024:.1f} KB → "
+                f"{self._boilerplate.chars_kept / 1024:.1f} KB after stripping repeated blocks"
+            )
+        if self._validators is not None:
+            self._validators.save()
+            reused = self.crawler.stats.get_value("validators/reused_items", 0)
+            self.logger.warning(f"Incremental crawl: reused {reused}/{page_count} pages from {self._validators.path}")
+        if self._profiler is not None:
+            for key, value in self._profiler.stats().items():
+                self.crawler.stats.set_value(key, value)
+            self.logger.warning("\n".join(self._profiler.report()))
+            for path in self._profiler.write_dumps(self.event_id):
+                self.logger.warning(f"Profile of a slow page written to {path}")
+
+    def __init__(self, start_url: str | None = None, event_id: str = "event", depth: int = 0,
+                 state_dir: str = "data/state", incremental: str | bool = True,
+                 strip_boilerplate: str | bool = True, max_text_chars: int | str = 0,
+                 profile: str | bool = False, profile_dumps: int | str = 0, *args, **kwargs):
         super().__init__(*args, **kwargs)
         if not start_url:
             raise ValueError("You must provide -a start_url=<URL> when launching event_site_spider.")
@@ -59,37 +129,120 @@ class EventSiteSpider(scrapy.Spider):
         # NOTE: Use -O <filename.json> on the scrapy command line for custom output
         # Depth can still be overridden at runtime via '-s DEPTH_LIMIT=...' in the command.
 
-        self._visited: set[str] = set()
+        # Canonical-URL fingerprints of scheduled and downloaded pages
+        self._frontier = UrlFrontier()
+        # Site-wide base path -> chosen language variant
+        self._language_index = LanguageVariantIndex()
+        # Link resolution and filtering with memoized URL work
+        self._links = LinkExtractor(self._frontier, self._language_index, parsed_start_url.netloc)
+
+        # Cap on the body text kept per page (0 = unlimited)
+        self.max_text_chars = int(max_text_chars)
+
+        # Site-level detector for repeated blocks (menus, cookie banners, footers)
+        self._boilerplate: BoilerplateDetector | None = None
+        if str(strip_boilerplate).lower() not in {"0", "false", "no", "off"}:
+            self._boilerplate = BoilerplateDetector()
+        # (item, blocks) of pages stripped before the detector warmed up, emitted by _release_early_pages
+        self._early_pages: list[tuple[dict, list]] = []
+
+        # Conditional re-crawl state (spider arguments arrive as strings from -a)
+        self._validators: ValidatorStore | None = None
+        if str(incremental).lower() not in {"0", "false", "no", "off"}:
+            self._validators = ValidatorStore(Path(state_dir) / f"{self.event_id}_validators.json")
+
+        # Per-phase parse timing; created in from_crawler, where PARSE_PROFILING_* settings can enable it too
+        self._profiler: ParseProfiler | None = None
+        self._profile_requested = str(profile).lower() in {"1", "true", "yes", "on"}
+        self._profile_dumps = int(profile_dumps)
+
+    async def start(self):
+        # Scrapy 2.13+ calls start() and never start_requests(); older versions do the opposite
+        for request in self.start_requests():
+            yield request
+
+    def start_requests(self):
+        for url in self.start_urls:
+            self._frontier.schedule(url)
+            yield self._make_request(url)
+
+    def _make_request(self, url: str) -> scrapy.Request:
+        if self._validators is None:
+            return scrapy.Request(url, callback=self.parse)
+        headers = self._validators.conditional_headers(url)
+        if headers:
+            self.crawler.stats.inc_value("validators/conditional_requests")
+        # Let 304 responses reach parse() instead of being dropped by HttpErrorMiddleware
+        return scrapy.Request(url, callback=self.parse, headers=headers,
+                              meta={"handle_httpstatus_list": [304]})
 
     def parse(self, response: scrapy.http.Response):
+        if self._profiler is None:
+            yield from self._parse_page(response, NULL_PAGE_TIMER)
+            return
+        with self._profiler.page(response.url, response.meta.get("download_latency")) as timer:
+            yield from self._parse_page(response, timer)
+
+    def _parse_page(self, response: scrapy.http.Response, timer):
         url = response.url
         if url.lower().endswith(".pdf"):
             return
-        if url in self._visited:
+        if not self._frontier.mark_downloaded(url):
+            # Already processed under another URL variant (e.g. after a redirect)
             return
-        self._visited.add(url)
 
-        # Extract basic page data
-        title = response.css("title::text").get(default="").strip()
-        description = (
-            response.css("meta[name='description']::attr(content)").get(default="").strip() or
-            response.css("meta[property='og:description']::attr(content)").get(default="").strip()
-        )
-        text_nodes = response.xpath("//body//text()[not(ancestor::script) and not(ancestor::style)]").getall()
-        raw_text = " ".join(text_nodes).strip()
+        # ------------------------------------------------------------------
+        # Incremental crawl: a 304 or a byte-identical body means the page is
+        # unchanged, so replay the stored item and links instead of extracting.
+        # ------------------------------------------------------------------
+        content_hash = None
+        if self._validators is not None:
+            if response.status == 304:
+                entry = self._validators.keep(url)
+                if entry is None:
+                    # We never sent validators for this URL; nothing to reuse.
+                    self.logger.warning(f"Unexpected 304 without stored validators: {url}")
+                    return
+                self.crawler.stats.inc_value("validators/not_modified")
+                yield from self._replay_entry(url, entry)
+                return
+            with timer.phase("validators"):
+                content_hash = hashlib.sha1(response.body).hexdigest()
+                entry = self._validators.get(url)
+            if entry and entry.get("content_hash") == content_hash:
+                self._validators.record(
+                    url,
+                    etag=self._header(response, b"ETag"),
+                    last_modified=self._header(response, b"Last-Modified"),
+                    content_hash=content_hash,
+                    item=entry["item"],
+                    links=entry["links"],
+                    blocks=entry.get("blocks"),
+                )
+                self.crawler.stats.inc_value("validators/unchanged_body")
+                yield from self._replay_entry(url, entry)
+                return
 
         # ------------------------------------------------------------------
-        # Attempt to extract booth / stand number from the raw text
-        # The website uses "Booth: 142" in EN. Other languages might use
-        # "Stand: 142" (NL/FR/DE). We therefore look for either keyword
-        # (case–insensitive) followed by an optional colon and the number.
-        # We only capture the first occurrence if multiple are present.
+        # Extract basic page data in a single walk over the DOM: title,
+        # description, text blocks (script/style skipped), links and the
+        # first booth / stand number ("Booth: 142" in EN, "Stand: 142" in
+        # NL/FR/DE), found in the unstripped text.
         # ------------------------------------------------------------------
-        booth_number: str | None = None
-        booth_regex = re.compile(r"\b(?:Booth|Stand)\s*[:#]??\s*(\d{1,4})", re.IGNORECASE)
-        booth_match = booth_regex.search(raw_text)
-        if booth_match:
-            booth_number = booth_match.group(1)
+        with timer.phase("extract"):
+            page = extract_page(response.selector.root, self.max_text_chars)
+        if page.truncated:
+            self.crawler.stats.inc_value("extract/truncated_pages")
+        block_fingerprints = None
+        if self._boilerplate is not None:
+            with timer.phase("boilerplate"):
+                block_fingerprints = self._boilerplate.fingerprints(page.blocks)
+                raw_text_original, raw_text = self._boilerplate.strip(page.blocks, block_fingerprints)
+        else:
+            raw_text_original = raw_text = page.text
+        title = page.title
+        description = page.description
+        booth_number = page.booth_number
 
         item = {
             "event_id": self.event_id,
@@ -97,180 +250,97 @@ class EventSiteSpider(scrapy.Spider):
             "title": title,
             "description": description,
             "raw_text_content": raw_text,
+            "raw_text_size_original": len(raw_text_original),
+            "raw_text_size": len(raw_text),
             "source_type": "event_site",
             "booth_number": booth_number,
         }
-        # If this is the Artisan list-of-exhibitors page, extract structured exhibitor list
-        if self.event_id == 'artisan' and 'list-of-exhibitors' in url:
-            exhibitors = []
-            for div in response.css('div.exposantenLijst_exposantjs'):
-                name = div.css('div.exposantenLijst_exposantNaam::text').get(default='').strip()
-                city = div.css('div.exposantenLijst_exposantStad::text').get(default='').strip()
-                country = div.css('div.exposantenLijst_exposantLand::text').get(default='').strip()
-                booth = div.css('div.exposantenLijst_exposantPlaats::text').get(default='').strip()
-                exhibitors.append({
-                    'name': name,
-                    'city': city,
-                    'country': country,
-                    'booth': booth,
-                })
-            item['exhibitors'] = exhibitors
-        yield item
-
-        # Collect all potential internal links first
-        potential_links_to_follow = []
-        for href in response.css("a[href]::attr(href)").getall():
-            full_url = response.urljoin(href)
-            parsed_url = urlparse(full_url)
-
-            # Skip PDF files
-            if parsed_url.path.lower().endswith(".pdf"):
-                self.logger.debug(f"Skipping PDF link: {full_url}")
-                continue
-
-            # Ensure it's http/https, stays on the same domain, and not yet visited
-            if (parsed_url.scheme in {"http", "https"} and
-                parsed_url.netloc == self.allowed_domains[0] and # Check against the spider's allowed domain
-                full_url not in self._visited):
-                potential_links_to_follow.append(full_url)
-
+        # Structured per-site records (exhibitors, stand numbers) straight from the DOM
+        with timer.phase("extractors"):
+            item.update(EXTRACTORS.extract(self.event_id, url, response.selector.root))
+
+        with timer.phase("links"):
+            links = self._extract_links(response, page.hrefs)
+        if self._validators is not None:
+            # Store a copy: pipelines may mutate the yielded item in place
+            self._validators.record(
+                url,
+                etag=self._header(response, b"ETag"),
+                last_modified=self._header(response, b"Last-Modified"),
+                content_hash=content_hash,
+                item=dict(item),
+                links=links,
+                blocks=block_fingerprints,
+            )
+        if self._boilerplate is not None and (self._early_pages or not self._boilerplate.warmed_up):
+            self._early_pages.append((item, page.blocks))
+            if self._boilerplate.warmed_up:
+                yield from self._release_early_pages()
+        else:
+            yield item
+        yield from self._follow_links(url, links, timer)
+
+    def _release_early_pages(self, response=None):
+        """Strip the held pages again with everything learned since, then emit them."""
+        early_pages, self._early_pages = self._early_pages, []
+        for item, blocks in early_pages:
+            raw_text = self._boilerplate.restrip(blocks, item["raw_text_content"])
+            if raw_text != item["raw_text_content"]:
+                item["raw_text_content"] = raw_text
+                item["raw_text_size"] = len(raw_text)
+                if self._validators is not None:
+                    self._validators.update_item(item["url"], dict(item))
+            yield item
+
+    def _replay_entry(self, url: str, entry: dict):
+        self.crawler.stats.inc_value("validators/reused_items")
+        if self._boilerplate is not None:
+            # The page is unchanged but still shows which blocks repeat across the site
+            self._boilerplate.observe(entry.get("blocks") or [])
+        yield dict(entry["item"])
+        yield from self._follow_links(url, entry["links"])
+
+    @staticmethod
+    def _header(response: scrapy.http.Response, name: bytes) -> str | None:
+        value = response.headers.get(name)
+        return value.decode("latin-1") if value else None
+
+    def _extract_links(self, response: scrapy.http.Response, hrefs: list[str]) -> list[str]:
+        # On-site, non-PDF links, sorted and deduplicated. Visited links are kept here so the
+        # stored link list stays complete; _filter_and_prioritize_links skips them.
+        return self._links.extract(response.urljoin(""), hrefs)
+
+    def _follow_links(self, url: str, unique_potential_links: list[str], timer=NULL_PAGE_TIMER):
         # Filter and prioritize these links based on language
-        # Deduplicate potential_links_to_follow before filtering
-        unique_potential_links = sorted(list(set(potential_links_to_follow)))
-
-        actually_follow_links = self._filter_and_prioritize_links(unique_potential_links)
+        with timer.phase("filter"):
+            actually_follow_links = self._filter_and_prioritize_links(unique_potential_links)
 
         for link_to_visit in actually_follow_links:
-            if link_to_visit not in self._visited: # Double check, though _filter should handle visited
+            # Registering with the frontier at schedule time (not after download) means a page
+            # linked from many pages is enqueued exactly once.
+            if self._frontier.schedule(link_to_visit):
                  self.logger.debug(f"Yielding request for: {link_to_visit} from {url}")
-                 yield scrapy.Request(link_to_visit, callback=self.parse)
+                 yield self._make_request(link_to_visit)
             else:
-                 self.logger.debug(f"Skipping already visited link (post-filter): {link_to_visit}")
+                 self.logger.debug(f"Skipping already scheduled link (post-filter): {link_to_visit}")
 
     def _normalize_path_for_grouping(self, path: str) -> str:
-        # Try to remove known language prefixes /en/, /nl/, /fr/ for grouping
-        # This helps group domain.com/en/page and domain.com/nl/page as the same conceptual "page"
-        # Assumes language codes are single segments like /en/ or /fr-be/
-        # More complex language code patterns might need a more robust regex
-        lang_codes = ['en', 'nl', 'fr', 'de'] # Add more if needed
-        path_segments = path.strip('/').split('/')
-
-        # Check if the first segment is a language code (e.g. /en/foo or /fr-BE/foo)
-        if path_segments and path_segments[0].lower() in lang_codes:
-            # Check if it's a simple lang code (e.g. 'en') or locale specific (e.g. 'en-gb')
-            # For simplicity, we assume if it matches a base lang_code, it's a language marker.
-            return '/' + '/'.join(path_segments[1:])
-
-        # Check for language codes like /nl-be/ or /fr_FR/ (heuristic)
-        if path_segments and (re.match(r'^[a-z]{2}[-_][a-zA-Z]{2}$', path_segments[0]) or path_segments[0].lower() in lang_codes):
-             # Check if the first part before - or _ is a known language code
-             if path_segments[0].split_string_part[0].lower() in lang_codes:
-                return '/' + '/'.join(path_segments[1:])
-
-
-        return path # Return original path if no identifiable language prefix
+        # Remove a known language prefix (/en/, /nl/, /fr-be/, /fr_FR/ ...) for grouping.
+        # This groups domain.com/en/page and domain.com/nl/page as the same conceptual "page".
+        return strip_language(path)
 
     def _get_path_language(self, path: str) -> str | None:
         # Extracts language code if path starts with /<lang_code>/
         # Example: /en/some/page -> en
         # Example: /fr-be/some/page -> fr-be
         # Example: /products/item -> None
-        path_segments = path.strip('/').split('/')
-        if not path_segments:
-            return None
-
-        first_segment = path_segments[0].lower()
-        # Simple 2-letter lang codes + common variants
-        known_lang_prefixes = ['en', 'nl', 'fr', 'de'] # Could be expanded
-        # Matches 'en', 'en-us', 'en_US', 'fr-be', etc.
-        lang_pattern = r'^([a-z]{2})([-_][a-zA-Z]{2})?$'
-
-        match = re.match(lang_pattern, first_segment)
-        if match and match.group(1) in known_lang_prefixes:
-            return first_segment # Return the full matched segment e.g. 'en' or 'en-us'
-
-        return None
+        return path_language(path)
 
+    def is_superseded(self, url: str) -> bool:
+        """True if a better language variant of ``url`` was scheduled after it (checked by the downloader middleware)."""
+        return self._language_index.is_cancelled(url)
 
     def _filter_and_prioritize_links(self, links: list[str]) -> list[str]:
-        if not links:
-            return []
-
-        self.logger.debug(f"Filtering {len(links)} potential links: {links}")
-
-        grouped_by_base_path = {} # Key: base_path, Value: {'en': url, 'default': url, 'others': {lang: url}}
-
-        for url_str in links:
-            if url_str in self._visited: # Skip already visited URLs early
-                self.logger.debug(f"Link {url_str} already visited, skipping in filter.")
-                continue
-
-            parsed_url = urlparse(url_str)
-            path = parsed_url.path
-
-            lang_in_path = self._get_path_language(path)
-
-            # Use path without leading lang for grouping, but INCLUDE the query string
-            # so that participant detail pages like /participant/?id=123 remain distinct.
-            base_path_key = path # Default base_path (will update below)
-            query_part = ('?' + parsed_url.query) if parsed_url.query else ''
-
-            if lang_in_path:
-                # Remove the lang segment to get a base path for grouping
-                # e.g., /en/foo/bar -> /foo/bar
-                # e.g., /en-us/baz -> /baz
-                path_segments = path.strip('/').split('/')
-                # Reconstruct path without the first segment (lang code)
-                # Add leading slash if there are remaining segments
-                # If only lang code (e.g. /en/), base path becomes '/'
-                base_path_key = ('/' + '/'.join(path_segments[1:]) if len(path_segments) > 1 else '/') + query_part
-            else:
-                base_path_key = path + query_part
-
-            if base_path_key not in grouped_by_base_path:
-                grouped_by_base_path[base_path_key] = {'en': None, 'default': None, 'others': {}}
-
-            entry = grouped_by_base_path[base_path_key]
-
-            if lang_in_path:
-                # Normalize 'en-us', 'en-gb' to 'en' for primary keying, but store original lang_in_path
-                primary_lang_key = lang_in_path.split('-')[0].split('_')[0] # en-us -> en
-                if primary_lang_key == 'en':
-                    # Prefer shorter 'en' if multiple 'en-*' exist, or first one encountered
-                    if not entry['en'] or (lang_in_path == 'en' and entry['en'] != url_str):
-                         entry['en'] = url_str
-                    elif not entry['en']: # first en-* variant
-                        entry['en'] = url_str
-                else: # nl, fr, de etc.
-                    if lang_in_path not in entry['others']: # Store first one for this specific lang
-                        entry['others'][lang_in_path] = url_str
-            else: # No language code detected in path, assume default
-                if not entry['default']: # Store first default encountered
-                    entry['default'] = url_str
-
-        final_links_to_follow = []
-        for base_path, urls in grouped_by_base_path.items():
-            chosen_url = None
-            if urls['en']:
-                chosen_url = urls['en']
-                self.logger.debug(f"Base path '{base_path}': Chose EN version: {chosen_url}")
-            elif urls['default']:
-                chosen_url = urls['default']
-                self.logger.debug(f"Base path '{base_path}': No EN, chose DEFAULT version: {chosen_url}")
-            else:
-                # No 'en' or 'default'. User wants to skip other languages.
-
-                if urls['others']:
-                    self.logger.debug(f"Base path '{base_path}': No EN or DEFAULT. Skipping other languages: {urls['others']}")
-                else:
-                    self.logger.debug(f"Base path '{base_path}': No suitable versions found after filtering (no en, default, or others).")
-
-            if chosen_url and chosen_url not in self._visited:
-                final_links_to_follow.append(chosen_url)
-            elif chosen_url and chosen_url in self._visited:
-                 self.logger.debug(f"Base path '{base_path}': Chosen URL {chosen_url} was already visited, not adding again.")
-
-        # No need to log link reduction details in production
-        pass
-
-        return final_links_to_follow
+        # Links already scheduled are dropped before any language work; the remaining ones
+        # are offered to the crawl-global variant index, EN variants first (see LinkExtractor.select)
+        return self._links.select(links) if links else []
@@ -1,26 +1,34 @@
 from src.python.scraper.spiders.event_site_spider import EventSiteSpider
-import subprocess
 from pathlib import Path
-import json
 from scrapy import signals
-from scrapy.extensions.feedexport import FeedExporter
-import time
-import os
 import shutil
 import logging
 
 class EventSiteSpiderClean(EventSiteSpider):
-    """A version of EventSiteSpider that automatically cleans the JSON output after crawling.
+    """A version of EventSiteSpider that writes a cleaned copy of the JSON output while crawling.
+
+    Items are cleaned one at a time by StreamCleaningPipeline, which writes
+    ``data/processed/<feed>_cleaned.json`` directly; the raw feed is moved to
+    ``data/processed`` once the exporter has closed it.
 
     Usage example:
         scrapy crawl event_site_spider_clean -a start_url=https://www.flandersflooringdays.com -a event_id=ffd -O ffd_site_data.json
+
+    Pass ``-a delta=1`` to also write added/changed/removed feeds relative to the previous run.
     """
 
     name = "event_site_spider_clean"
     custom_settings = {
         "LOG_LEVEL": "WARNING",  # Only show WARNING and above (no INFO logs)
+        "ITEM_PIPELINES": {
+            "src.python.scraper.pipelines.StreamCleaningPipeline": 300,
+        },
     }
 
+    def __init__(self, *args, delta: str | bool = False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.delta = str(delta).lower() in {"1", "true", "yes", "on"}
+
     @classmethod
     def from_crawler(cls, crawler, *args, **kwargs):
         spider = super().from_crawler(crawler, *args, **kwargs)
@@ -58,28 +66,3 @@ class EventSiteSpiderClean(EventSiteSpider):
         if original_file != target_file:
             shutil.move(str(original_file), str(target_file))
             self.logger.info(f"Moved file to: {target_file}")
-        
-        # Wait a moment for the file to be fully written
-        time.sleep(1)
-
-        try:
-            # Create output filename for cleaned version
-            input_file = str(target_file)
-            output_file = str(processed_dir / (target_file.with_suffix('').name + '_cleaned.json'))
-
-            # Run the cleaning process
-            self.logger.warning(f"Cleaning data for {self.event_id}: {output_file}")
-            subprocess.run([
-                'python',
-                'src/python/utils/clean_json.py',
-                input_file,
-                '-o', output_file,
-                '-i',  # Indent the output
-                '-c',  # Collapse whitespace
-                '--remove-non-ascii'  # Remove non-ASCII characters
-            ], check=True)
-            self.logger.info(f"Successfully cleaned JSON file: {output_file}")
-        except subprocess.CalledProcessError as e:
-            self.logger.error(f"Failed to clean JSON file: {e}")
-        except Exception as e:
-            self.logger.error(f"Unexpected error while cleaning JSON: {e}")
@@ -0,0 +1,138 @@
+"""Single-pass page extraction for EventSiteSpider.
+
+``extract_page`` walks the lxml tree once and collects everything ``parse``
+needs: the title, the meta description, the body text grouped into blocks (with
+script/style skipped and whitespace normalised), the first booth number and the
+raw ``href`` values of all anchors. This replaces one XPath ``getall()`` plus a
+join for the text, separate CSS queries for title/description/links and a
+regex over the whole joined page.
+"""
+import re
+from typing import NamedTuple
+
+from lxml import etree
+
+from src.python.scraper.boilerplate import BLOCK_TAGS, COOKIE_HINT_RE, STRUCTURAL_TAGS
+
+SKIPPED_TAGS = frozenset({"script", "style"})
+
+# "Booth: 142" in EN; other languages might use "Stand: 142" (NL/FR/DE)
+BOOTH_RE = re.compile(r"\b(?:Booth|Stand)\s*[:#]??\s*(\d{1,4})", re.IGNORECASE)
+
+
+class PageContent(NamedTuple):
+    title: str
+    description: str
+    # (dom path, structural hint, normalised text) per text block, in document order
+    blocks: list[tuple[str, bool, str]]
+    booth_number: str | None
+    hrefs: list[str]
+    truncated: bool
+
+    @property
+    def text(self) -> str:
+        return " ".join(text for _, _, text in self.blocks)
+
+
+def extract_page(root, max_text_chars: int = 0) -> PageContent:
+    """Walk ``root`` once. ``max_text_chars`` > 0 caps the body text kept per page."""
+    title = ""
+    description = ""
+    og_description = ""
+    hrefs: list[str] = []
+
+    # A segment is a run of consecutive text inside the same block element, so a
+    # block interrupted by a nested block yields two segments and document order is kept.
+    segments: list[tuple[tuple[str, bool], list[str]]] = []
+    open_blocks: list[tuple[str, bool]] = []
+    steps: list[str] = []
+    structural: list[bool] = [False]
+    in_body = 0
+    skip_depth = 0
+    total_chars = 0
+    truncated = False
+
+    def add_text(text: str | None) -> None:
+        nonlocal total_chars, truncated
+        if not text or not in_body or skip_depth or not open_blocks or truncated:
+            return
+        words = text.split()
+        if not words:
+            return
+        if max_text_chars:
+            size = sum(len(word) + 1 for word in words)
+            if total_chars + size > max_text_chars:
+                truncated = True
+                return
+            total_chars += size
+        block = open_blocks[-1]
+        if not segments or segments[-1][0] is not block:
+            segments.append((block, []))
+        segments[-1][1].extend(words)
+
+    for event, element in etree.iterwalk(root, events=("start", "end")):
+        tag = element.tag
+        if not isinstance(tag, str):
+            # Comments / processing instructions: only their tail is page text
+            if event == "end":
+                add_text(element.tail)
+            continue
+
+        if event == "start":
+            step = tag
+            element_id = element.get("id")
+            if element_id:
+                step += "#" + element_id
+            steps.append(step)
+            is_structural = structural[-1] or tag in STRUCTURAL_TAGS
+            if not is_structural:
+                class_name = element.get("class")
+                if element_id or class_name:
+                    is_structural = bool(COOKIE_HINT_RE.search(f"{element_id or ''} {class_name or ''}"))
+            structural.append(is_structural)
+
+            if tag == "body":
+                in_body += 1
+            elif tag == "a":
+                href = element.get("href")
+                if href:
+                    hrefs.append(href)
+            elif tag == "title" and not title:
+                title = (element.text or "").strip()
+            elif tag == "meta":
+                name = (element.get("name") or element.get("property") or "").lower()
+                if name == "description" and not description:
+                    description = (element.get("content") or "").strip()
+                elif name == "og:description" and not og_description:
+                    og_description = (element.get("content") or "").strip()
+
+            if tag in SKIPPED_TAGS:
+                skip_depth += 1
+            elif in_body and tag in BLOCK_TAGS:
+                open_blocks.append(("/".join(steps), structural[-1]))
+            add_text(element.text)
+        else:
+            if tag in SKIPPED_TAGS:
+                skip_depth -= 1
+            elif in_body and tag in BLOCK_TAGS and open_blocks:
+                open_blocks.pop()
+            if tag == "body":
+                in_body -= 1
+            steps.pop()
+            structural.pop()
+            # The tail belongs to the enclosing element, which is current again
+            add_text(element.tail)
+
+    blocks = [(path, is_structural, " ".join(words)) for (path, is_structural), words in segments]
+    # Over the joined text, not per block: "<td>Booth</td><td>142</td>" splits label and number
+    match = BOOTH_RE.search(" ".join(text for _, _, text in blocks))
+    booth_number = match.group(1) if match else None
+
+    return PageContent(
+        title=title,
+        description=description or og_description,
+        blocks=blocks,
+        booth_number=booth_number,
+        hrefs=hrefs,
+        truncated=truncated,
+    )
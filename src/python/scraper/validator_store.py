@@ -0,0 +1,84 @@
+import json
+import os
+from pathlib import Path
+
+
+class ValidatorStore:
+    """Persistent per-site map of URL -> HTTP validators and the last extracted item.
+
+    Every crawled page is remembered with its ETag, Last-Modified header, a hash
+    of the response body, the item that was extracted from it, the links it
+    pointed to and the fingerprints of its text blocks (so a replayed page still
+    teaches the boilerplate detector). On the next run the spider sends conditional GETs based on these
+    validators; a 304 (or an identical body) lets it replay the stored item and
+    links instead of extracting the page again.
+
+    Only entries that were seen during the current run are written back by
+    ``save()``, so pages that disappeared from the site drop out of the store.
+    """
+
+    VERSION = 2  # 2: block fingerprints per page
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._previous: dict[str, dict] = {}
+        self._current: dict[str, dict] = {}
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            # A corrupt state file must never break the crawl; start fresh.
+            return
+        if isinstance(data, dict) and data.get("version") == self.VERSION:
+            self._previous = data.get("pages", {})
+
+    def __len__(self) -> int:
+        return len(self._previous)
+
+    def get(self, url: str) -> dict | None:
+        return self._previous.get(url)
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        entry = self._previous.get(url)
+        if not entry:
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def record(self, url: str, *, etag: str | None, last_modified: str | None,
+               content_hash: str, item: dict, links: list[str], blocks: list[int] | None = None) -> None:
+        self._current[url] = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "content_hash": content_hash,
+            "item": item,
+            "links": links,
+            "blocks": blocks or [],
+        }
+
+    def update_item(self, url: str, item: dict) -> None:
+        """Replace the item recorded for ``url`` in this run (e.g. after it was stripped again)."""
+        if url in self._current:
+            self._current[url]["item"] = item
+
+    def keep(self, url: str) -> dict | None:
+        """Carry the previous entry for ``url`` over into this run (e.g. after a 304)."""
+        entry = self._previous.get(url)
+        if entry is not None:
+            self._current[url] = entry
+        return entry
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": self.VERSION, "pages": self._current}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
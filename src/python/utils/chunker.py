@@ -0,0 +1,113 @@
+"""
+chunker.py – Split page text into bounded, overlapping chunks before upload.
+
+Each page's ``raw_text_content`` is cut into chunks of at most ``max_tokens``
+estimated tokens. Cuts are made at sentence boundaries where possible; a single
+sentence that is longer than the budget is cut at word boundaries. Consecutive
+chunks share up to ``overlap_tokens`` tokens of trailing sentences so a fact
+that straddles a cut is still embedded in one piece.
+
+Tokens are estimated as ``len(text) / CHARS_PER_TOKEN``, the usual rule of
+thumb for the embedding models we use; no tokenizer is needed.
+
+Every chunk holds the uploaded fields of its page record (``UPLOADED_FIELDS``)
+with ``raw_text_content`` replaced by the chunk text, plus ``parent_url`` (the
+page URL) and ``chunk_index`` (0-based). Other fields (exhibitors, stand number
+mappings, ...) are not uploaded and are not copied into every chunk.
+``chunk_records`` works on any iterable, so it can sit between a streaming
+cleaner and the uploader without loading the whole feed.
+"""
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+CHARS_PER_TOKEN = 4
+# The page fields VectorApiClient._transform_event uploads besides the text
+UPLOADED_FIELDS = ("url", "title", "description", "socialmedia_links", "source_type")
+# Sentence end followed by whitespace; a fixed-width lookbehind keeps this linear
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+def estimate_tokens(text: str) -> int:
+    return -(-len(text) // CHARS_PER_TOKEN)  # ceil
+
+
+def _units(text: str, max_chars: int) -> Iterator[str]:
+    """Sentences of ``text``, with sentences over ``max_chars`` cut at word boundaries."""
+    for sentence in _SENTENCE_END_RE.split(text):
+        if len(sentence) <= max_chars:
+            if sentence:
+                yield sentence
+            continue
+        piece: list[str] = []
+        size = 0
+        for word in sentence.split():
+            if piece and size + 1 + len(word) > max_chars:
+                yield " ".join(piece)
+                piece, size = [], 0
+            # A single word over the budget is hard-cut
+            while len(word) > max_chars:
+                yield word[:max_chars]
+                word = word[max_chars:]
+            size += len(word) + (1 if piece else 0)
+            piece.append(word)
+        if piece:
+            yield " ".join(piece)
+
+
+def chunk_text(text: str, max_tokens: int = 512, overlap_tokens: int = 64) -> list[str]:
+    """Split ``text`` into chunks of at most ``max_tokens`` estimated tokens."""
+    if max_tokens <= 0:
+        raise ValueError("max_tokens must be positive")
+    if not 0 <= overlap_tokens < max_tokens:
+        raise ValueError("overlap_tokens must be between 0 and max_tokens - 1")
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    overlap_chars = overlap_tokens * CHARS_PER_TOKEN
+    if len(text) <= max_chars:
+        return [text] if text else []
+
+    chunks: list[str] = []
+    current: list[str] = []
+    size = 0  # characters in current, including the joining spaces
+    for unit in _units(text, max_chars):
+        if current and size + 1 + len(unit) > max_chars:
+            chunks.append(" ".join(current))
+            # Carry trailing units into the next chunk as overlap
+            carried: list[str] = []
+            carried_size = 0
+            for previous in reversed(current):
+                added = len(previous) + (1 if carried else 0)
+                if carried_size + added > overlap_chars or carried_size + added + 1 + len(unit) > max_chars:
+                    break
+                carried.insert(0, previous)
+                carried_size += added
+            current, size = carried, carried_size
+        size += len(unit) + (1 if current else 0)
+        current.append(unit)
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
+
+
+def chunk_record(record: dict[str, Any], max_tokens: int = 512, overlap_tokens: int = 64) -> Iterator[dict[str, Any]]:
+    """Yield the chunks of one page record (a single chunk when the text fits)."""
+    url = record.get("url", "")
+    chunks = chunk_text(record.get("raw_text_content") or "", max_tokens, overlap_tokens) or [""]
+    fields = {key: record[key] for key in UPLOADED_FIELDS if key in record}
+    if isinstance(record.get("stand_numbers"), list):
+        fields["stand_numbers"] = record["stand_numbers"]  # uploaded only in its list form
+    for index, text in enumerate(chunks):
+        chunk = dict(fields)
+        chunk["raw_text_content"] = text
+        chunk["parent_url"] = url
+        chunk["chunk_index"] = index
+        yield chunk
+
+
+def chunk_records(
+    records: Iterable[dict[str, Any]], max_tokens: int = 512, overlap_tokens: int = 64
+) -> Iterator[dict[str, Any]]:
+    for record in records:
+        yield from chunk_record(record, max_tokens, overlap_tokens)
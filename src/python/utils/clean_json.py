@@ -15,6 +15,29 @@ Benefits:
   • Produces deterministic ordering for objects as they appeared (Python 3.7+)
   • Typically shrinks file size by 10-50 % depending on indentation level
 
+Delta mode (`--delta`) additionally compares every record with the previous
+run's snapshot (`<output>_snapshot.json`) and writes `<output>_added.json`,
+`<output>_changed.json` and `<output>_removed.json` next to the cleaned file.
+
+Parallel mode (`--workers N`) cleans chunks of `--chunk-size` records in a pool
+of N processes. Results are written in input order, so the output does not
+depend on the number of workers. It combines with `--stream`: at most
+2 × N chunks are in flight at any time.
+
+Streaming mode (`--stream`) reads a JSON array or a JSON Lines file one record
+at a time and writes the cleaned array incrementally, so memory stays bounded
+by the largest single record. The output is byte-identical to the default mode
+for array input.
+
+Near-duplicate removal (`--dedupe`) keeps one page per cluster of
+near-identical `raw_text_content` (SimHash with LSH banding, see
+near_duplicates.py) and lists the folded URLs per kept page in
+`<output>_duplicates.json`.
+
+Record store output (`--format store`) writes a compact indexed binary file
+(see record_store.py) instead of JSON; record store files are also accepted as
+input in every mode.
+
 Optional dependencies:
   • orjson – faster parsing/dumping for very large files
   • json5  – relaxed JSON5 parsing when `--json5` flag is used
@@ -22,30 +45,34 @@ Optional dependencies:
 from __future__ import annotations
 
 import argparse
-import json
-import re
+import contextlib
+import itertools
+import os
 import sys
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
-try:
-    import orjson  # type: ignore
+try:  # imported as a package module (e.g. from the Scrapy project)
+    from src.python.utils.delta_feed import DeltaFeedWriter
+    from src.python.utils.json_io import JsonArrayWriter, dumps, iter_records, loads as _loads
+    from src.python.utils.near_duplicates import NearDuplicateDetector, duplicates_path
+    from src.python.utils.record_store import SUFFIX as STORE_SUFFIX, RecordStore, RecordStoreWriter, is_record_store
+    from src.python.utils.stand_parser import layout_for, parse_stand_numbers, parse_table
+    from src.python.utils.text_normalizer import TextNormalizer
+except ModuleNotFoundError:  # executed as a script: python src/python/utils/clean_json.py
+    from delta_feed import DeltaFeedWriter
+    from json_io import JsonArrayWriter, dumps, iter_records, loads as _loads
+    from near_duplicates import NearDuplicateDetector, duplicates_path
+    from record_store import SUFFIX as STORE_SUFFIX, RecordStore, RecordStoreWriter, is_record_store
+    from stand_parser import layout_for, parse_stand_numbers, parse_table
+    from text_normalizer import TextNormalizer
 
-    def _dumps(obj: Any) -> str:  # noqa: D401
-        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if _should_indent() else 0).decode()
 
-    def _loads(text: str) -> Any:  # noqa: D401
-        return orjson.loads(text)
-except ModuleNotFoundError:
-
-    def _dumps(obj: Any) -> str:  # noqa: D401
-        # Compact separators drop all spaces after commas/colons.
-        if _should_indent():
-            return json.dumps(obj, indent=2, ensure_ascii=False)
-        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
-
-    def _loads(text: str) -> Any:  # noqa: D401
-        return json.loads(text)
+def _dumps(obj: Any) -> str:  # noqa: D401
+    return dumps(obj, _should_indent())
 
 
 def _loads_json5(text: str) -> Any:  # noqa: D401
@@ -66,7 +93,7 @@ def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:  # noqa: D
         "-o",
         "--output",
         type=Path,
-        help="Where to write cleaned JSON (defaults to <input>.min.json)",
+        help="Where to write cleaned JSON (defaults to <input>.min.json, or <input>.rec with --format store)",
     )
     parser.add_argument(
         "--json5",
@@ -82,7 +109,7 @@ def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:  # noqa: D
     parser.add_argument(
         "--remove-non-ascii",
         action="store_true",
-        help="Remove non-ASCII characters from all string values",
+        help="Fold all string values to ASCII (accents are transliterated, other non-ASCII characters removed)",
     )
     parser.add_argument(
         "-i",
@@ -90,6 +117,51 @@ def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:  # noqa: D
         action="store_true",
         help="Indent the output JSON file for readability.",
     )
+    parser.add_argument(
+        "--delta",
+        action="store_true",
+        help="Compare records with the previous run's snapshot and write added/changed/removed feeds",
+    )
+    parser.add_argument(
+        "--snapshot",
+        type=Path,
+        help="Snapshot used by --delta (defaults to <output>_snapshot.json)",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Process a JSON array or JSON Lines file one record at a time (constant memory)",
+    )
+    parser.add_argument(
+        "--dedupe",
+        action="store_true",
+        help="Drop near-duplicate pages and list them in <output>_duplicates.json",
+    )
+    parser.add_argument(
+        "--dedupe-distance",
+        type=int,
+        default=3,
+        help="Maximum SimHash bit distance for --dedupe (0-3, default: 3)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["json", "store"],
+        default="json",
+        help="Output format: a JSON array (default) or an indexed record store",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="Clean records in N worker processes (0 = one per CPU core)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=256,
+        help="Records sent to a worker at a time with --workers (default: 256)",
+    )
     return parser.parse_args(argv)
 
 
@@ -102,57 +174,105 @@ def _should_indent() -> bool:
 
 
 def extract_artisan_booth_numbers(event):
-    mapping = {}
     raw = event.get('raw_text_content', '')
-    parts = raw.split("Company City Country Booth", 1)
-    if len(parts) < 2:
-        event['stand_numbers'] = mapping
-        return event
-    section = parts[1]
-    # Regex to capture company (group 1) and booth number (group 2), skipping city and country
-    pattern = re.compile(r'([A-Za-z0-9&%\'\-\.\(\) ]+?)\s+[A-Za-z\(\) \-]+?\s+[A-Z]{2}\s+([0-9A-Za-z;]+)')
-    for m in pattern.finditer(section):
-        company = m.group(1).strip()
-        booth = m.group(2).strip()
-        mapping[company] = booth
-    event['stand_numbers'] = mapping
+    event['stand_numbers'] = parse_table(raw, layout_for('artisan', 'list-of-exhibitors'))
     return event
 
 
 def extract_stand_numbers(event):
-    # Route to specialized parser for Artisan list of exhibitors
-    if event.get('event_id') == 'artisan' and 'list-of-exhibitors' in event.get('url', ''):
-        return extract_artisan_booth_numbers(event)
-    # Extract mapping of company names to their stand numbers or showroom location for FFD
-    mapping = {}
-    raw = event.get('raw_text_content', '')
-    # Split on 'Read more' but include first chunk to capture the first exhibitor
-    for chunk in raw.split("Read more"):
-        token = chunk.strip()
-        if not token:
-            continue
-        # Booth entries
-        m = re.search(r'([^\n\r]+?)\s+Booth:\s*(\d+)', token)
-        if m:
-            company = m.group(1).strip()
-            # Remove any leading 'View results ' prefix
-            company = re.sub(r'^View results\s+', '', company)
-            number = m.group(2).strip()
-            mapping[company] = number
-            continue
-        # Showroom entries
-        m2 = re.search(r'([^\n\r]+?)\s+Showroom on location', token)
-        if m2:
-            company = m2.group(1).strip()
-            company = re.sub(r'^View results\s+', '', company)
-            mapping[company] = "Showroom on location"
-            continue
-    event['stand_numbers'] = mapping
+    # Stand numbers extracted from the DOM during the crawl are authoritative;
+    # the text-based parser below only serves feeds without them.
+    if isinstance(event.get('stand_numbers'), dict):
+        return event
+    # Mapping of company names to their stand number (or "Showroom on location"),
+    # parsed with the layout registered for the event in stand_parser.STAND_LAYOUTS
+    event['stand_numbers'] = parse_stand_numbers(
+        event.get('event_id', ''), event.get('url', ''), event.get('raw_text_content', '')
+    )
     return event
 
 
+_normalizers: dict[tuple[bool, bool], TextNormalizer] = {}
+
+
+def _normalizer(collapse: bool, non_ascii: bool) -> TextNormalizer:
+    key = (collapse, non_ascii)
+    if key not in _normalizers:
+        _normalizers[key] = TextNormalizer(collapse=collapse, fold=non_ascii)
+    return _normalizers[key]
+
+
+def collapse_values(obj: Any) -> Any:  # noqa: D401
+    """Collapse whitespace in every string value (in place for dicts and lists)."""
+    return _normalizer(True, False).normalize_tree(obj)
+
+
+def remove_non_ascii(obj: Any) -> Any:  # noqa: D401
+    """Fold every string value to ASCII, transliterating accented characters."""
+    return _normalizer(False, True).normalize_tree(obj)
+
+
+def clean_record(record: Any, collapse: bool = True, non_ascii: bool = True) -> Any:
+    """Apply the cleaning steps of this script to a single record.
+
+    Dicts and lists are modified in place (copy the record first if the
+    original is still needed); stand numbers are added to dict records.
+    """
+    if collapse or non_ascii:
+        normalizer = _normalizer(collapse, non_ascii)
+        record = normalizer.normalize_tree(record)
+        stand_numbers = record.get('stand_numbers') if isinstance(record, dict) else None
+        if isinstance(stand_numbers, dict):
+            # normalize_tree only touches values; the company keys must match the folded exhibitor names
+            record['stand_numbers'] = {normalizer.normalize(name): stand for name, stand in stand_numbers.items()}
+    if isinstance(record, dict):
+        record = extract_stand_numbers(record)
+    return record
+
+
+def _clean_chunk(chunk: list[Any], collapse: bool, non_ascii: bool) -> list[Any]:
+    # Module-level so the process pool can pickle it
+    return [clean_record(record, collapse, non_ascii) for record in chunk]
+
+
+def clean_records(
+    records: Iterable[Any],
+    collapse: bool = True,
+    non_ascii: bool = True,
+    workers: int = 1,
+    chunk_size: int = 256,
+) -> Iterator[Any]:
+    """Yield the cleaned records in input order, optionally using a process pool.
+
+    With ``workers`` > 1 the input is consumed in chunks of ``chunk_size``
+    records and at most ``2 * workers`` chunks are pending, so memory stays
+    bounded when ``records`` is a stream.
+    """
+    if workers <= 1:
+        for record in records:
+            yield clean_record(record, collapse, non_ascii)
+        return
+
+    iterator = iter(records)
+    pending: deque = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while True:
+            while len(pending) < 2 * workers:
+                chunk = list(itertools.islice(iterator, chunk_size))
+                if not chunk:
+                    break
+                pending.append(pool.submit(_clean_chunk, chunk, collapse, non_ascii))
+            if not pending:
+                return
+            yield from pending.popleft().result()
+
+
 def main() -> None:
     args = _parse_args()
+    if args.workers <= 0:
+        args.workers = os.cpu_count() or 1
+    if args.chunk_size <= 0:
+        sys.exit("Error: --chunk-size must be positive")
 
     global _indent_output
     _indent_output = args.indent
@@ -160,64 +280,143 @@ def main() -> None:
     input_path: Path = args.input
     if not input_path.exists():
         sys.exit(f"Error: file not found: {input_path}")
-
-    try:
-        raw = input_path.read_text(encoding="utf-8")
-    except Exception as exc:
-        sys.exit(f"Could not read {input_path}: {exc}")
-
-    try:
-        loader = _loads_json5 if args.json5 else _loads
-        data = loader(raw)
-    except Exception as exc:
-        sys.exit(f"Failed to parse JSON{'5' if args.json5 else ''}: {exc}")
+    default_suffix = STORE_SUFFIX if args.format == "store" else ".min.json"
+    output_path: Path = args.output or input_path.with_suffix(default_suffix)
+
+    if args.stream:
+        if args.json5:
+            sys.exit("Error: --stream does not support --json5 input")
+        _stream(args, input_path, output_path)
+        return
+
+    old_size = input_path.stat().st_size
+    if is_record_store(input_path):
+        try:
+            with RecordStore(input_path) as store:
+                data = list(store)
+        except Exception as exc:
+            sys.exit(f"Could not read record store {input_path}: {exc}")
+    else:
+        try:
+            raw = input_path.read_text(encoding="utf-8")
+        except Exception as exc:
+            sys.exit(f"Could not read {input_path}: {exc}")
+
+        try:
+            loader = _loads_json5 if args.json5 else _loads
+            data = loader(raw)
+        except Exception as exc:
+            sys.exit(f"Failed to parse JSON{'5' if args.json5 else ''}: {exc}")
 
     # ------------------------------------------------------------------
     # Optional: collapse whitespace inside string values
     # ------------------------------------------------------------------
-
-    if args.collapse_values:
-
-        def _collapse(obj: Any) -> Any:  # noqa: D401
-            if isinstance(obj, str):
-                obj = re.sub(r"\s+", " ", obj).strip()
-                # Always remove non-ASCII characters when collapsing values
-                obj = obj.encode("ascii", "ignore").decode("utf-8")
-                return obj
-            if isinstance(obj, list):
-                return [_collapse(i) for i in obj]
-            if isinstance(obj, dict):
-                return {k: _collapse(v) for k, v in obj.items()}
-            return obj
-
-        data = _collapse(data)
-    elif args.remove_non_ascii:  # Handle remove_non_ascii even if not collapsing
-        def _remove_non_ascii_only(obj: Any) -> Any: # noqa: D401
-            if isinstance(obj, str):
-                return obj.encode("ascii", "ignore").decode("utf-8")
-            if isinstance(obj, list):
-                return [_remove_non_ascii_only(i) for i in obj]
-            if isinstance(obj, dict):
-                return {k: _remove_non_ascii_only(v) for k, v in obj.items()}
-            return obj
-        data = _remove_non_ascii_only(data)
-
-    # After loading and (optionally) collapsing/cleaning data, but before dumping to output
+    detector = _detector(args)
+    dropped: list[dict] = []
     if isinstance(data, list):
-        data = [extract_stand_numbers(event) for event in data]
+        records = clean_records(data, args.collapse_values, args.remove_non_ascii, args.workers, args.chunk_size)
+        data = list(_drop_near_duplicates(records, detector, dropped.append))
     elif isinstance(data, dict):
-        data = extract_stand_numbers(data)
-
-    compact = _dumps(data)
+        data = clean_record(data, args.collapse_values, args.remove_non_ascii)
 
-    output_path: Path = args.output or input_path.with_suffix(".min.json")
     try:
-        output_path.write_text(compact, encoding="utf-8")
+        if args.format == "store":
+            with RecordStoreWriter(output_path) as writer:
+                for record in data if isinstance(data, list) else [data]:
+                    writer.write(record)
+            new_size = writer.bytes_written
+        else:
+            compact = _dumps(data)
+            output_path.write_text(compact, encoding="utf-8")
+            new_size = len(compact.encode())
     except Exception as exc:
         sys.exit(f"Could not write {output_path}: {exc}")
 
-    old_size = len(raw.encode())
-    new_size = len(compact.encode())
+    _print_summary(input_path, output_path, old_size, new_size)
+    _write_duplicates(detector, output_path)
+
+    if args.delta:
+        records = data if isinstance(data, list) else [data]
+        _write_delta_feeds(records, output_path, args.snapshot, dropped)
+
+
+def _stream(args: argparse.Namespace, input_path: Path, output_path: Path) -> None:
+    """Clean ``input_path`` record by record, writing the array as records arrive."""
+    if output_path.resolve() == input_path.resolve():
+        sys.exit("Error: --stream cannot write its output over the input file")
+
+    delta = None
+    detector = _detector(args)
+    try:
+        with contextlib.ExitStack() as stack:
+            if is_record_store(input_path):
+                source = stack.enter_context(RecordStore(input_path))
+            else:
+                source = iter_records(stack.enter_context(input_path.open(encoding="utf-8")))
+            if args.format == "store":
+                writer = stack.enter_context(RecordStoreWriter(output_path))
+            else:
+                dst = stack.enter_context(output_path.open("w", encoding="utf-8"))
+                writer = JsonArrayWriter(dst, _should_indent())
+                stack.callback(writer.close)
+            if args.delta:
+                delta = DeltaFeedWriter(output_path, args.snapshot, _should_indent())
+            records = clean_records(
+                source, args.collapse_values, args.remove_non_ascii, args.workers, args.chunk_size
+            )
+            for record in _drop_near_duplicates(records, detector, delta.keep if delta is not None else None):
+                writer.write(record)
+                if delta is not None and isinstance(record, dict):
+                    delta.write(record)
+    except ValueError as exc:
+        sys.exit(f"Failed to parse JSON: {exc}")
+    except OSError as exc:
+        sys.exit(f"Could not stream {input_path} → {output_path}: {exc}")
+
+    _print_summary(input_path, output_path, input_path.stat().st_size, writer.bytes_written)
+    _write_duplicates(detector, output_path)
+
+    if delta is not None:
+        try:
+            delta.close()
+        except Exception as exc:
+            sys.exit(f"Could not write delta feeds for {output_path}: {exc}")
+        print(f"  Delta: {delta.summary()}")
+
+
+def _detector(args: argparse.Namespace) -> NearDuplicateDetector | None:
+    if not args.dedupe:
+        return None
+    try:
+        return NearDuplicateDetector(max_distance=args.dedupe_distance)
+    except ValueError as exc:
+        sys.exit(f"Error: invalid --dedupe-distance: {exc}")
+
+
+def _drop_near_duplicates(
+    records: Iterable[Any],
+    detector: NearDuplicateDetector | None,
+    on_drop: Callable[[dict], None] | None = None,
+) -> Iterator[Any]:
+    for record in records:
+        if detector is None or not isinstance(record, dict) or detector.check(record) is None:
+            yield record
+        elif on_drop is not None:
+            on_drop(record)
+
+
+def _write_duplicates(detector: NearDuplicateDetector | None, output_path: Path) -> None:
+    if detector is None:
+        return
+    path = duplicates_path(output_path)
+    try:
+        path.write_text(dumps(detector.duplicate_clusters(), _should_indent()), encoding="utf-8")
+    except Exception as exc:
+        sys.exit(f"Could not write {path}: {exc}")
+    print(f"  Near-duplicates: {detector.summary()} → {path.name}")
+
+
+def _print_summary(input_path: Path, output_path: Path, old_size: int, new_size: int) -> None:
     saved_pct = (1 - new_size / old_size) * 100 if old_size else 0
     print(
         f"✔ Cleaned {input_path.name} → {output_path.name}\n"
@@ -226,5 +425,21 @@ def main() -> None:
     )
 
 
+def _write_delta_feeds(
+    records: list[dict], output_path: Path, snapshot: Path | None, dropped: Iterable[dict] = ()
+) -> None:
+    try:
+        writer = DeltaFeedWriter(output_path, snapshot, _should_indent())
+        for record in records:
+            writer.write(record)
+        for record in dropped:
+            # Near-duplicates are still on the site: not removed
+            writer.keep(record)
+        writer.close()
+    except Exception as exc:
+        sys.exit(f"Could not write delta feeds for {output_path}: {exc}")
+    print(f"  Delta: {writer.summary()}")
+
+
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,146 @@
+"""
+delta_feed.py – Classify cleaned records against the previous run's snapshot.
+
+Each record is identified by its URL and fingerprinted with a hash of its
+whitespace-normalised ``raw_text_content``. Comparing the fingerprints with the
+snapshot written by the previous run splits the output into three feeds:
+
+  • added   – URL not present in the previous snapshot
+  • changed – URL present, but the content hash differs
+  • removed – URL present in the previous snapshot but not seen in this run
+
+Only the added/changed feeds need to be re-embedded downstream; the removed
+feed lists the URLs whose documents can be deleted.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+try:  # imported as a package module (e.g. from the Scrapy project)
+    from src.python.utils.json_io import JsonArrayWriter, dumps
+except ModuleNotFoundError:  # executed from the utils directory as a script
+    from json_io import JsonArrayWriter, dumps
+
+ADDED = "added"
+CHANGED = "changed"
+UNCHANGED = "unchanged"
+
+
+def content_hash(text: str) -> str:
+    """Hash ``text`` after collapsing whitespace, so re-flowed text is not a change."""
+    return hashlib.sha1(" ".join(text.split()).encode("utf-8")).hexdigest()
+
+
+def delta_paths(output_path: Path) -> dict[str, Path]:
+    """Return the snapshot and feed paths that belong to a cleaned output file."""
+    stem = output_path.with_suffix("")
+    return {
+        "snapshot": Path(f"{stem}_snapshot.json"),
+        ADDED: Path(f"{stem}_added.json"),
+        CHANGED: Path(f"{stem}_changed.json"),
+        "removed": Path(f"{stem}_removed.json"),
+    }
+
+
+class DeltaTracker:
+    """Streaming classifier: feed records one at a time, then ask for the removed URLs."""
+
+    def __init__(self, snapshot_path: Path):
+        self.snapshot_path = Path(snapshot_path)
+        self._previous: dict[str, dict[str, str]] = {}
+        self._current: dict[str, dict[str, str]] = {}
+        self.counts = {ADDED: 0, CHANGED: 0, UNCHANGED: 0}
+        if self.snapshot_path.exists():
+            try:
+                self._previous = json.loads(self.snapshot_path.read_text(encoding="utf-8"))
+            except ValueError:
+                # Treat an unreadable snapshot as a first run: everything is "added".
+                self._previous = {}
+
+    def classify(self, record: dict[str, Any]) -> str:
+        url = record.get("url", "")
+        digest = content_hash(record.get("raw_text_content") or "")
+        self._current[url] = {"event_id": record.get("event_id", ""), "content_hash": digest}
+
+        previous = self._previous.get(url)
+        if previous is None:
+            status = ADDED
+        elif previous.get("content_hash") != digest:
+            status = CHANGED
+        else:
+            status = UNCHANGED
+        self.counts[status] += 1
+        return status
+
+    def keep(self, record: dict[str, Any]) -> None:
+        """Note a URL that was seen but left out of the output (e.g. a near-duplicate).
+
+        It keeps its previous snapshot entry, so it is not listed as removed and
+        is classified against what was last written downstream on the next run.
+        """
+        url = record.get("url", "")
+        previous = self._previous.get(url)
+        if previous is not None and url not in self._current:
+            self._current[url] = previous
+
+    def removed(self) -> list[dict[str, str]]:
+        return [
+            {"event_id": entry.get("event_id", ""), "url": url, "content_hash": entry.get("content_hash", "")}
+            for url, entry in self._previous.items()
+            if url not in self._current
+        ]
+
+    def save(self) -> None:
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.snapshot_path.with_suffix(self.snapshot_path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(self._current, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, self.snapshot_path)
+
+
+class DeltaFeedWriter:
+    """Stream records into the added/changed feeds, then write the removed feed and snapshot on close()."""
+
+    def __init__(self, output_path: Path, snapshot: Path | None = None, indent: bool = False):
+        self.paths = delta_paths(Path(output_path))
+        self.tracker = DeltaTracker(snapshot or self.paths["snapshot"])
+        self._indent = indent
+        self._files = {status: open(self.paths[status], "w", encoding="utf-8") for status in (ADDED, CHANGED)}
+        self._writers = {status: JsonArrayWriter(f, indent) for status, f in self._files.items()}
+        self.removed_count = 0
+
+    def write(self, record: dict[str, Any]) -> str:
+        status = self.tracker.classify(record)
+        writer = self._writers.get(status)
+        if writer is not None:
+            writer.write(record)
+        return status
+
+    def keep(self, record: dict[str, Any]) -> None:
+        self.tracker.keep(record)
+
+    def close(self, complete: bool = True) -> None:
+        """Close the feeds; the removed feed and snapshot are only written for a ``complete`` run.
+
+        A run that stopped early has not seen every URL, so it can tell neither
+        what was removed nor what the next run should compare against.
+        """
+        for status, writer in self._writers.items():
+            writer.close()
+            self._files[status].close()
+        if not complete:
+            return
+        removed = self.tracker.removed()
+        self.removed_count = len(removed)
+        self.paths["removed"].write_text(dumps(removed, self._indent), encoding="utf-8")
+        self.tracker.save()
+
+    def summary(self) -> str:
+        counts = self.tracker.counts
+        return (
+            f"{counts[ADDED]} added, {counts[CHANGED]} changed, "
+            f"{self.removed_count} removed, {counts[UNCHANGED]} unchanged"
+        )
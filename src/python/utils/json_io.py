@@ -0,0 +1,146 @@
+"""
+json_io.py – JSON (de)serialisation helpers shared by the cleaning tools.
+
+Uses orjson when it is installed and falls back to the standard library. Both
+paths produce the same layout: compact separators, or a two-space indent.
+"""
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+from typing import IO, Any
+
+try:
+    import orjson  # type: ignore
+
+    def dumps(obj: Any, indent: bool = False) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+
+    def loads(text: str | bytes) -> Any:
+        return orjson.loads(text)
+except ModuleNotFoundError:
+
+    def dumps(obj: Any, indent: bool = False) -> str:
+        # Compact separators drop all spaces after commas/colons.
+        if indent:
+            return json.dumps(obj, indent=2, ensure_ascii=False)
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+    def loads(text: str | bytes) -> Any:
+        return json.loads(text)
+
+
+class JsonArrayWriter:
+    """Write a JSON array one record at a time.
+
+    The output is byte-identical to ``dumps(records, indent)`` for the same
+    records, so streaming writers and whole-file writers are interchangeable.
+    """
+
+    def __init__(self, fp: IO[str], indent: bool = False):
+        self._fp = fp
+        self._indent = indent
+        self.count = 0
+        self.bytes_written = 0
+
+    def _emit(self, text: str) -> None:
+        self._fp.write(text)
+        self.bytes_written += len(text.encode("utf-8"))
+
+    def write(self, record: Any) -> None:
+        text = dumps(record, self._indent)
+        if self._indent:
+            # Nest the record one level deeper; newlines inside strings are escaped
+            text = "  " + text.replace("\n", "\n  ")
+            separator = "[\n" if self.count == 0 else ",\n"
+        else:
+            separator = "[" if self.count == 0 else ","
+        self._emit(separator + text)
+        self.count += 1
+
+    def close(self) -> None:
+        if self.count == 0:
+            self._emit("[]")
+        else:
+            self._emit("\n]" if self._indent else "]")
+
+
+def iter_records(fp: IO[str], chunk_size: int = 1 << 16) -> Iterator[Any]:
+    """Yield the records of a JSON array or a JSON Lines stream one at a time.
+
+    Only the record being decoded (plus one read chunk) is held in memory, so
+    arbitrarily large feeds can be processed in bounded memory.
+    """
+    buf = fp.read(chunk_size)
+    pos = _skip_ws(buf, 0)
+    while pos == len(buf):
+        more = fp.read(chunk_size)
+        if not more:
+            return  # empty input
+        buf += more
+        pos = _skip_ws(buf, pos)
+
+    if buf[pos] != "[":
+        # JSON Lines: one record per line
+        for line in _lines(buf[pos:], fp):
+            if line.strip():
+                yield loads(line)
+        return
+
+    decoder = json.JSONDecoder()
+    pos += 1
+    eof = False
+    expect_value = True
+    while True:
+        pos = _skip_ws(buf, pos)
+        if pos == len(buf):
+            if eof:
+                raise ValueError("Unexpected end of JSON array")
+            buf, pos, eof = _refill(fp, buf, pos, chunk_size)
+            continue
+        char = buf[pos]
+        if char == "]":
+            return
+        if not expect_value:
+            if char != ",":
+                raise ValueError(f"Expected ',' or ']' at offset {pos} of the current buffer, got {char!r}")
+            pos += 1
+            expect_value = True
+            continue
+        try:
+            record, end = decoder.raw_decode(buf, pos)
+        except ValueError:
+            # Usually a record cut off by the chunk boundary; read at least as much
+            # again so a large record is re-decoded a logarithmic number of times
+            if eof:
+                raise
+            buf, pos, eof = _refill(fp, buf, pos, max(chunk_size, len(buf) - pos))
+            continue
+        if end == len(buf) and not eof:
+            # A number may continue in the next chunk; decode again with more input
+            buf, pos, eof = _refill(fp, buf, pos, chunk_size)
+            continue
+        yield record
+        pos = end
+        expect_value = False
+
+
+def _skip_ws(buf: str, pos: int) -> int:
+    while pos < len(buf) and buf[pos] in " \t\r\n":
+        pos += 1
+    return pos
+
+
+def _refill(fp: IO[str], buf: str, pos: int, size: int) -> tuple[str, int, bool]:
+    """Drop the consumed prefix and append up to ``size`` more characters."""
+    more = fp.read(size)
+    return buf[pos:] + more, 0, not more
+
+
+def _lines(head: str, fp: IO[str]) -> Iterator[str]:
+    # The first chunk may end in the middle of a line; glue it to the rest of that line
+    *complete, partial = head.split("\n")
+    yield from complete
+    rest = fp.readline()
+    yield partial + rest
+    yield from fp
@@ -0,0 +1,127 @@
+"""
+near_duplicates.py – Near-duplicate page detection with SimHash and LSH banding.
+
+Every page gets a 64-bit SimHash over word 3-shingles of its
+``raw_text_content``. Two pages are near-duplicates when their fingerprints
+differ in at most ``max_distance`` bits (3 by default, i.e. ~95 % similar).
+
+Instead of comparing every pair, the fingerprint is split into ``bands``
+16-bit bands and only pages that share at least one band value are compared.
+With 4 bands and a distance of at most 3 bits, two near-duplicates always
+share a band (3 differing bits can touch at most 3 bands), so banding loses
+no matches while keeping the work per page roughly constant.
+
+The first page of a cluster is its representative; later members are folded
+into it and their URLs are returned by ``duplicate_clusters()``. Pages are only
+compared within the same ``event_id``, and pages shorter than ``min_tokens``
+words are never folded: short pages (contact, imprint) legitimately look alike.
+"""
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from typing import Any
+
+FINGERPRINT_BITS = 64
+# _BIT_TABLES[bit] maps every byte value to 1 if that bit is set, else 0
+_BIT_TABLES = [bytes(value >> bit & 1 for value in range(256)) for bit in range(8)]
+
+
+def simhash(text: str, shingle_size: int = 3) -> int:
+    """64-bit SimHash of the word shingles of ``text`` (case-insensitive)."""
+    words = text.lower().split()
+    if len(words) < shingle_size:
+        shingles = {" ".join(words)} if words else set()
+    else:
+        shingles = {" ".join(words[i:i + shingle_size]) for i in range(len(words) - shingle_size + 1)}
+    if not shingles:
+        return 0
+
+    digests = b"".join(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest() for s in shingles)
+    threshold = len(shingles) / 2
+    fingerprint = 0
+    # Count the set bits column by column with bytes.translate/count instead of per-shingle loops
+    for position in range(8):
+        column = digests[position::8]
+        for bit in range(8):
+            if column.translate(_BIT_TABLES[bit]).count(1) > threshold:
+                fingerprint |= 1 << ((7 - position) * 8 + bit)
+    return fingerprint
+
+
+class NearDuplicateDetector:
+    """Online near-duplicate detector; see the module docstring for the approach."""
+
+    def __init__(self, max_distance: int = 3, bands: int = 4, min_tokens: int = 50):
+        if FINGERPRINT_BITS % bands:
+            raise ValueError(f"bands must divide {FINGERPRINT_BITS}")
+        if max_distance >= bands:
+            # Otherwise two near-duplicates may differ in every band and be missed
+            raise ValueError("max_distance must be smaller than the number of bands")
+        self.max_distance = max_distance
+        self.bands = bands
+        self.min_tokens = min_tokens
+        self._band_bits = FINGERPRINT_BITS // bands
+        self._band_mask = (1 << self._band_bits) - 1
+        # (event_id, band index, band value) -> representative ids
+        self._buckets: dict[tuple[str, int, int], list[int]] = {}
+        self._fingerprints: list[int] = []
+        self._urls: list[str] = []
+        self._folded: list[list[str]] = []  # folded URLs per representative id
+        self.pages = 0
+        self.comparisons = 0
+
+    def _band_keys(self, event_id: str, fingerprint: int) -> list[tuple[str, int, int]]:
+        return [
+            (event_id, band, fingerprint >> (band * self._band_bits) & self._band_mask)
+            for band in range(self.bands)
+        ]
+
+    def check(self, record: dict[str, Any]) -> str | None:
+        """Return the representative URL ``record`` folds into, or None if it is kept."""
+        self.pages += 1
+        text = record.get("raw_text_content") or ""
+        if len(text.split()) < self.min_tokens:
+            return None
+
+        fingerprint = simhash(text)
+        keys = self._band_keys(record.get("event_id") or "", fingerprint)
+        seen = set()
+        for key in keys:
+            for candidate in self._buckets.get(key, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                self.comparisons += 1
+                if (fingerprint ^ self._fingerprints[candidate]).bit_count() <= self.max_distance:
+                    self._folded[candidate].append(record.get("url", ""))
+                    return self._urls[candidate]
+
+        representative_id = len(self._fingerprints)
+        self._fingerprints.append(fingerprint)
+        self._urls.append(record.get("url", ""))
+        self._folded.append([])
+        for key in keys:
+            self._buckets.setdefault(key, []).append(representative_id)
+        return None
+
+    @property
+    def folded(self) -> int:
+        return sum(len(urls) for urls in self._folded)
+
+    def duplicate_clusters(self) -> dict[str, list[str]]:
+        """Representative URL -> folded URLs, for clusters with at least one duplicate."""
+        clusters: dict[str, list[str]] = {}
+        for url, folded in zip(self._urls, self._folded):
+            if folded:
+                clusters.setdefault(url, []).extend(folded)
+        return clusters
+
+    def summary(self) -> str:
+        return f"{self.folded} of {self.pages} pages folded into {len(self.duplicate_clusters())} representatives"
+
+
+def duplicates_path(output_path: Path) -> Path:
+    """Sidecar listing the folded URLs per representative: ``<output>_duplicates.json``."""
+    output_path = Path(output_path)
+    return output_path.with_name(output_path.with_suffix("").name + "_duplicates.json")
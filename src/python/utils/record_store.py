@@ -0,0 +1,201 @@
+"""
+record_store.py – Compact, indexed on-disk format for processed crawl data.
+
+A record store is a single file:
+
+    header   8 bytes   MAGIC
+    records  n times   <uint32 length><zlib-compressed compact JSON record>
+    index    1 time    zlib-compressed JSON: record offsets plus url/event_id lookups
+    footer   16 bytes  <uint64 index offset><uint32 index length>FOOTER_MAGIC
+
+``RecordStore`` memory-maps the file and only reads the index when opened, so
+iterating, fetching record ``i`` or looking a page up by URL never parses the
+rest of the file. ``RecordStoreWriter`` writes records one at a time (bounded
+memory) to a temporary file that replaces the target on ``close()``.
+
+Usage:
+    with RecordStoreWriter("data/processed/ffd_site_data_cleaned.rec") as writer:
+        for record in records:
+            writer.write(record)
+
+    with RecordStore("data/processed/ffd_site_data_cleaned.rec") as store:
+        page = store.get("https://www.flandersflooringdays.com/en/exhibitors")
+        for record in store.by_event("ffd"):
+            ...
+"""
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import zlib
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+try:  # imported as a package module
+    from src.python.utils.json_io import dumps, loads
+except ModuleNotFoundError:  # executed next to this file as a script
+    from json_io import dumps, loads
+
+MAGIC = b"XPOREC\x00\x01"
+FOOTER_MAGIC = b"XIDX"
+SUFFIX = ".rec"
+
+_LENGTH = struct.Struct("<I")
+_FOOTER = struct.Struct("<QI4s")
+
+
+class RecordStoreError(ValueError):
+    """The file is not a record store or is truncated/corrupt."""
+
+
+def is_record_store(path: str | Path) -> bool:
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+class RecordStoreWriter:
+    """Append records to a new record store; the file appears on ``close()``."""
+
+    def __init__(self, path: str | Path, level: int = 6):
+        self.path = Path(path)
+        self.level = level
+        self._tmp_path = self.path.with_name(self.path.name + ".tmp")
+        self._file = open(self._tmp_path, "wb")
+        self._file.write(MAGIC)
+        self._offsets: list[int] = []
+        self._urls: dict[str, int] = {}
+        self._events: dict[str, list[int]] = {}
+        self.count = 0
+        self.bytes_written = len(MAGIC)
+
+    def write(self, record: Any) -> None:
+        data = zlib.compress(dumps(record).encode("utf-8"), self.level)
+        self._offsets.append(self.bytes_written)
+        if isinstance(record, dict):
+            url = record.get("url")
+            if url:
+                self._urls[url] = self.count
+            event_id = record.get("event_id")
+            if event_id:
+                self._events.setdefault(event_id, []).append(self.count)
+        self._file.write(_LENGTH.pack(len(data)))
+        self._file.write(data)
+        self.bytes_written += _LENGTH.size + len(data)
+        self.count += 1
+
+    def close(self) -> None:
+        index = zlib.compress(
+            dumps({"offsets": self._offsets, "url": self._urls, "event_id": self._events}).encode("utf-8"),
+            self.level,
+        )
+        index_offset = self.bytes_written
+        self._file.write(index)
+        self._file.write(_FOOTER.pack(index_offset, len(index), FOOTER_MAGIC))
+        self.bytes_written += len(index) + _FOOTER.size
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+
+    def abort(self) -> None:
+        self._file.close()
+        self._tmp_path.unlink(missing_ok=True)
+
+    def __enter__(self) -> RecordStoreWriter:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class RecordStore:
+    """Read-only, memory-mapped view of a record store."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as exc:  # empty file
+            self._file.close()
+            raise RecordStoreError(f"{self.path} is empty") from exc
+        try:
+            self._read_index()
+        except Exception:
+            self.close()
+            raise
+
+    def _read_index(self) -> None:
+        size = len(self._map)
+        if size < len(MAGIC) + _FOOTER.size or self._map[:len(MAGIC)] != MAGIC:
+            raise RecordStoreError(f"{self.path} is not a record store")
+        index_offset, index_length, footer_magic = _FOOTER.unpack_from(self._map, size - _FOOTER.size)
+        if footer_magic != FOOTER_MAGIC or index_offset + index_length > size - _FOOTER.size:
+            raise RecordStoreError(f"{self.path} is truncated (missing index)")
+        index = loads(zlib.decompress(self._map[index_offset:index_offset + index_length]))
+        self._offsets: list[int] = index["offsets"]
+        self._urls: dict[str, int] = index["url"]
+        self._events: dict[str, list[int]] = index["event_id"]
+
+    def _record_at(self, offset: int) -> Any:
+        (length,) = _LENGTH.unpack_from(self._map, offset)
+        start = offset + _LENGTH.size
+        return loads(zlib.decompress(self._map[start:start + length]))
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __getitem__(self, position: int) -> Any:
+        return self._record_at(self._offsets[position])
+
+    def __iter__(self) -> Iterator[Any]:
+        for offset in self._offsets:
+            yield self._record_at(offset)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._urls
+
+    def get(self, url: str, default: Any = None) -> Any:
+        position = self._urls.get(url)
+        return default if position is None else self[position]
+
+    def by_event(self, event_id: str) -> Iterator[Any]:
+        for position in self._events.get(event_id, ()):
+            yield self[position]
+
+    @property
+    def urls(self) -> list[str]:
+        return list(self._urls)
+
+    @property
+    def event_ids(self) -> list[str]:
+        return list(self._events)
+
+    def close(self) -> None:
+        if getattr(self, "_map", None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self) -> RecordStore:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def read_records(path: str | Path) -> list[Any]:
+    """Load every record of a record store or a JSON array file."""
+    if is_record_store(path):
+        with RecordStore(path) as store:
+            return list(store)
+    data = loads(Path(path).read_bytes())
+    if not isinstance(data, list):
+        raise ValueError(f"{path} must contain a JSON array of records")
+    return data
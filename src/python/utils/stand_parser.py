@@ -0,0 +1,289 @@
+"""
+stand_parser.py – Linear-time stand number parsing from ``raw_text_content``.
+
+Both parsers return exactly what the regexes they replace returned (including
+their quirks) in time linear in the input, whatever it contains:
+
+  • cards are found with ``str.split``/``str.find`` only
+  • tables are cut into rows at every "<CC> <booth>" and the row regex is run
+    on one row at a time (at most MAX_ROW_CHARS each); a page where that does
+    not hold falls back to a token walk that never backs up
+
+The layouts are data: a show is added by registering a ``CardLayout`` or
+``TableLayout`` in ``STAND_LAYOUTS``, and a table's regex is built from the
+characters its layout allows in each column.
+
+Two page layouts are supported:
+
+  • cards (FFD and the default): exhibitor cards separated by "Read more",
+    each with "<company> Booth: <number>" or "<company> Showroom on location"
+  • tables (Artisan): a header row followed by "<company> <city> <CC> <booth>"
+    rows, where CC is a two-letter country code; the allowed characters of
+    each column are part of the layout
+
+Example:
+    >>> parse_stand_numbers("artisan", "https://x/list-of-exhibitors",
+    ...                     "Company City Country Booth Woodcraft NV 4 Lille FR 7")
+    {'Woodcraft NV 4': '7'}
+"""
+from __future__ import annotations
+
+import functools
+import re
+import string
+from typing import NamedTuple
+
+
+class CardLayout(NamedTuple):
+    separator: str = "Read more"
+    booth_label: str = "Booth:"
+    showroom: str = "Showroom on location"
+    strip_prefix: str = "View results"
+
+
+class TableLayout(NamedTuple):
+    header: tuple[str, ...] = ("Company", "City", "Country", "Booth")
+    # Characters allowed in each column; the country column is a two-letter upper-case code
+    company_chars: frozenset[str] = frozenset(string.ascii_letters + string.digits + "&%'-.() ")
+    city_chars: frozenset[str] = frozenset(string.ascii_letters + "() -")
+    booth_chars: frozenset[str] = frozenset(string.ascii_letters + string.digits + ";")
+
+
+# Longest row the table regex is run on, and the most cuts it is tried at: its cost
+# grows with the square of the row length
+MAX_ROW_CHARS = 256
+MAX_ROW_CUTS = 3
+
+# (event_id, substring of the URL, layout); the first match wins, "" matches everything
+STAND_LAYOUTS: list[tuple[str, str, CardLayout | TableLayout]] = [
+    ("artisan", "list-of-exhibitors", TableLayout()),
+    ("", "", CardLayout()),
+]
+
+
+def layout_for(event_id: str, url: str) -> CardLayout | TableLayout:
+    for layout_event, url_part, layout in STAND_LAYOUTS:
+        if (not layout_event or layout_event == event_id) and url_part in url:
+            return layout
+    return CardLayout()
+
+
+def parse_stand_numbers(event_id: str, url: str, text: str) -> dict[str, str]:
+    """Return {company: booth} for a page, using the layout registered for it."""
+    layout = layout_for(event_id, url)
+    if isinstance(layout, TableLayout):
+        return parse_table(text, layout)
+    return parse_cards(text, layout)
+
+
+def _is_country(token: str) -> bool:
+    return len(token) == 2 and token.isascii() and token.isupper() and token.isalpha()
+
+
+def _find_label(card: str, label: str, number: bool) -> tuple[int, str] | None:
+    """Position of the first ``label`` in ``card`` that follows whitespace, and the number after it.
+
+    With ``number`` the label only counts when whitespace and digits follow it.
+    """
+    position = card.find(label, 1)
+    while position >= 0:
+        if card[position - 1].isspace():
+            if not number:
+                return position, ""
+            start = position + len(label)
+            while start < len(card) and card[start].isspace():
+                start += 1
+            end = start
+            while end < len(card) and card[end].isdecimal():
+                end += 1
+            if end > start:
+                return position, card[start:end]
+        position = card.find(label, position + 1)
+    return None
+
+
+def _company_before(card: str, position: int, strip_prefix: str) -> str:
+    """The text on the line before the whitespace that precedes ``card[position]``."""
+    end = position
+    while card[end - 1].isspace():
+        end -= 1
+    start = max(card.rfind("\n", 0, end), card.rfind("\r", 0, end)) + 1
+    company = card[start:end].strip()
+    if strip_prefix and company.startswith(strip_prefix) and company[len(strip_prefix):len(strip_prefix) + 1].isspace():
+        company = company[len(strip_prefix):].lstrip()
+    return company
+
+
+def parse_cards(text: str, layout: CardLayout = CardLayout()) -> dict[str, str]:
+    """Parse "<company> Booth: <n>" / "<company> Showroom on location" cards.
+
+    A booth number wins over "Showroom on location" in the same card; the
+    company is the rest of the line before the label.
+    """
+    mapping: dict[str, str] = {}
+    for card in text.split(layout.separator):
+        card = card.strip()
+        if not card:
+            continue
+        found = _find_label(card, layout.booth_label, number=True)
+        if found:
+            mapping[_company_before(card, found[0], layout.strip_prefix)] = found[1]
+            continue
+        found = _find_label(card, layout.showroom, number=False)
+        if found:
+            mapping[_company_before(card, found[0], layout.strip_prefix)] = layout.showroom
+    return mapping
+
+
+def _char_class(chars: frozenset[str]) -> str:
+    return "[" + "".join(re.escape(char) for char in sorted(chars)) + "]"
+
+
+@functools.lru_cache(maxsize=None)
+def _table_patterns(layout: TableLayout) -> tuple[re.Pattern, re.Pattern]:
+    """The layout's row regex (the Artisan one for the default layout) and the "<CC> <booth>" end of a row."""
+    booth = _char_class(layout.booth_chars) + "+"
+    row = re.compile(
+        f"({_char_class(layout.company_chars)}+?)\\s+{_char_class(layout.city_chars)}+?\\s+[A-Z]{{2}}\\s+({booth})"
+    )
+    return row, re.compile(f"\\s[A-Z]{{2}}\\s+({booth})")
+
+
+def parse_table(text: str, layout: TableLayout = TableLayout()) -> dict[str, str]:
+    """Parse "<company> <city> <CC> <booth>" rows following ``layout.header``.
+
+    A row takes the shortest company that leaves only city words before a
+    country code and a booth, so "Woodcraft NV 4 Lille FR 7" gives
+    "Woodcraft NV 4" and "Floorex Sint Niklaas BE 5" gives "Floorex".
+    """
+    header = " ".join(layout.header)
+    found = text.find(header)
+    if found < 0:
+        return {}
+    text = text[found + len(header):]
+    mapping = _match_rows(text, layout)
+    return mapping if mapping is not None else _walk_rows(text, layout)
+
+
+def _match_rows(text: str, layout: TableLayout) -> dict[str, str] | None:
+    """The common case: the row regex, anchored at each row and bounded by its length.
+
+    Rows are cut after a "<CC> <booth>"; when the regex finds no row up to a
+    cut (say "Woodcraft NV 29 ..." has a fake one in the name) the row runs on
+    to the next cut, at most MAX_ROW_CUTS times. Each row of at most
+    MAX_ROW_CHARS must be exactly one regex match, and then the mapping is the
+    one the regex returns over the whole text. Returns None for anything else,
+    which ``_walk_rows`` handles.
+    """
+    row, row_end = _table_patterns(layout)
+    mapping: dict[str, str] = {}
+    start = stop = 0
+    cuts = 0
+    for end in row_end.finditer(text):
+        stop = end.end()
+        if layout.city_chars.issuperset(end.group(1)):
+            # A booth of letters only could also be part of the next row's city: no safe cut here
+            continue
+        if stop - start > MAX_ROW_CHARS:
+            return None
+        match = row.match(text, start, stop)
+        if match is None:
+            cuts += 1
+            if cuts == MAX_ROW_CUTS:
+                return None
+            continue
+        if match.end() != stop:
+            return None
+        mapping[match.group(1).strip()] = match.group(2)
+        start, cuts = stop, 0
+    if stop != start:
+        return None
+    # No "<CC> <booth>" after the last row, so the regex matches nothing there either
+    return mapping
+
+
+def _walk_rows(text: str, layout: TableLayout) -> dict[str, str]:
+    """Linear-time equivalent of the row regex over the whole text, for pages ``_match_rows`` rejects.
+
+    Three right-to-left passes precompute, for every token, where a row ending
+    there would find its country code; the left-to-right pass then never looks
+    back.
+    """
+    mapping: dict[str, str] = {}
+    tokens = text.split()
+    count = len(tokens)
+    starts = []
+    gaps = []  # the whitespace before each token
+    position = 0
+    for token in tokens:
+        start = text.find(token, position)
+        starts.append(start)
+        gaps.append(text[position:start])
+        position = start + len(token)
+
+    # Columns within a row are separated by any whitespace, words within a column by spaces only
+    spaced = [index > 0 and not gap.strip(" ") for index, gap in enumerate(gaps)]
+    # country_booth[i]: tokens[i] is a country code followed by a booth
+    country_booth = [
+        index + 1 < count and _is_country(token) and tokens[index + 1][0] in layout.booth_chars
+        for index, token in enumerate(tokens)
+    ]
+    # city_end[i]: the country code ending the shortest city that starts at tokens[i]
+    city_end: list[int | None] = [None] * count
+    for index in range(count - 2, -1, -1):
+        if layout.city_chars.issuperset(tokens[index]):
+            if country_booth[index + 1]:
+                city_end[index] = index + 1
+            elif spaced[index + 1]:
+                city_end[index] = city_end[index + 1]
+    # row_end[i]: the country code of a row whose company ends with tokens[i]
+    row_end: list[int | None] = [None] * count
+    for index in range(count - 1):
+        following = index + 1
+        if city_end[following] is not None:
+            row_end[index] = city_end[following]
+        elif country_booth[following] and " " in gaps[following][1:-1]:
+            row_end[index] = following  # spaces alone can stand for the city
+    # company_end[i]: the first token from tokens[i] on that can end a company
+    company_end: list[int | None] = [None] * count
+    for index in range(count - 1, -1, -1):
+        if row_end[index] is not None:
+            company_end[index] = index
+        elif index + 1 < count and spaced[index + 1] and layout.company_chars.issuperset(tokens[index + 1]):
+            company_end[index] = company_end[index + 1]
+
+    index = 0
+    offset = 0  # characters of tokens[index] already taken by the previous booth
+    while index < count:
+        country = None
+        if not offset:
+            # A company of spaces only, when the whitespace before a row is wide enough
+            spaces = gaps[index]
+            first = spaces.find(" ")
+            if 0 <= first < len(spaces) - 1:
+                if city_end[index] is not None:
+                    name, country = "", city_end[index]
+                elif country_booth[index] and " " in spaces[first + 2:-1]:
+                    name, country = "", index
+        if country is None and company_end[index] is not None:
+            token = tokens[index]
+            # The company may start inside the token, after its last character that cannot be in a name
+            first = len(token)
+            while first > offset and token[first - 1] in layout.company_chars:
+                first -= 1
+            if first < len(token):
+                end = company_end[index]
+                name = text[starts[index] + first:starts[end] + len(tokens[end])]
+                country = row_end[end]
+        if country is None:
+            index, offset = index + 1, 0
+            continue
+        booth = tokens[country + 1]
+        length = 1
+        while length < len(booth) and booth[length] in layout.booth_chars:
+            length += 1
+        mapping[name.strip()] = booth[:length]
+        index, offset = country + 1, length
+        if offset == len(booth):
+            index, offset = index + 1, 0
+    return mapping
@@ -0,0 +1,91 @@
+"""
+text_normalizer.py – Whitespace collapsing and Unicode folding for scraped text.
+
+``TextNormalizer.normalize`` collapses every run of whitespace into a single
+space and (optionally) folds the text to ASCII in one translate pass. Folding
+transliterates instead of dropping characters: NFKD decomposition strips the
+accents ("Études" → "Etudes", "Kortrijk Xpo’s" → "Kortrijk Xpo's") and a small
+table covers letters that do not decompose ("ß" → "ss", "Ø" → "O"). Characters
+without an ASCII equivalent are removed.
+
+The translation table is filled lazily: the first time a code point is seen its
+replacement is computed and cached, so the per-character cost afterwards is a
+dict lookup inside ``str.translate``.
+
+``normalize_tree`` applies the normalizer to every string value of a JSON tree,
+replacing values in the existing dicts and lists instead of copying them.
+"""
+from __future__ import annotations
+
+import unicodedata
+from typing import Any
+
+# Letters and symbols that NFKD leaves alone but that have a common ASCII spelling
+EXTRA_FOLDS = {
+    "ß": "ss", "ẞ": "SS", "æ": "ae", "Æ": "AE", "œ": "oe", "Œ": "OE", "ø": "o", "Ø": "O",
+    "đ": "d", "Đ": "D", "ð": "d", "Ð": "D", "þ": "th", "Þ": "Th", "ł": "l", "Ł": "L", "ı": "i",
+    "‘": "'", "’": "'", "‚": "'", "‛": "'", "“": '"', "”": '"', "„": '"', "‟": '"',
+    "«": '"', "»": '"', "‹": "'", "›": "'", "–": "-", "—": "-", "‐": "-", "‑": "-", "−": "-",
+    "•": "-", "·": "-", "€": "EUR", "£": "GBP", "©": "(c)", "®": "(R)", "°": "",
+}
+
+
+class _FoldTable(dict):
+    """``str.translate`` table that computes and caches the ASCII fold of a code point."""
+
+    def __missing__(self, codepoint: int) -> str:
+        char = chr(codepoint)
+        if char.isspace():
+            folded = " "
+        elif char in EXTRA_FOLDS:
+            folded = EXTRA_FOLDS[char]
+        else:
+            decomposed = unicodedata.normalize("NFKD", char)
+            folded = "".join(
+                EXTRA_FOLDS.get(part, part) for part in decomposed if not unicodedata.combining(part)
+            )
+            if not folded.isascii():
+                folded = "".join(part for part in folded if part.isascii())
+        self[codepoint] = folded
+        return folded
+
+
+class TextNormalizer:
+    """Collapse whitespace and/or fold text to ASCII.
+
+    Args:
+        collapse: Collapse whitespace runs into one space and strip both ends.
+        fold: Transliterate to ASCII, removing what has no ASCII equivalent.
+    """
+
+    def __init__(self, collapse: bool = True, fold: bool = True):
+        self.collapse = collapse
+        self.fold = fold
+        self._table = _FoldTable((cp, chr(cp)) for cp in range(128))
+
+    def normalize(self, text: str) -> str:
+        if self.fold and not text.isascii():
+            text = text.translate(self._table)
+        if self.collapse:
+            return " ".join(text.split())
+        return text
+
+    __call__ = normalize
+
+    def normalize_tree(self, obj: Any) -> Any:
+        """Normalize every string value in ``obj``; dicts and lists are updated in place."""
+        if isinstance(obj, str):
+            return self.normalize(obj)
+        if isinstance(obj, dict):
+            for key, value in obj.items():
+                if isinstance(value, str):
+                    obj[key] = self.normalize(value)
+                elif isinstance(value, (dict, list)):
+                    self.normalize_tree(value)
+        elif isinstance(obj, list):
+            for index, value in enumerate(obj):
+                if isinstance(value, str):
+                    obj[index] = self.normalize(value)
+                elif isinstance(value, (dict, list)):
+                    self.normalize_tree(value)
+        return obj
@@ -0,0 +1,34 @@
+"""Page chunking in src.python.utils.chunker."""
+import os
+
+from src.python.utils.chunker import chunk_record
+
+os.environ.setdefault("UPLOAD_SERVICE_USERNAME", "test")
+os.environ.setdefault("UPLOAD_SERVICE_PASSWORD", "test")
+from src.dotnet.VectorEmbeddingService.vector_api_client import VectorApiClient  # noqa: E402
+
+
+def test_chunks_copy_only_uploaded_fields():
+    record = {
+        "url": "https://x/exhibitors", "title": "Exhibitors", "description": "All exhibitors",
+        "socialmedia_links": ["https://social/x"], "source_type": "html",
+        "raw_text_content": "Floorex shows parquet. " * 200,
+        "exhibitors": [{"name": f"Exhibitor {i}"} for i in range(1000)],
+        "stand_numbers": {f"Exhibitor {i}": str(i) for i in range(1000)},
+    }
+    chunks = list(chunk_record(record, max_tokens=256, overlap_tokens=32))
+    assert len(chunks) > 1
+    for index, chunk in enumerate(chunks):
+        assert "exhibitors" not in chunk and "stand_numbers" not in chunk
+        assert chunk["chunk_index"] == index and chunk["parent_url"] == record["url"]
+        # The uploaded document is the one the whole record would have given
+        expected = VectorApiClient._transform_event(dict(record, raw_text_content=chunk["raw_text_content"],
+                                                         parent_url=record["url"], chunk_index=index))
+        assert VectorApiClient._transform_event(chunk) == expected
+
+
+def test_short_page_is_one_chunk():
+    record = {"url": "https://x/", "title": "Home", "raw_text_content": "Welcome."}
+    assert list(chunk_record(record)) == [
+        {"url": "https://x/", "title": "Home", "raw_text_content": "Welcome.", "parent_url": "https://x/", "chunk_index": 0}
+    ]
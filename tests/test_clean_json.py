@@ -0,0 +1,13 @@
+"""Record cleaning in src.python.utils.clean_json."""
+from src.python.utils.clean_json import clean_record
+
+
+def test_stand_number_keys_are_folded_like_names():
+    record = clean_record({"exhibitors": [{"name": "Café  Müller"}], "stand_numbers": {"Café  Müller": "3"}})
+    assert record == {"exhibitors": [{"name": "Cafe Muller"}], "stand_numbers": {"Cafe Muller": "3"}}
+
+
+def test_stand_numbers_from_text_without_dom_mapping():
+    record = clean_record({"event_id": "ffd", "url": "https://x/exhibitors",
+                           "raw_text_content": "Floorex Booth: 12 Read more Tegel Booth: 8 Read more"})
+    assert record["stand_numbers"] == {"Floorex": "12", "Tegel": "8"}
@@ -0,0 +1,52 @@
+"""Delta feeds of src.python.utils.delta_feed across two runs."""
+import json
+import logging
+from types import SimpleNamespace
+
+from src.python.scraper.pipelines import StreamCleaningPipeline
+from src.python.utils.delta_feed import DeltaFeedWriter, content_hash, delta_paths
+
+
+def run(output, records, kept=()):
+    writer = DeltaFeedWriter(output)
+    for record in records:
+        writer.write(record)
+    for record in kept:
+        writer.keep(record)
+    writer.close()
+    return json.loads(delta_paths(output)["removed"].read_text(encoding="utf-8"))
+
+
+def test_near_duplicate_is_not_removed(tmp_path):
+    output = tmp_path / "ffd_cleaned.json"
+    first = [{"url": "https://x/a", "raw_text_content": "a"}, {"url": "https://x/b", "raw_text_content": "b"}]
+    assert run(output, first) == []
+    # https://x/b became a near-duplicate of https://x/a and was left out of the feed
+    assert run(output, first[:1], kept=[{"url": "https://x/b", "raw_text_content": "a"}]) == []
+    # It keeps the hash of what was last written, until it is gone from the site
+    assert run(output, first[:1]) == [{"event_id": "", "url": "https://x/b", "content_hash": content_hash("b")}]
+
+
+def test_crawl_closed_early_keeps_snapshot(tmp_path):
+    output = tmp_path / "ffd_cleaned.json"
+    pages = [{"url": "https://x/a", "raw_text_content": "a"}, {"url": "https://x/b", "raw_text_content": "b"}]
+    run(output, pages)
+    snapshot = delta_paths(output)["snapshot"].read_text(encoding="utf-8")
+    delta_paths(output)["removed"].unlink()
+
+    spider = SimpleNamespace(event_id="ffd", delta=True, logger=logging.getLogger("test"))
+    pipeline = StreamCleaningPipeline(str(output), indent=False)
+    pipeline.open_spider(spider)
+    pipeline.process_item(pages[0], spider)
+    pipeline.close_spider(spider)
+    pipeline.spider_closed(spider, "closespider_pagecount")
+    assert not delta_paths(output)["removed"].exists()
+    assert delta_paths(output)["snapshot"].read_text(encoding="utf-8") == snapshot
+
+    pipeline = StreamCleaningPipeline(str(output), indent=False)
+    pipeline.open_spider(spider)
+    pipeline.process_item(pages[0], spider)
+    pipeline.close_spider(spider)
+    pipeline.spider_closed(spider, "finished")
+    removed = json.loads(delta_paths(output)["removed"].read_text(encoding="utf-8"))
+    assert [entry["url"] for entry in removed] == ["https://x/b"]
@@ -0,0 +1,50 @@
+"""DOM extractors of src.python.scraper.extractors against fixed pages."""
+from pathlib import Path
+
+from parsel import Selector
+
+from src.python.scraper.extractors import registry
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def extract(event_id: str, url: str, html: str) -> dict:
+    # The spider passes the lxml root of the response's selector
+    return registry.extract(event_id, url, Selector(text=html).root)
+
+
+def test_ffd_fixture():
+    html = (FIXTURES / "ffd_exhibitors.html").read_text(encoding="utf-8")
+    assert extract("ffd", "https://www.flandersflooringdays.com/en/exhibitors", html) == {
+        "stand_numbers": {"Floorex": "12", "Parket & Co": "Showroom on location", "Tegel Atelier": "104"},
+    }
+
+
+def test_ffd_single_link_is_not_a_card():
+    html = "<h2>Programme</h2><p>Meet us at Booth: 12</p><div><a>Read more</a></div>"
+    assert extract("ffd", "https://www.flandersflooringdays.com/en/programme", html) == {}
+
+
+def test_ffd_needs_two_cards():
+    html = "<main><div><h3>Floorex</h3><p>Booth: 12</p><a>Read more</a></div></main>"
+    assert extract("ffd", "https://www.flandersflooringdays.com/en/exhibitors", html) == {}
+
+
+def test_ffd_cards_without_heading():
+    html = "<ul>" + "".join(f"<li>Floorex {i} Booth: {i} <a>Read more</a></li>" for i in range(3)) + "</ul>"
+    assert extract("ffd", "https://www.flandersflooringdays.com/en/exhibitors", html) == {}
+
+
+def test_artisan_rows():
+    html = (
+        '<div class="exposantenLijst_exposantjs">'
+        '<div class="exposantenLijst_exposantNaam">Floorex</div>'
+        '<div class="exposantenLijst_exposantStad">Kortrijk</div>'
+        '<div class="exposantenLijst_exposantLand">BE</div>'
+        '<div class="exposantenLijst_exposantPlaats">101</div>'
+        "</div>"
+    )
+    assert extract("artisan", "https://www.artisan-xpo.be/en/list-of-exhibitors", html) == {
+        "exhibitors": [{"name": "Floorex", "city": "Kortrijk", "country": "BE", "booth": "101"}],
+        "stand_numbers": {"Floorex": "101"},
+    }
@@ -0,0 +1,118 @@
+"""Fixed fixtures for src.python.utils.stand_parser.
+
+The expected mappings are what the Artisan/FFD regexes in clean_json returned
+before stand_parser replaced them, quirks included (benchmarks.bench_stand_parser
+keeps those regexes and checks the same on random pages).
+"""
+import time
+
+import pytest
+
+from src.python.utils import stand_parser
+from src.python.utils.stand_parser import CardLayout, TableLayout, parse_cards, parse_stand_numbers, parse_table
+
+ARTISAN_URL = "https://www.artisan-expo.be/en/list-of-exhibitors"
+FFD_URL = "https://www.ffd-expo.be/en/exhibitors"
+
+
+@pytest.mark.parametrize("text, expected", [
+    # The company is the shortest prefix that leaves only city words before the country code
+    ("Company City Country Booth Woodcraft NV 4 Lille FR 7 Floorex Sint Niklaas BE 5",
+     {"Woodcraft NV 4": "7", "Floorex": "5"}),
+    ("Company City Country Booth Parket & Co Gent BE 12", {"Parket &": "12"}),
+    ("Company City Country Booth Dr. Floor Gent FR 3b O'Brien Tiles Lille NL A12;A14",
+     {"Dr.": "3b", "O'Brien": "A12;A14"}),
+    # A company starts after the last character a name cannot hold; a booth ends at one
+    ("Company City Country Booth Müller Parket Gent DE 9 Vloer (BE) Kortrijk BE 12,",
+     {"ller": "9", "Vloer": "12"}),
+    # Columns may be separated by tabs and line breaks
+    ("Exhibitors\nCompany City Country Booth\nFloorex 1\tKortrijk\tBE\t101\nTegel Atelier 2\nGent\nBE\n102",
+     {"Floorex 1": "101", "Tegel Atelier 2": "102"}),
+    ("Company City Country Booth Floorex 1 Kortrijk be 12 Floorex 2 Gent BE -", {}),
+    ("No header here Floorex Gent BE 12", {}),
+])
+def test_table_rows(text, expected):
+    assert parse_table(text) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("View results Floorex 1 Booth: 12 Read more Parket & Co Showroom on location Read more",
+     {"Floorex 1": "12", "Parket & Co": "Showroom on location"}),
+    # The company is the line before the label; the number may be on the next line
+    ("View results\nFloorex Kortrijk\nBooth:\n42 Read more", {"Floorex Kortrijk": "42"}),
+    # A booth number wins over "Showroom on location"; a label without digits is no booth
+    ("Tegel Atelier Booth: 7 Showroom on location Read more Vinyl Masters Booth: A1 Read more",
+     {"Tegel Atelier": "7"}),
+    ("Carpet Studio Booth:12 Read more Woodcraft\tNV Booth: 3 Read more",
+     {"Carpet Studio": "12", "Woodcraft\tNV": "3"}),
+    ("Read more Read more Booth: 5 Read more", {}),
+])
+def test_cards(text, expected):
+    assert parse_cards(text) == expected
+
+
+def test_layout_per_event():
+    table = "Company City Country Booth Floorex 1 Gent BE 12"
+    cards = "Floorex 1 Booth: 12 Read more"
+    assert parse_stand_numbers("artisan", ARTISAN_URL, table) == {"Floorex 1": "12"}
+    # Other Artisan pages and other events use the card layout
+    assert parse_stand_numbers("artisan", "https://www.artisan-expo.be/en/exhibitor/1", table) == {}
+    assert parse_stand_numbers("ffd", FFD_URL, cards) == {"Floorex 1": "12"}
+    assert parse_stand_numbers("unknown", FFD_URL, cards) == {"Floorex 1": "12"}
+
+
+def test_registered_layout(monkeypatch):
+    layouts = [
+        ("newshow", "exposanten", TableLayout(header=("Bedrijf", "Stad", "Land", "Stand"))),
+        ("newshow", "", CardLayout(separator="Meer info", booth_label="Stand:")),
+    ] + stand_parser.STAND_LAYOUTS
+    monkeypatch.setattr(stand_parser, "STAND_LAYOUTS", layouts)
+    assert parse_stand_numbers("newshow", "https://x/exposanten", "Bedrijf Stad Land Stand Floorex Gent BE 12") == {
+        "Floorex": "12"}
+    assert parse_stand_numbers("newshow", "https://x/nieuws", "Floorex Stand: 7 Meer info Tegel Stand: 8") == {
+        "Floorex": "7", "Tegel": "8"}
+
+
+def test_very_large_pages():
+    rows = 50_000
+    table = "Company City Country Booth " + " ".join(f"Floorex {i} Sint Niklaas BE {i % 900 + 1}" for i in range(rows))
+    assert parse_table(table) == {f"Floorex {i}": str(i % 900 + 1) for i in range(rows)}
+    cards = " Read more ".join(f"Tegel Atelier {i} Booth: {i}" for i in range(rows))
+    assert parse_cards(cards) == {f"Tegel Atelier {i}": str(i) for i in range(rows)}
+
+
+@pytest.mark.parametrize("parse, text", [
+    # Rows that never complete and a single card without a label: exponential for the old regexes
+    (parse_table, "Company City Country Booth " + " ".join("Parket Kortrijk BE -" for _ in range(50_000))),
+    (parse_cards, " ".join(f"Floorex Booth {i} Showroom on" for i in range(50_000))),
+    (parse_cards, "x" + " " * 200_000 + "Booth: Booth:" * 50_000),
+])
+def test_adversarial_pages(parse, text):
+    start = time.perf_counter()
+    assert parse(text) == {}
+    assert time.perf_counter() - start < 5
+
+
+def test_table_regex_path(monkeypatch):
+    # Well-formed rows never reach the layout walk, fake booths in names included
+    def walk(text, layout):
+        raise AssertionError("layout walk used")
+    monkeypatch.setattr(stand_parser, "_walk_rows", walk)
+    assert parse_table("Company City Country Booth Woodcraft NV 29 Brugge BE 7 Floorex Sint Niklaas BE 5") == {
+        "Woodcraft NV 29": "7", "Floorex": "5"}
+
+
+@pytest.mark.parametrize("text, expected", [
+    # A row longer than MAX_ROW_CHARS
+    ("Company City Country Booth " + "Floorex " * 40 + "Gent BE 12", {"Floorex": "12"}),
+    # A booth of letters only leaves no safe cut
+    ("Company City Country Booth Floorex Gent BE ABC Tegel Lille FR 4", {"Floorex": "ABC", "Tegel": "4"}),
+    # Text after the last row that looks like a row end
+    ("Company City Country Booth Floorex Gent BE 12 -- BE 4", {"Floorex": "12"}),
+])
+def test_table_layout_walk(monkeypatch, text, expected):
+    walked = []
+    walk = stand_parser._walk_rows
+    monkeypatch.setattr(stand_parser, "_walk_rows", lambda text, layout: walked.append(text) or walk(text, layout))
+    assert parse_table(text) == expected
+    assert walked